@@ -0,0 +1,127 @@
+"""
+Busca de alunos por nome, sobrenome, RA ou e-mail.
+
+Cada aluno tem uma linha em AlunoBusca com o texto já normalizado
+(minúsculas, sem acentos). O índice sobre esse texto depende do banco:
+
+* SQLite: tabela virtual FTS5 com tokenizador de trigramas
+  (academico_aluno_busca_fts), sincronizada por triggers;
+* PostgreSQL: índice GIN com pg_trgm, usado pelo LIKE '%termo%';
+* outros bancos: LIKE sobre a coluna, sem índice.
+
+Termos com menos de 3 letras não formam trigramas e sempre caem no LIKE.
+O índice é criado pela migração 0004_alunobusca (o FTS5 com trigramas exige
+SQLite 3.34+) e o texto pode ser regravado com `manage.py reindexar_busca_alunos`.
+"""
+import unicodedata
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import Aluno, AlunoBusca
+
+TABELA_FTS = 'academico_aluno_busca_fts'
+TAMANHO_TRIGRAMA = 3
+LIMITE_PADRAO = 10
+
+# === Texto de busca ===
+
+def normalizar(texto):
+    """Minúsculas e sem acentos ('João' -> 'joao')."""
+    decomposto = unicodedata.normalize('NFKD', texto or '')
+    return ''.join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+
+def texto_busca(first_name, last_name, ra, email):
+    return normalizar(' '.join(filter(None, [first_name, last_name, ra, email])))
+
+
+def indexar_alunos(aluno_ids=None):
+    """
+    Grava (ou atualiza) o texto de busca dos alunos informados, ou de todos.
+    Retorna quantas linhas foram gravadas.
+    """
+    alunos = Aluno.objects.all()
+    if aluno_ids is not None:
+        alunos = alunos.filter(pk__in=aluno_ids)
+    linhas = [
+        AlunoBusca(aluno_id=pk, texto=texto_busca(first_name, last_name, ra, email))
+        for pk, first_name, last_name, ra, email in alunos.values_list(
+            'pk', 'user__first_name', 'user__last_name', 'RA_aluno', 'user__email'
+        )
+    ]
+    AlunoBusca.objects.bulk_create(
+        linhas, update_conflicts=True, unique_fields=['aluno'], update_fields=['texto']
+    )
+    return len(linhas)
+
+
+# === Consulta ===
+
+def _termos(q):
+    return normalizar(q).split()
+
+
+def _usa_fts(termos):
+    return connection.vendor == 'sqlite' and all(len(t) >= TAMANHO_TRIGRAMA for t in termos)
+
+
+def _expressao_fts(termos):
+    # Cada termo entre aspas (frase literal); todos precisam aparecer
+    return ' AND '.join('"%s"' % t.replace('"', '""') for t in termos)
+
+
+def condicao_busca(q, campo='pk'):
+    """
+    Q que restringe `campo` (pk do aluno ou FK para Aluno) aos alunos
+    encontrados por `q`. Pode ser combinada com outros filtros.
+    """
+    termos = _termos(q)
+    if not termos:
+        return Q()
+    if _usa_fts(termos):
+        ids = RawSQL(f"SELECT rowid FROM {TABELA_FTS} WHERE {TABELA_FTS} MATCH %s", [_expressao_fts(termos)])
+    else:
+        encontrados = AlunoBusca.objects.all()
+        for termo in termos:
+            encontrados = encontrados.filter(texto__contains=termo)
+        ids = encontrados.values('aluno_id')
+    return Q(**{f'{campo}__in': ids})
+
+
+def buscar_alunos(q, limite=LIMITE_PADRAO):
+    """
+    Até `limite` alunos encontrados por `q` (os primeiros do índice),
+    ordenados pelo nome, para autocompletar:
+    [{'id', 'nome', 'matricula', 'email'}, ...].
+    """
+    termos = _termos(q)
+    if not termos:
+        return []
+
+    if _usa_fts(termos):
+        # Limita dentro do índice antes de ler os alunos (sem ordenar por relevância:
+        # com termos comuns, calcular o rank de todas as ocorrências domina o tempo)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {TABELA_FTS} WHERE {TABELA_FTS} MATCH %s LIMIT %s",
+                [_expressao_fts(termos), limite]
+            )
+            ids = [linha[0] for linha in cursor.fetchall()]
+        alunos = Aluno.objects.filter(pk__in=ids)
+    else:
+        alunos = Aluno.objects.filter(condicao_busca(q))
+
+    linhas = alunos.order_by('user__first_name', 'user__last_name', 'pk').values(
+        'pk', 'user__first_name', 'user__last_name', 'RA_aluno', 'user__email'
+    )[:limite]
+    return [
+        {
+            'id': a['pk'],
+            'nome': f"{a['user__first_name']} {a['user__last_name']}".strip(),
+            'matricula': a['RA_aluno'],
+            'email': a['user__email'],
+        }
+        for a in linhas
+    ]
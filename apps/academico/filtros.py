@@ -0,0 +1,27 @@
+"""
+Filtros de busca compartilhados entre as telas e as APIs.
+"""
+from .busca import condicao_busca
+
+
+def _informado(valor, *ignorados):
+    return bool(valor) and valor != 'None' and valor not in ignorados
+
+
+def filtrar_alunos(queryset, busca=None, turma=None, status=None):
+    """
+    Aplica os filtros da gestão de alunos: busca por nome, RA ou e-mail
+    (índice de busca, ver apps/academico/busca.py), turma (id) e status da
+    matrícula. Valores vazios, 'None', 'todas' e 'todos' são ignorados,
+    como nos formulários das telas.
+    """
+    if _informado(busca):
+        queryset = queryset.filter(condicao_busca(busca))
+
+    if _informado(turma, 'todas') and turma.isdigit():
+        queryset = queryset.filter(turma_atual__id=turma)
+
+    if _informado(status, 'todos'):
+        queryset = queryset.filter(status_matricula=status)
+
+    return queryset
@@ -1,5 +1,6 @@
 from django import forms
-from django.forms import modelformset_factory
+from django.core.exceptions import ValidationError
+from django.forms import BaseModelFormSet, modelformset_factory
 from .models import Aluno, Historico, RegistroOcorrencia
 from django.contrib.auth.models import User
 
@@ -76,10 +77,41 @@ class DiarioClasseForm(forms.ModelForm):
             'total_faltas': forms.NumberInput(attrs={'class': 'form-control', 'min': 0}),
         }
 
+class _HistoricoCarregadoField(forms.ModelChoiceField):
+    """
+    Campo oculto de chave primária do diário. Resolve o id entre os
+    históricos que o formset já carregou, em vez de um SELECT por linha.
+    """
+    def __init__(self, historicos, *args, **kwargs):
+        self.historicos = historicos
+        super().__init__(*args, **kwargs)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            return self.historicos[int(value)]
+        except (KeyError, TypeError, ValueError):
+            raise ValidationError(self.error_messages['invalid_choice'], code='invalid_choice')
+
+
+class BaseDiarioClasseFormSet(BaseModelFormSet):
+    def add_fields(self, form, index):
+        super().add_fields(form, index)
+        if not hasattr(self, '_historicos_carregados'):
+            self._historicos_carregados = {h.pk: h for h in self.get_queryset()}
+        nome = self._pk_field.name
+        original = form.fields[nome]
+        form.fields[nome] = _HistoricoCarregadoField(
+            self._historicos_carregados, original.queryset,
+            initial=original.initial, required=False, widget=original.widget
+        )
+
 # Factory que cria o conjunto de formulários
 DiarioClasseFormSet = modelformset_factory(
     Historico,
     form=DiarioClasseForm,
+    formset=BaseDiarioClasseFormSet,
     extra=0,  # Não queremos linhas vazias extras, apenas os alunos existentes
     can_delete=False
 )
@@ -0,0 +1,59 @@
+"""
+Motor de cálculo de frequência e situação dos registros de histórico.
+
+Funções puras, sem acesso ao banco: recebem (nota, faltas, carga_horaria)
+e devolvem a frequência e a situação. São usadas pelo diário de classe,
+pelo recálculo em massa (manage.py recalcular_situacao_historico) e por
+qualquer importação que precise aplicar as mesmas regras.
+"""
+from typing import NamedTuple
+
+# === Regras do diário de classe ===
+FREQUENCIA_MINIMA = 75.0
+NOTA_APROVACAO = 6.0
+CARGA_HORARIA_PADRAO = 60  # Disciplinas sem carga horária cadastrada
+
+APROVADO = 'Aprovado'
+RECUPERACAO = 'Recuperação'
+REPROVADO_POR_FALTAS = 'Reprovado por Faltas'
+
+# === Faixas dos painéis da coordenação (DesempenhoService) ===
+MEDIA_BOA = 7.0
+FREQUENCIA_BOA = 85.0
+MEDIA_RISCO = 5.0
+FREQUENCIA_RISCO = FREQUENCIA_MINIMA
+
+
+class Resultado(NamedTuple):
+    frequencia: float
+    status: str
+
+
+def calcular_frequencia(faltas, carga_horaria):
+    """Frequência em % (sem arredondamento). Faltas nulas contam como zero."""
+    carga_horaria = carga_horaria or CARGA_HORARIA_PADRAO
+    return ((carga_horaria - (faltas or 0)) / carga_horaria) * 100
+
+
+def calcular_status(nota, frequencia):
+    """Situação do aluno na disciplina. Nota nula conta como zero."""
+    if frequencia < FREQUENCIA_MINIMA:
+        return REPROVADO_POR_FALTAS
+    if (nota or 0) >= NOTA_APROVACAO:
+        return APROVADO
+    return RECUPERACAO
+
+
+def calcular(nota, faltas, carga_horaria):
+    """Frequência (arredondada em uma casa) e situação de um registro."""
+    frequencia = calcular_frequencia(faltas, carga_horaria)
+    # A situação usa a frequência exata; só o valor gravado é arredondado
+    return Resultado(round(frequencia, 1), calcular_status(nota, frequencia))
+
+
+def calcular_lote(linhas):
+    """
+    Aplica `calcular` a uma sequência de tuplas (nota, faltas, carga_horaria).
+    Retorna a lista de Resultado na mesma ordem.
+    """
+    return [calcular(nota, faltas, carga_horaria) for nota, faltas, carga_horaria in linhas]
@@ -0,0 +1,250 @@
+import statistics
+import time
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from apps.academico.models import (
+    Aluno,
+    Coordenacao,
+    Curso,
+    Departamento,
+    Disciplina,
+    Historico,
+    Secretaria,
+    Turma,
+    TurmaDisciplinaProfessor,
+)
+from apps.payments.models import Pagamento
+from apps.relatorios.models import DocumentoEmitido, gerar_codigo_validacao
+from apps.usuarios.models import PendingRegistration, Profile
+from apps.usuarios.papeis import papeis_usuario
+
+# Índices criados pelas migrações *_indices_consultas (e os que os substituíram), por modelo
+PLANO_INDICES = {
+    Aluno: ['academico_aluno_status_idx'],
+    Turma: ['academico_turma_status_idx'],
+    Historico: ['academico_hist_periodo_idx'],
+    Pagamento: ['pagamento_aluno_status_idx', 'pagamento_status_valor_idx'],
+    PendingRegistration: ['usuarios_pendreg_status_idx'],
+    DocumentoEmitido: ['documento_aluno_idx', 'documento_recentes_idx'],
+}
+
+ALUNOS_POR_TURMA = 40
+DISCIPLINAS_POR_TURMA = 4
+PAGAMENTOS_POR_ALUNO = 3
+NOMES = ['Ana', 'Bruno', 'Carla', 'Diego', 'Eduarda', 'Felipe', 'Gabriela', 'Heitor', 'Isabela', 'João']
+
+
+class _Rollback(Exception):
+    """Usada para desfazer os dados sintéticos ao final do benchmark."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede as telas dos dashboards com e sem os índices das consultas acadêmicas '
+        '(migrações *_indices_consultas) sobre uma base sintética. Os dados e a '
+        'remoção temporária dos índices são desfeitos ao final.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--alunos',
+            type=int,
+            default=100000,
+            help='Número de alunos sintéticos (padrão: 100000)'
+        )
+        parser.add_argument(
+            '--repeticoes',
+            type=int,
+            default=5,
+            help='Requisições medidas por tela e cenário (padrão: 5)'
+        )
+
+    def handle(self, *args, **options):
+        self.repeticoes = options['repeticoes']
+        self.factory = RequestFactory()
+        # Só gera o SQL dos índices (CREATE INDEX), sem abrir o editor: no SQLite
+        # ele não pode ser usado dentro de uma transação
+        self.editor = connection.schema_editor()
+        indices = [
+            (model, index)
+            for model, nomes in PLANO_INDICES.items()
+            for index in model._meta.indexes if index.name in nomes
+        ]
+
+        try:
+            with transaction.atomic():
+                inicio = time.perf_counter()
+                self._popular(options['alunos'])
+                self.stdout.write(f'Base sintética criada em {time.perf_counter() - inicio:.1f}s')
+
+                self._executar(f'DROP INDEX {connection.ops.quote_name(index.name)}' for _, index in indices)
+                sem_indices = self._medir_telas()
+                self._executar(index.create_sql(model, self.editor) for model, index in indices)
+                com_indices = self._medir_telas()
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+        # Tempo total da tela e, dele, o gasto nas consultas (o que os índices afetam)
+        self.stdout.write(
+            f'{"tela":<22} | {"total sem (ms)":>14} | {"total com (ms)":>14} | '
+            f'{"banco sem (ms)":>14} | {"banco com (ms)":>14} | {"ganho banco":>11}'
+        )
+        self.stdout.write('-' * 104)
+        for tela, (total_antes, banco_antes) in sem_indices.items():
+            total_depois, banco_depois = com_indices[tela]
+            ganho = banco_antes / banco_depois if banco_depois else 0
+            self.stdout.write(
+                f'{tela:<22} | {total_antes:>14.2f} | {total_depois:>14.2f} | '
+                f'{banco_antes:>14.2f} | {banco_depois:>14.2f} | {ganho:>10.1f}x'
+            )
+
+        self.stdout.write(self.style.SUCCESS('✓ Benchmark concluído (dados sintéticos descartados)'))
+
+    def _executar(self, comandos):
+        with connection.cursor() as cursor:
+            for sql in comandos:
+                cursor.execute(str(sql))
+
+    # === Base sintética ===
+
+    def _popular(self, num_alunos):
+        departamento = Departamento.objects.create(nome_departamento='Benchmark', cod_departamento='BENCH')
+        curso = Curso.objects.create(
+            cod_curso='BENCH', nome_curso='Curso Benchmark', carga_horaria_total=1600,
+            modalidade='Presencial', turno='Noturno', tipo='Técnico', cod_departamento=departamento
+        )
+        disciplinas = Disciplina.objects.bulk_create([
+            Disciplina(cod_disciplina=f'BENCH{i}', nome=f'Disciplina Benchmark {i}', carga_horaria=60)
+            for i in range(DISCIPLINAS_POR_TURMA)
+        ])
+
+        # 5% das turmas aguardando aprovação
+        num_turmas = max(1, num_alunos // ALUNOS_POR_TURMA)
+        turmas = Turma.objects.bulk_create([
+            Turma(
+                nome=f'BENCH {i:05d}', periodo='Noturno', ano_letivo=2025,
+                data_inicio=date(2025, 1 + i % 12, 1), id_curso=curso,
+                status_aprovacao='Pendente' if i % 20 == 0 else 'Aprovada'
+            )
+            for i in range(num_turmas)
+        ], batch_size=2000)
+        alocacoes = TurmaDisciplinaProfessor.objects.bulk_create([
+            TurmaDisciplinaProfessor(turma=turma, disciplina=disciplina)
+            for turma in turmas for disciplina in disciplinas
+        ], batch_size=2000)
+
+        usuarios = User.objects.bulk_create([
+            User(username=f'bench_aluno_{i:07d}', first_name=NOMES[i % len(NOMES)], last_name=f'Bench {i}', password='!')
+            for i in range(num_alunos)
+        ], batch_size=2000)
+        # 85% ativos, 10% trancados, 5% cancelados
+        status = ['Ativo'] * 17 + ['Trancado'] * 2 + ['Cancelado']
+        alunos = Aluno.objects.bulk_create([
+            Aluno(
+                user=user, RA_aluno=f'BENCH{i:07d}', status_matricula=status[i % len(status)],
+                turma_atual=turmas[i % num_turmas]
+            )
+            for i, user in enumerate(usuarios)
+        ], batch_size=2000)
+
+        # Dois períodos por aluno, com todas as disciplinas da turma em cada um
+        historicos = []
+        for i, aluno in enumerate(alunos):
+            base = (i % num_turmas) * DISCIPLINAS_POR_TURMA
+            for j in range(DISCIPLINAS_POR_TURMA):
+                historicos.append(Historico(
+                    id_aluno=aluno, turma_disciplina_professor=alocacoes[base + j],
+                    nota_final=5 + (i + j) % 5, media_final=5 + (i + j) % 5, frequencia_percentual=90.0,
+                    total_faltas=j, status_aprovacao='Aprovado', periodo_realizacao=f'2025.{1 + j % 2}'
+                ))
+        Historico.objects.bulk_create(historicos, batch_size=5000)
+
+        Pagamento.objects.bulk_create([
+            Pagamento(
+                aluno=user, descricao=f'Mensalidade {m + 1}', valor=Decimal('450.00'),
+                status='pendente' if (i + m) % 6 == 0 else 'pago'
+            )
+            for i, user in enumerate(usuarios) for m in range(PAGAMENTOS_POR_ALUNO)
+        ], batch_size=5000)
+        DocumentoEmitido.objects.bulk_create([
+            DocumentoEmitido(
+                aluno=aluno, solicitante=aluno.user, tipo='DECLARACAO',
+                codigo_validacao=gerar_codigo_validacao(), status='concluido'
+            )
+            for aluno in alunos
+        ], batch_size=5000)
+
+        # Uma solicitação de cadastro a cada 10 alunos; 5% delas pendentes
+        PendingRegistration.objects.bulk_create([
+            PendingRegistration(
+                primeiro_nome=NOMES[i % len(NOMES)], sobrenome=f'Bench {i}',
+                email=f'bench_cadastro_{i}@example.com', username=f'bench_cadastro_{i:07d}',
+                tipo_solicitado='aluno', status='pendente' if i % 20 == 0 else 'aprovado'
+            )
+            for i in range(max(1, num_alunos // 10))
+        ], batch_size=5000)
+
+        secretaria = User.objects.create(username='bench_secretaria', password='!')
+        Secretaria.objects.create(user=secretaria)
+        coordenacao = User.objects.create(username='bench_coordenacao', password='!')
+        Coordenacao.objects.create(user=coordenacao)
+
+        aluno = usuarios[0]
+        # O papel de acesso vem do perfil (apps/usuarios/papeis.py)
+        Profile.objects.bulk_create([
+            Profile(user=secretaria, tipo='secretaria'),
+            Profile(user=coordenacao, tipo='coordenacao'),
+            Profile(user=aluno, tipo='aluno'),
+        ])
+        self.telas = [
+            ('secretaria_dashboard', secretaria, reverse('secretaria_dashboard')),
+            ('coordenacao_dashboard', coordenacao, reverse('coordenacao_dashboard')),
+            ('coordenacao_aprovacao', coordenacao, reverse('coordenacao_aprovacao')),
+            ('gestao_alunos', secretaria, f"{reverse('gestao_alunos')}?status=Trancado&turma={turmas[0].pk}"),
+            ('aluno_dashboard', aluno, reverse('aluno_dashboard')),
+            ('aluno_financeiro', aluno, reverse('aluno_financeiro')),
+            ('boletim', aluno, reverse('boletim')),
+        ]
+
+    # === Medição ===
+
+    def _requisicao(self, user, url):
+        request = self.factory.get(url)
+        request.user = user
+        request.roles = papeis_usuario(user)
+        return request
+
+    def _medir_telas(self):
+        """Medianas, em ms, do tempo total e do tempo em consultas de cada tela."""
+        medianas = {}
+        for nome, user, url in self.telas:
+            match = resolve(url.split('?')[0])
+            # Requisição de aquecimento
+            match.func(self._requisicao(user, url), *match.args, **match.kwargs)
+
+            totais, bancos = [], []
+            for _ in range(self.repeticoes):
+                request = self._requisicao(user, url)
+                self.tempo_banco = 0.0
+                with connection.execute_wrapper(self._cronometrar_consulta):
+                    inicio = time.perf_counter()
+                    match.func(request, *match.args, **match.kwargs)
+                    totais.append((time.perf_counter() - inicio) * 1000)
+                bancos.append(self.tempo_banco * 1000)
+            medianas[nome] = (statistics.median(totais), statistics.median(bancos))
+        return medianas
+
+    def _cronometrar_consulta(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.tempo_banco += time.perf_counter() - inicio
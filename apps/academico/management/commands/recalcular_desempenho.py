@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.academico.services import DesempenhoService
+
+
+class Command(BaseCommand):
+    help = 'Reconstrói a tabela de desempenho pré-calculado (DesempenhoAluno) a partir do Historico.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=2000,
+            help='Quantidade de alunos por lote (padrão: 2000)'
+        )
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        total = DesempenhoService.recalcular_todos(tamanho_lote=options['lote'])
+        duracao = time.perf_counter() - inicio
+        self.stdout.write(self.style.SUCCESS(f'✓ {total} resumos de desempenho atualizados em {duracao:.1f}s'))
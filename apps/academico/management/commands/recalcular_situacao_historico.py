@@ -0,0 +1,87 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.academico import grading
+from apps.academico.models import Historico
+from apps.academico.services import DesempenhoService
+
+
+class Command(BaseCommand):
+    help = (
+        'Recalcula frequencia_percentual e status_aprovacao de todo o Historico com as regras '
+        'do diário de classe (apps.academico.grading), em lotes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=5000,
+            help='Quantidade de registros por lote (padrão: 5000)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas conta quantos registros mudariam, sem gravar'
+        )
+
+    def handle(self, *args, **options):
+        tamanho_lote = options['lote']
+        dry_run = options['dry_run']
+
+        # Registros ainda sem lançamento (nota e faltas nulas) ficam como estão
+        historicos = Historico.objects.exclude(nota_final__isnull=True, total_faltas__isnull=True)
+        total = historicos.count()
+        self.stdout.write(f'{total} registros de histórico para verificar')
+
+        inicio = time.perf_counter()
+        ultimo_pk = 0
+        lidos = alterados = 0
+        while True:
+            # Paginação por chave (pk > último): custo constante por lote
+            linhas = list(
+                historicos.filter(pk__gt=ultimo_pk).order_by('pk').values(
+                    'pk', 'id_aluno_id', 'nota_final', 'total_faltas', 'frequencia_percentual',
+                    'status_aprovacao', 'turma_disciplina_professor__disciplina__carga_horaria'
+                )[:tamanho_lote]
+            )
+            if not linhas:
+                break
+            ultimo_pk = linhas[-1]['pk']
+            lidos += len(linhas)
+
+            resultados = grading.calcular_lote(
+                (l['nota_final'], l['total_faltas'], l['turma_disciplina_professor__disciplina__carga_horaria'])
+                for l in linhas
+            )
+            agora = timezone.now()
+            mudancas = [
+                Historico(
+                    pk=l['pk'], id_aluno_id=l['id_aluno_id'], frequencia_percentual=r.frequencia,
+                    status_aprovacao=r.status, data_lancamento=agora
+                )
+                for l, r in zip(linhas, resultados)
+                if (l['frequencia_percentual'], l['status_aprovacao']) != (r.frequencia, r.status)
+            ]
+            alterados += len(mudancas)
+
+            if mudancas and not dry_run:
+                with transaction.atomic():
+                    Historico.objects.bulk_update(
+                        mudancas, ['frequencia_percentual', 'status_aprovacao', 'data_lancamento']
+                    )
+                    # A frequência média do resumo dos painéis também muda
+                    DesempenhoService.recalcular([h.id_aluno_id for h in mudancas])
+
+            duracao = time.perf_counter() - inicio
+            self.stdout.write(
+                f'  {lidos}/{total} ({lidos / total:.0%}) · {alterados} alterados · '
+                f'{lidos / duracao if duracao > 0 else 0:.0f} registros/s'
+            )
+
+        duracao = time.perf_counter() - inicio
+        acao = 'seriam alterados' if dry_run else 'atualizados'
+        self.stdout.write(self.style.SUCCESS(f'✓ {alterados} de {lidos} registros {acao} em {duracao:.1f}s'))
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.academico.busca import TABELA_FTS, indexar_alunos
+from apps.academico.models import Aluno, AlunoBusca
+
+
+class Command(BaseCommand):
+    help = 'Regrava o texto de busca de todos os alunos (AlunoBusca) e reconstrói o índice de texto.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=5000,
+            help='Quantidade de alunos por lote (padrão: 5000)'
+        )
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        tamanho_lote = options['lote']
+        ids = list(Aluno.objects.order_by('pk').values_list('pk', flat=True))
+
+        total = 0
+        for pos in range(0, len(ids), tamanho_lote):
+            with transaction.atomic():
+                total += indexar_alunos(ids[pos:pos + tamanho_lote])
+            self.stdout.write(f'  {min(pos + tamanho_lote, len(ids))}/{len(ids)}')
+
+        # Linhas de alunos que não existem mais (ex.: removidos com SQL direto)
+        AlunoBusca.objects.exclude(aluno_id__in=Aluno.objects.values('pk')).delete()
+
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {TABELA_FTS}({TABELA_FTS}) VALUES ('rebuild')")
+                cursor.execute(f"INSERT INTO {TABELA_FTS}({TABELA_FTS}) VALUES ('optimize')")
+
+        duracao = time.perf_counter() - inicio
+        self.stdout.write(self.style.SUCCESS(f'✓ {total} alunos indexados em {duracao:.1f}s'))
@@ -1,7 +1,8 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from django.db import transaction
+from django.utils import timezone
 from faker import Faker
 from datetime import date, datetime, timedelta
 import random
@@ -24,15 +25,63 @@ from apps.academico.models import (
     RegistroOcorrencia,
 )
 
+from apps.academico.busca import indexar_alunos
+from apps.academico.services import DesempenhoService
+from apps.dashboards.estatisticas import invalidar_estatisticas
 from apps.usuarios.models import Profile
 
+# (código, nome, carga horária, modalidade, turno, índice do departamento)
+CURSOS = [
+    ('TADS', 'Técnico em Desenvolvimento de Sistemas', 1600, 'Técnico', 'Manhã', 0),
+    ('REDES', 'Técnico em Redes de Computadores', 1200, 'Técnico', 'Tarde', 0),
+    ('AUTO', 'Técnico em Automação Industrial', 1600, 'Técnico', 'Manhã', 1),
+    ('MECA', 'Técnico em Mecatrônica', 1600, 'Técnico', 'Tarde', 1),
+    ('LOG', 'Técnico em Logística', 1200, 'Técnico', 'Noite', 3)
+]
+
+# (código, nome, carga horária, status curricular)
+DISCIPLINAS = [
+    ('DISC001', 'Lógica de Programação', 60, 'Obrigatória'),
+    ('DISC002', 'Programação em Python', 80, 'Obrigatória'),
+    ('DISC003', 'Desenvolvimento Web Django', 120, 'Obrigatória'),
+    ('DISC004', 'Banco de Dados SQL', 100, 'Obrigatória'),
+    ('DISC005', 'Programação Orientada a Objetos', 80, 'Obrigatória'),
+    ('DISC006', 'Fundamentos de Redes', 60, 'Obrigatória'),
+    ('DISC007', 'Administração Linux', 80, 'Obrigatória'),
+    ('DISC008', 'Segurança da Informação', 60, 'Obrigatória'),
+    ('DISC009', 'Controladores Lógicos', 100, 'Obrigatória'),
+    ('DISC010', 'Instrumentação Industrial', 80, 'Obrigatória'),
+    ('DISC011', 'Redes Industriais', 60, 'Obrigatória'),
+    ('DISC012', 'Eletrônica Analógica', 80, 'Obrigatória'),
+    ('DISC013', 'Sistemas Hidráulicos', 60, 'Obrigatória'),
+    ('DISC014', 'Robótica Industrial', 100, 'Obrigatória'),
+    ('DISC015', 'Gestão de Estoques', 60, 'Obrigatória'),
+    ('DISC016', 'Transporte e Distribuição', 60, 'Obrigatória'),
+    ('DISC017', 'Supply Chain Management', 80, 'Obrigatória'),
+    ('DISC018', 'Inglês Técnico', 40, 'Obrigatória'),
+    ('DISC019', 'Segurança do Trabalho', 40, 'Obrigatória'),
+    ('DISC020', 'Empreendedorismo', 40, 'Optativa')
+]
+
+# Opções de volume do modo --bulk
+OPCOES_VOLUME = ('cursos', 'turmas', 'disciplinas', 'historico')
+ALUNOS_POR_TURMA = 40
+DISCIPLINAS_POR_CURSO = 6
+HISTORICO_PADRAO = 4
+
+STATUS_HISTORICO = ['Aprovado', 'Aprovado', 'Aprovado', 'Reprovado', 'Cursando']
+COMPLEMENTOS = ['', 'Apto 101', 'Apto 202', 'Casa', 'Bloco A', 'Fundos', 'Casa 2']
+PARENTESCOS = ['Pai', 'Mãe', 'Avô', 'Avó', 'Tio', 'Tia']
+TIPOS_OCORRENCIA = ['Advertência Verbal', 'Advertência Escrita', 'Suspensão', 'Elogio', 'Atraso']
+STATUS_OCORRENCIA = ['Pendente', 'Em Análise', 'Resolvida']
+
 class Command(BaseCommand):
     help = 'Popula o banco SQLite do SENAI School Manager com dados dinâmicos e consistentes.'
 
     def __init__(self):
         super().__init__()
         self.fake = Faker('pt_BR')
-        Faker.seed(42)
+        self.hashes_senha = {}
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -46,10 +95,54 @@ class Command(BaseCommand):
             action='store_true',
             help='Limpar banco antes de popular'
         )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Semente do Faker e do random: a mesma semente gera os mesmos dados (padrão: 42)'
+        )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Modo em massa: bulk_create em lotes, para bases de teste de carga (100 mil alunos ou mais)'
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=2000,
+            help='Alunos por lote no modo --bulk (padrão: 2000)'
+        )
+        parser.add_argument(
+            '--cursos',
+            type=int,
+            help=f'Número de cursos (modo --bulk; padrão: {len(CURSOS)})'
+        )
+        parser.add_argument(
+            '--turmas',
+            type=int,
+            help=f'Número de turmas (modo --bulk; padrão: uma a cada {ALUNOS_POR_TURMA} alunos)'
+        )
+        parser.add_argument(
+            '--disciplinas',
+            type=int,
+            help=f'Número de disciplinas (modo --bulk; padrão: {len(DISCIPLINAS)})'
+        )
+        parser.add_argument(
+            '--historico',
+            type=int,
+            help=f'Disciplinas cursadas por aluno no histórico (modo --bulk; padrão: {HISTORICO_PADRAO})'
+        )
 
     @transaction.atomic
     def handle(self, *args, **options):
         num_alunos = options['alunos']
+        informadas = [f'--{opcao}' for opcao in OPCOES_VOLUME if options[opcao] is not None]
+        if informadas and not options['bulk']:
+            raise CommandError(f'{", ".join(informadas)} só vale(m) com --bulk')
+
+        self.semente = options['seed']
+        Faker.seed(self.semente)
+        random.seed(self.semente)
 
         self.stdout.write(self.style.WARNING('=' * 70))
         self.stdout.write(self.style.WARNING('🚀 SENAI School Manager - Script de População'))
@@ -58,6 +151,11 @@ class Command(BaseCommand):
         if options['clear']:
             self.limpar_banco()
 
+        if options['bulk']:
+            self.popular_em_massa(num_alunos, options)
+            self.exibir_resumo()
+            return
+
         self.stdout.write(f'\n📊 Configuração: {num_alunos} alunos\n')
 
         enderecos = self.criar_enderecos(num_alunos + 70)
@@ -77,6 +175,52 @@ class Command(BaseCommand):
 
         self.exibir_resumo()
 
+    def hash_senha(self, senha):
+        # make_password é lento de propósito: um hash por senha, compartilhado pelos usuários
+        if senha not in self.hashes_senha:
+            self.hashes_senha[senha] = make_password(senha)
+        return self.hashes_senha[senha]
+
+    def fluxo(self, nome):
+        """
+        Faker e Random próprios de uma etapa, derivados da semente: os dados de
+        uma etapa não mudam quando o volume de outra muda.
+        """
+        fake = Faker('pt_BR')
+        fake.seed_instance(f'{self.semente}:{nome}')
+        return fake, random.Random(f'{self.semente}:{nome}')
+
+    def montar_endereco(self, fake, rng):
+        return Endereco(
+            cep=fake.postcode().replace('-', ''),
+            logradouro=fake.street_name(),
+            numero=str(fake.building_number()),
+            complemento=rng.choice(COMPLEMENTOS),
+            bairro=fake.bairro(),
+            cidade=fake.city(),
+            estado=fake.estado_sigla()
+        )
+
+    def gerar_resultado(self, rng, carga_horaria):
+        """Nota, frequência, faltas e status de uma disciplina cursada."""
+        status = rng.choice(STATUS_HISTORICO)
+        if status == 'Aprovado':
+            nota = round(rng.uniform(6.0, 10.0), 2)
+            freq = round(rng.uniform(75.0, 100.0), 2)
+        elif status == 'Reprovado':
+            nota = round(rng.uniform(0.0, 5.9), 2)
+            freq = round(rng.uniform(40.0, 74.9), 2)
+        else:
+            nota = None
+            freq = round(rng.uniform(70.0, 100.0), 2)
+        return {
+            'nota_final': nota,
+            'media_final': nota,
+            'frequencia_percentual': freq,
+            'total_faltas': int((100 - freq) * carga_horaria / 100),
+            'status_aprovacao': status,
+        }
+
     def limpar_banco(self):
         self.stdout.write('\n🗑️  Limpando banco de dados...')
 
@@ -103,17 +247,9 @@ class Command(BaseCommand):
     def criar_enderecos(self, quantidade):
         self.stdout.write(f'📍 Criando {quantidade} endereços...')
         enderecos = []
-        complementos = ['', 'Apto 101', 'Apto 202', 'Casa', 'Bloco A', 'Fundos', 'Casa 2']
         for _ in range(quantidade):
-            endereco = Endereco.objects.create(
-                cep=self.fake.postcode().replace('-', ''),
-                logradouro=self.fake.street_name(),
-                numero=str(self.fake.building_number()),
-                complemento=random.choice(complementos),
-                bairro=self.fake.bairro(),
-                cidade=self.fake.city(),
-                estado=self.fake.estado_sigla()
-            )
+            endereco = self.montar_endereco(self.fake, random)
+            endereco.save()
             enderecos.append(endereco)
         self.stdout.write(self.style.SUCCESS(f'  ✓ {len(enderecos)} endereços criados'))
         return enderecos
@@ -133,7 +269,7 @@ class Command(BaseCommand):
                 first_name=nome,
                 last_name=sobrenome,
                 email=f'{username}@senai.br',
-                password=make_password('coordenador'),
+                password=self.hash_senha('coordenador'),
                 is_active=True,
                 is_staff=True,
                 is_superuser=False,
@@ -198,7 +334,7 @@ class Command(BaseCommand):
                 first_name=nome,
                 last_name=sobrenome,
                 email=f'{username}@senai.br',
-                password=make_password('secretaria'),
+                password=self.hash_senha('secretaria'),
                 is_active=True,
                 is_staff=True,
                 is_superuser=False,
@@ -249,7 +385,7 @@ class Command(BaseCommand):
                 first_name=nome,
                 last_name=sobrenome,
                 email=f'{username}@senai.br',
-                password=make_password('professor'),
+                password=self.hash_senha('professor'),
                 is_active=True,
                 is_staff=False,
                 is_superuser=False,
@@ -283,15 +419,9 @@ class Command(BaseCommand):
 
     def criar_cursos(self, departamentos):
         self.stdout.write('\n🎓 Criando cursos...')
-        cursos_data = [
-            ('TADS', 'Técnico em Desenvolvimento de Sistemas', 1600, 'Técnico', 'Manhã', departamentos[0]),
-            ('REDES', 'Técnico em Redes de Computadores', 1200, 'Técnico', 'Tarde', departamentos[0]),
-            ('AUTO', 'Técnico em Automação Industrial', 1600, 'Técnico', 'Manhã', departamentos[1]),
-            ('MECA', 'Técnico em Mecatrônica', 1600, 'Técnico', 'Tarde', departamentos[1]),
-            ('LOG', 'Técnico em Logística', 1200, 'Técnico', 'Noite', departamentos[3])
-        ]
         cursos = []
-        for cod, nome, carga, modalidade, turno, dept in cursos_data:
+        for cod, nome, carga, modalidade, turno, idx_dept in CURSOS:
+            dept = departamentos[idx_dept]
             curso = Curso.objects.create(
                 cod_curso=cod,
                 nome_curso=nome,
@@ -310,30 +440,8 @@ class Command(BaseCommand):
 
     def criar_disciplinas(self):
         self.stdout.write('\n📚 Criando disciplinas...')
-        disciplinas_data = [
-            ('DISC001', 'Lógica de Programação', 60, 'Obrigatória'),
-            ('DISC002', 'Programação em Python', 80, 'Obrigatória'),
-            ('DISC003', 'Desenvolvimento Web Django', 120, 'Obrigatória'),
-            ('DISC004', 'Banco de Dados SQL', 100, 'Obrigatória'),
-            ('DISC005', 'Programação Orientada a Objetos', 80, 'Obrigatória'),
-            ('DISC006', 'Fundamentos de Redes', 60, 'Obrigatória'),
-            ('DISC007', 'Administração Linux', 80, 'Obrigatória'),
-            ('DISC008', 'Segurança da Informação', 60, 'Obrigatória'),
-            ('DISC009', 'Controladores Lógicos', 100, 'Obrigatória'),
-            ('DISC010', 'Instrumentação Industrial', 80, 'Obrigatória'),
-            ('DISC011', 'Redes Industriais', 60, 'Obrigatória'),
-            ('DISC012', 'Eletrônica Analógica', 80, 'Obrigatória'),
-            ('DISC013', 'Sistemas Hidráulicos', 60, 'Obrigatória'),
-            ('DISC014', 'Robótica Industrial', 100, 'Obrigatória'),
-            ('DISC015', 'Gestão de Estoques', 60, 'Obrigatória'),
-            ('DISC016', 'Transporte e Distribuição', 60, 'Obrigatória'),
-            ('DISC017', 'Supply Chain Management', 80, 'Obrigatória'),
-            ('DISC018', 'Inglês Técnico', 40, 'Obrigatória'),
-            ('DISC019', 'Segurança do Trabalho', 40, 'Obrigatória'),
-            ('DISC020', 'Empreendedorismo', 40, 'Optativa')
-        ]
         disciplinas = []
-        for cod, nome, carga, status in disciplinas_data:
+        for cod, nome, carga, status in DISCIPLINAS:
             disc = Disciplina.objects.create(
                 cod_disciplina=cod,
                 nome=nome,
@@ -433,7 +541,6 @@ class Command(BaseCommand):
         self.stdout.write('\n👨‍👩‍👧 Criando responsáveis e telefones...')
         telefones_lista = []
         responsaveis = []
-        parentescos = ['Pai', 'Mãe', 'Avô', 'Avó', 'Tio', 'Tia']
         for i, endereco in enumerate(enderecos):
             telefones_resp = []
             for j in range(random.randint(1, 2)):
@@ -447,7 +554,7 @@ class Command(BaseCommand):
             resp = Responsavel.objects.create(
                 cpf=f"{i+10000:011d}",
                 nome_completo_responsavel=self.fake.name(),
-                parentesco=random.choice(parentescos),
+                parentesco=random.choice(PARENTESCOS),
                 contato_principal=telefones_resp[0].num_telefone if telefones_resp else None,
                 responsavel_financeiro=random.choice([True, False]),
                 cod_endereco=endereco
@@ -479,7 +586,7 @@ class Command(BaseCommand):
                     first_name=nome,
                     last_name=sobrenome,
                     email=f'{username}@aluno.senai.br',
-                    password=make_password('aluno'),
+                    password=self.hash_senha('aluno'),
                     is_active=True,
                     is_staff=False,
                     is_superuser=False,
@@ -522,7 +629,6 @@ class Command(BaseCommand):
     def criar_historicos(self, alunos):
         self.stdout.write('\n📊 Criando históricos escolares...')
         historicos = 0
-        status_options = ['Aprovado', 'Aprovado', 'Aprovado', 'Reprovado', 'Cursando']
         for aluno in alunos:
             if not aluno.turma_atual:
                 continue
@@ -534,39 +640,19 @@ class Command(BaseCommand):
                 continue
             alocacoes_aluno = random.sample(list(alocacoes), num_disciplinas)
             for alocacao in alocacoes_aluno:
-                status = random.choice(status_options)
-                if status == 'Aprovado':
-                    nota = round(random.uniform(6.0, 10.0), 2)
-                    freq = round(random.uniform(75.0, 100.0), 2)
-                    media = nota
-                    faltas = int((100 - freq) * alocacao.disciplina.carga_horaria / 100)
-                elif status == 'Reprovado':
-                    nota = round(random.uniform(0.0, 5.9), 2)
-                    freq = round(random.uniform(40.0, 74.9), 2)
-                    media = nota
-                    faltas = int((100 - freq) * alocacao.disciplina.carga_horaria / 100)
-                else:
-                    nota = None
-                    media = None
-                    freq = round(random.uniform(70.0, 100.0), 2)
-                    faltas = int((100 - freq) * alocacao.disciplina.carga_horaria / 100)
                 Historico.objects.create(
                     id_aluno=aluno,
                     turma_disciplina_professor=alocacao,
-                    nota_final=nota,
-                    media_final=media,
-                    frequencia_percentual=freq,
-                    total_faltas=faltas,
-                    status_aprovacao=status,
-                    periodo_realizacao=f'{aluno.turma_atual.ano_letivo}/{aluno.turma_atual.periodo}'
+                    periodo_realizacao=f'{aluno.turma_atual.ano_letivo}/{aluno.turma_atual.periodo}',
+                    **self.gerar_resultado(random, alocacao.disciplina.carga_horaria)
                 )
                 historicos += 1
         self.stdout.write(self.style.SUCCESS(f'  ✓ {historicos} históricos criados'))
+        resumos = DesempenhoService.recalcular_todos()
+        self.stdout.write(self.style.SUCCESS(f'  ✓ {resumos} resumos de desempenho calculados'))
 
     def criar_ocorrencias(self, alunos, professores, coordenadores, turmas):
         self.stdout.write('\n⚠️  Criando ocorrências...')
-        tipos = ['Advertência Verbal', 'Advertência Escrita', 'Suspensão', 'Elogio', 'Atraso']
-        status = ['Pendente', 'Em Análise', 'Resolvida']
         num_ocorrencias = int(len(alunos) * 0.15)
         if num_ocorrencias == 0:
             self.stdout.write(self.style.SUCCESS('  ✓ 0 ocorrências criadas'))
@@ -580,13 +666,299 @@ class Command(BaseCommand):
                     professor=random.choice(professores),
                     turma=aluno.turma_atual,
                     coordenacao_revisou=random.choice(coordenadores) if random.random() > 0.5 else None,
-                    tipo_ocorrencia=random.choice(tipos),
+                    tipo_ocorrencia=random.choice(TIPOS_OCORRENCIA),
                     descricao=self.fake.text(max_nb_chars=200),
-                    status_intervencao=random.choice(status)
+                    status_intervencao=random.choice(STATUS_OCORRENCIA)
                 )
                 ocorrencias += 1
         self.stdout.write(self.style.SUCCESS(f'  ✓ {ocorrencias} ocorrências criadas'))
 
+    # =========================================================================
+    # Modo --bulk: bulk_create em lotes, com um Faker/Random por etapa
+    # =========================================================================
+
+    def popular_em_massa(self, num_alunos, options):
+        self.lote = options['lote']
+        num_cursos = options['cursos'] or len(CURSOS)
+        num_disciplinas = options['disciplinas'] or len(DISCIPLINAS)
+        num_turmas = options['turmas'] or max(1, -(-num_alunos // ALUNOS_POR_TURMA))
+        historico = HISTORICO_PADRAO if options['historico'] is None else options['historico']
+        # Cada curso precisa oferecer ao menos as disciplinas do histórico
+        por_curso = min(num_disciplinas, max(DISCIPLINAS_POR_CURSO, historico))
+
+        self.stdout.write(
+            f'\n📊 Configuração (bulk): {num_alunos} alunos, {num_cursos} cursos, {num_turmas} turmas, '
+            f'{num_disciplinas} disciplinas, {historico} por aluno no histórico, lotes de {self.lote}\n'
+        )
+
+        # Equipe: poucos registros, criados como no modo normal
+        enderecos = self.criar_enderecos(18)
+        coordenadores = self.criar_coordenadores(enderecos[:3])
+        departamentos = self.criar_departamentos(coordenadores)
+        self.criar_secretarias(enderecos[3:6])
+        professores = self.criar_professores(enderecos[6:18], departamentos)
+
+        cursos = self.criar_cursos_em_massa(num_cursos, departamentos)
+        disciplinas = self.criar_disciplinas_em_massa(num_disciplinas)
+        grade = self.associar_curso_disciplina_em_massa(cursos, disciplinas, por_curso)
+        turmas = self.criar_turmas_em_massa(num_turmas, cursos, coordenadores)
+        alocacoes = self.associar_turma_disciplina_professor_em_massa(turmas, grade, professores)
+        responsaveis = self.criar_responsaveis_em_massa(max(50, num_alunos // 10))
+        self.criar_alunos_em_massa(num_alunos, turmas, alocacoes, responsaveis, historico, professores, coordenadores)
+
+        # bulk_create não dispara sinais: resumos, índice de busca e cache são refeitos aqui
+        resumos = DesempenhoService.recalcular_todos(self.lote)
+        self.stdout.write(self.style.SUCCESS(f'  ✓ {resumos} resumos de desempenho calculados'))
+        indexados = indexar_alunos()
+        self.stdout.write(self.style.SUCCESS(f'  ✓ {indexados} alunos no índice de busca'))
+        transaction.on_commit(invalidar_estatisticas)
+
+    def criar_cursos_em_massa(self, quantidade, departamentos):
+        self.stdout.write(f'\n🎓 Criando {quantidade} cursos...')
+        fake, rng = self.fluxo('cursos')
+        cursos = []
+        for i in range(quantidade):
+            if i < len(CURSOS):
+                cod, nome, carga, modalidade, turno, idx_dept = CURSOS[i]
+            else:
+                cod, nome, modalidade = f'CUR{i + 1:03d}', f'Curso Técnico {i + 1:03d}', 'Técnico'
+                carga, turno = rng.choice([1200, 1600]), rng.choice(['Manhã', 'Tarde', 'Noite'])
+                idx_dept = i % len(departamentos)
+            cursos.append(Curso(
+                cod_curso=cod,
+                nome_curso=nome,
+                descricao=fake.text(max_nb_chars=200),
+                carga_horaria_total=carga,
+                modalidade=modalidade,
+                turno=turno,
+                tipo='Educação Profissional',
+                data_inicio_validade=date(2020, 1, 1),
+                credenciamento_ativo=True,
+                cod_departamento=departamentos[idx_dept]
+            ))
+        Curso.objects.bulk_create(cursos, batch_size=self.lote)
+        self.stdout.write(self.style.SUCCESS(f'  ✓ {len(cursos)} cursos criados'))
+        return cursos
+
+    def criar_disciplinas_em_massa(self, quantidade):
+        self.stdout.write(f'\n📚 Criando {quantidade} disciplinas...')
+        fake, rng = self.fluxo('disciplinas')
+        disciplinas = []
+        for i in range(quantidade):
+            if i < len(DISCIPLINAS):
+                cod, nome, carga, status = DISCIPLINAS[i]
+            else:
+                cod, nome = f'DISC{i + 1:03d}', f'Disciplina Técnica {i + 1:03d}'
+                carga, status = rng.choice([40, 60, 80, 100]), 'Obrigatória'
+            disciplinas.append(Disciplina(
+                cod_disciplina=cod,
+                nome=nome,
+                carga_horaria=carga,
+                ementa=fake.text(max_nb_chars=300),
+                creditos=carga // 20,
+                status_curricular=status
+            ))
+        Disciplina.objects.bulk_create(disciplinas, batch_size=self.lote)
+        self.stdout.write(self.style.SUCCESS(f'  ✓ {len(disciplinas)} disciplinas criadas'))
+        return disciplinas
+
+    def associar_curso_disciplina_em_massa(self, cursos, disciplinas, por_curso):
+        """Cada curso recebe `por_curso` disciplinas seguidas, em rodízio. Retorna {curso_id: [disciplinas]}."""
+        self.stdout.write('\n🔗 Associando disciplinas aos cursos...')
+        _, rng = self.fluxo('grade')
+        grade, associacoes = {}, []
+        for i, curso in enumerate(cursos):
+            grade[curso.pk] = [disciplinas[(i * por_curso + j) % len(disciplinas)] for j in range(por_curso)]
+            associacoes.extend(
+                CursoDisciplina(
+                    curso=curso, disciplina=disciplina, periodo_curso=rng.randint(1, 4),
+                    obrigatoria=True, status_na_matriz='Ativa'
+                )
+                for disciplina in grade[curso.pk]
+            )
+        CursoDisciplina.objects.bulk_create(associacoes, batch_size=self.lote)
+        self.stdout.write(self.style.SUCCESS(f'  ✓ {len(associacoes)} associações criadas'))
+        return grade
+
+    def criar_turmas_em_massa(self, quantidade, cursos, coordenadores):
+        self.stdout.write(f'\n🏫 Criando {quantidade} turmas...')
+        _, rng = self.fluxo('turmas')
+        turmas = []
+        for i in range(quantidade):
+            curso = cursos[i % len(cursos)]
+            ano, semestre, mes_fim = rng.choice([2024, 2025]), rng.choice([1, 2]), rng.choice([6, 12])
+            turmas.append(Turma(
+                nome=f'{curso.cod_curso} {ano}/{semestre} T{i + 1:04d}',
+                periodo=f'{semestre}° Semestre',
+                ano_letivo=ano,
+                data_inicio=date(ano, 2 if semestre == 1 else 8, 1),
+                data_fim=date(ano + 2, mes_fim, 30 if mes_fim == 6 else 31),
+                capacidade_maxima=ALUNOS_POR_TURMA,
+                alunos_matriculados=0,
+                status_aprovacao='Aprovada',
+                coordenacao_aprovacao=rng.choice(coordenadores),
+                id_curso=curso
+            ))
+        Turma.objects.bulk_create(turmas, batch_size=self.lote)
+        self.stdout.write(self.style.SUCCESS(f'  ✓ {len(turmas)} turmas criadas'))
+        return turmas
+
+    def associar_turma_disciplina_professor_em_massa(self, turmas, grade, professores):
+        """Aloca um professor por disciplina do curso de cada turma. Retorna {turma_id: [alocações]}."""
+        self.stdout.write('\n👨‍🏫 Associando professores às turmas...')
+        _, rng = self.fluxo('alocacoes')
+        alocacoes = {
+            turma.pk: [
+                TurmaDisciplinaProfessor(
+                    turma=turma, disciplina=disciplina, professor=rng.choice(professores), status_alocacao='Ativa'
+                )
+                for disciplina in grade[turma.id_curso_id]
+            ]
+            for turma in turmas
+        }
+        todas = [alocacao for lista in alocacoes.values() for alocacao in lista]
+        TurmaDisciplinaProfessor.objects.bulk_create(todas, batch_size=self.lote)
+        self.stdout.write(self.style.SUCCESS(f'  ✓ {len(todas)} associações criadas'))
+        return alocacoes
+
+    def criar_responsaveis_em_massa(self, quantidade):
+        self.stdout.write(f'\n👨‍👩‍👧 Criando {quantidade} responsáveis e telefones...')
+        fake, rng = self.fluxo('responsaveis')
+        enderecos = Endereco.objects.bulk_create(
+            [self.montar_endereco(fake, rng) for _ in range(quantidade)], batch_size=self.lote
+        )
+        telefones = [
+            [
+                Telefone(
+                    num_telefone=fake.phone_number(),
+                    tipo_telefone=rng.choice(['Celular', 'Residencial', 'Comercial']),
+                    contato_principal=(j == 0)
+                )
+                for j in range(rng.randint(1, 2))
+            ]
+            for _ in range(quantidade)
+        ]
+        Telefone.objects.bulk_create([t for lista in telefones for t in lista], batch_size=self.lote)
+        responsaveis = Responsavel.objects.bulk_create([
+            Responsavel(
+                cpf=f"{i+10000:011d}",
+                nome_completo_responsavel=fake.name(),
+                parentesco=rng.choice(PARENTESCOS),
+                contato_principal=lista[0].num_telefone,
+                responsavel_financeiro=rng.choice([True, False]),
+                cod_endereco=endereco
+            )
+            for i, (endereco, lista) in enumerate(zip(enderecos, telefones))
+        ], batch_size=self.lote)
+        Vinculo = Responsavel.telefones.through
+        Vinculo.objects.bulk_create([
+            Vinculo(responsavel_id=responsavel.pk, telefone_id=telefone.pk)
+            for responsavel, lista in zip(responsaveis, telefones) for telefone in lista
+        ], batch_size=self.lote)
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✓ {len(responsaveis)} responsáveis e {sum(map(len, telefones))} telefones'
+        ))
+        return responsaveis
+
+    def criar_alunos_em_massa(self, quantidade, turmas, alocacoes, responsaveis, historico, professores, coordenadores):
+        """Alunos (com usuário, perfil e endereço), históricos e ocorrências, um lote por vez."""
+        self.stdout.write(f'\n🎓 Criando {quantidade} alunos em lotes de {self.lote}...')
+        fake, rng = self.fluxo('alunos')
+        senha = self.hash_senha('aluno')
+        fuso = timezone.get_current_timezone()
+        hoje = date.today()
+        matriculados = dict.fromkeys((turma.pk for turma in turmas), 0)
+        num_historicos = num_ocorrencias = 0
+
+        for inicio in range(0, quantidade, self.lote):
+            indices = range(inicio, min(inicio + self.lote, quantidade))
+            # Os dados de cada aluno saem do fluxo na mesma ordem, qualquer que seja o lote
+            enderecos, usuarios, perfis, alunos, historicos, ocorrencias = [], [], [], [], [], []
+            for i in indices:
+                endereco = self.montar_endereco(fake, rng)
+                enderecos.append(endereco)
+                genero = rng.choice(['Masculino', 'Feminino'])
+                nome = fake.first_name_male() if genero == 'Masculino' else fake.first_name_female()
+                username = f'aluno{i+1:04d}'
+                data_nasc = fake.date_of_birth(minimum_age=16, maximum_age=30)
+                idade = (hoje - data_nasc).days // 365
+                turma = turmas[i % len(turmas)]
+                user = User(
+                    username=username,
+                    first_name=nome,
+                    last_name=fake.last_name(),
+                    email=f'{username}@aluno.senai.br',
+                    password=senha,
+                    is_active=True,
+                    is_staff=False,
+                    is_superuser=False,
+                    date_joined=fake.date_time_between(start_date='-1y', end_date='now', tzinfo=fuso)
+                )
+                usuarios.append(user)
+                perfis.append(Profile(
+                    user=user,
+                    tipo='aluno',
+                    telefone=fake.phone_number(),
+                    cpf=f"{i+100000:011d}",
+                    data_nascimento=data_nasc,
+                    endereco=f'{endereco.logradouro}, {endereco.numero} - {endereco.cidade}'
+                ))
+                aluno = Aluno(
+                    user=user,
+                    RA_aluno=f"2025{i+1:04d}",
+                    RG_aluno=f"99{i+1:07d}",
+                    data_nascimento=data_nasc,
+                    genero=genero,
+                    etinia=rng.choice(['Branco', 'Pardo', 'Preto', 'Amarelo', 'Indígena']),
+                    estado_civil=rng.choice(['Solteiro', 'Casado']),
+                    conclusao_EM=fake.date_between(start_date='-3y', end_date='-1m') if idade >= 18 else None,
+                    status_matricula=rng.choice(['Ativo', 'Ativo', 'Ativo', 'Ativo', 'Trancado']),
+                    cod_endereco=endereco,
+                    responsavel_legal=rng.choice(responsaveis) if idade < 18 else None,
+                    turma_atual=turma
+                )
+                alunos.append(aluno)
+                matriculados[turma.pk] += 1
+
+                oferta = alocacoes[turma.pk]
+                for alocacao in rng.sample(oferta, min(historico, len(oferta))):
+                    historicos.append(Historico(
+                        id_aluno=aluno,
+                        turma_disciplina_professor=alocacao,
+                        periodo_realizacao=f'{turma.ano_letivo}/{turma.periodo}',
+                        **self.gerar_resultado(rng, alocacao.disciplina.carga_horaria)
+                    ))
+                # Cerca de 15% dos alunos com uma ou duas ocorrências, como no modo normal
+                if rng.random() < 0.15:
+                    for _ in range(rng.randint(1, 2)):
+                        ocorrencias.append(RegistroOcorrencia(
+                            aluno=aluno,
+                            professor=rng.choice(professores),
+                            turma=turma,
+                            coordenacao_revisou=rng.choice(coordenadores) if rng.random() > 0.5 else None,
+                            tipo_ocorrencia=rng.choice(TIPOS_OCORRENCIA),
+                            descricao=fake.text(max_nb_chars=200),
+                            status_intervencao=rng.choice(STATUS_OCORRENCIA)
+                        ))
+
+            Endereco.objects.bulk_create(enderecos)
+            User.objects.bulk_create(usuarios)
+            Profile.objects.bulk_create(perfis)
+            Aluno.objects.bulk_create(alunos)
+            Historico.objects.bulk_create(historicos, batch_size=self.lote)
+            RegistroOcorrencia.objects.bulk_create(ocorrencias, batch_size=self.lote)
+            num_historicos += len(historicos)
+            num_ocorrencias += len(ocorrencias)
+            self.stdout.write(f'  … {indices.stop}/{quantidade} alunos')
+
+        for turma in turmas:
+            turma.alunos_matriculados = matriculados[turma.pk]
+        Turma.objects.bulk_update(turmas, ['alunos_matriculados'], batch_size=self.lote)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✓ {quantidade} alunos, {num_historicos} históricos e {num_ocorrencias} ocorrências criados'
+        ))
+
     def exibir_resumo(self):
         self.stdout.write('\n' + '=' * 70)
         self.stdout.write(self.style.SUCCESS('✅ População concluída com sucesso!'))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academico', '0002_alter_aluno_rg_aluno_alter_aluno_cod_endereco_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DesempenhoAluno',
+            fields=[
+                ('aluno', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='desempenho', serialize=False, to='academico.aluno')),
+                ('media', models.FloatField(blank=True, null=True)),
+                ('frequencia', models.FloatField(blank=True, null=True)),
+                ('total_registros', models.IntegerField(default=0)),
+                ('faixa_risco', models.CharField(choices=[('bom', 'Bom'), ('atencao', 'Atenção'), ('risco', 'Risco')], max_length=20)),
+                ('atualizado_em', models.DateTimeField(auto_now=True)),
+                ('curso', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='desempenhos', to='academico.curso')),
+                ('turma', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='desempenhos', to='academico.turma')),
+            ],
+            options={
+                'verbose_name': 'Desempenho do Aluno',
+                'verbose_name_plural': 'Desempenho dos Alunos',
+                'db_table': 'academico_desempenho_aluno',
+                'indexes': [models.Index(fields=['faixa_risco'], name='academico_desemp_faixa_idx'), models.Index(fields=['curso', 'faixa_risco'], name='academico_desemp_curso_idx'), models.Index(fields=['turma'], name='academico_desemp_turma_idx')],
+            },
+        ),
+    ]
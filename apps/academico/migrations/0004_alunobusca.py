@@ -0,0 +1,89 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:46
+
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Índice de texto conforme o banco (ver apps/academico/busca.py)
+SQL_INDICE = {
+    'sqlite': [
+        "CREATE VIRTUAL TABLE academico_aluno_busca_fts USING fts5("
+        "texto, content='academico_aluno_busca', content_rowid='aluno_id', tokenize='trigram')",
+        "CREATE TRIGGER academico_aluno_busca_ai AFTER INSERT ON academico_aluno_busca BEGIN "
+        "INSERT INTO academico_aluno_busca_fts(rowid, texto) VALUES (new.aluno_id, new.texto); END",
+        "CREATE TRIGGER academico_aluno_busca_ad AFTER DELETE ON academico_aluno_busca BEGIN "
+        "INSERT INTO academico_aluno_busca_fts(academico_aluno_busca_fts, rowid, texto) "
+        "VALUES ('delete', old.aluno_id, old.texto); END",
+        "CREATE TRIGGER academico_aluno_busca_au AFTER UPDATE ON academico_aluno_busca BEGIN "
+        "INSERT INTO academico_aluno_busca_fts(academico_aluno_busca_fts, rowid, texto) "
+        "VALUES ('delete', old.aluno_id, old.texto); "
+        "INSERT INTO academico_aluno_busca_fts(rowid, texto) VALUES (new.aluno_id, new.texto); END",
+    ],
+    'postgresql': [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX academico_aluno_busca_trgm ON academico_aluno_busca USING gin (texto gin_trgm_ops)",
+    ],
+}
+SQL_REMOVER_INDICE = {
+    'sqlite': [
+        "DROP TRIGGER IF EXISTS academico_aluno_busca_ai",
+        "DROP TRIGGER IF EXISTS academico_aluno_busca_ad",
+        "DROP TRIGGER IF EXISTS academico_aluno_busca_au",
+        "DROP TABLE IF EXISTS academico_aluno_busca_fts",
+    ],
+    'postgresql': [
+        "DROP INDEX IF EXISTS academico_aluno_busca_trgm",
+    ],
+}
+
+
+def criar_indice(apps, schema_editor):
+    for sql in SQL_INDICE.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def remover_indice(apps, schema_editor):
+    for sql in SQL_REMOVER_INDICE.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def _normalizar(texto):
+    decomposto = unicodedata.normalize('NFKD', texto or '')
+    return ''.join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+
+def indexar_alunos_existentes(apps, schema_editor):
+    Aluno = apps.get_model('academico', 'Aluno')
+    AlunoBusca = apps.get_model('academico', 'AlunoBusca')
+    linhas = [
+        AlunoBusca(aluno_id=pk, texto=_normalizar(' '.join(filter(None, campos))))
+        for pk, *campos in Aluno.objects.values_list(
+            'pk', 'user__first_name', 'user__last_name', 'RA_aluno', 'user__email'
+        ).iterator()
+    ]
+    AlunoBusca.objects.bulk_create(linhas, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academico', '0003_desempenhoaluno'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AlunoBusca',
+            fields=[
+                ('aluno', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='busca', serialize=False, to='academico.aluno')),
+                ('texto', models.TextField()),
+            ],
+            options={
+                'verbose_name': 'Índice de Busca do Aluno',
+                'verbose_name_plural': 'Índice de Busca dos Alunos',
+                'db_table': 'academico_aluno_busca',
+            },
+        ),
+        migrations.RunPython(criar_indice, remover_indice),
+        migrations.RunPython(indexar_alunos_existentes, migrations.RunPython.noop),
+    ]
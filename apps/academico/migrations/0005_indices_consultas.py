@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academico', '0004_alunobusca'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aluno',
+            index=models.Index(fields=['status_matricula'], name='academico_aluno_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historico',
+            index=models.Index(fields=['id_aluno', '-periodo_realizacao'], name='academico_hist_periodo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='turma',
+            index=models.Index(fields=['status_aprovacao', 'data_inicio'], name='academico_turma_status_idx'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # #############################################################################
 # ### 1. Entidades de Base (Endereço, Telefone, Disciplina)
@@ -187,6 +189,10 @@ class Turma(models.Model):
         verbose_name = 'Turma'
         verbose_name_plural = 'Turmas'
         db_table = 'academico_turma'
+        indexes = [
+            # Fila de aprovação: turmas pendentes, das que começam antes
+            models.Index(fields=['status_aprovacao', 'data_inicio'], name='academico_turma_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.nome} ({self.id_curso.nome_curso})"
@@ -236,6 +242,10 @@ class Aluno(models.Model):
         verbose_name = 'Aluno'
         verbose_name_plural = 'Alunos'
         db_table = 'academico_aluno'
+        indexes = [
+            # Contagem de matrículas ativas nos dashboards
+            models.Index(fields=['status_matricula'], name='academico_aluno_status_idx'),
+        ]
 
     def __str__(self):
         return self.user.get_full_name()
@@ -291,6 +301,10 @@ class Historico(models.Model):
         verbose_name_plural = 'Históricos Escolares'
         db_table = 'academico_historico'
         unique_together = ('id_aluno', 'turma_disciplina_professor')
+        indexes = [
+            # Boletim e relatórios: histórico do aluno agrupado por período, do mais recente
+            models.Index(fields=['id_aluno', '-periodo_realizacao'], name='academico_hist_periodo_idx'),
+        ]
 
     def __str__(self):
         return f"Histórico de {self.id_aluno.user.get_full_name()} em {self.turma_disciplina_professor.disciplina.nome}"
@@ -328,4 +342,97 @@ class RegistroOcorrencia(models.Model):
         db_table = 'academico_registro_ocorrencia'
 
     def __str__(self):
-        return f"{self.tipo_ocorrencia} para {self.aluno.user.get_full_name()} em {self.data_registro.strftime('%Y-%m-%d')}"
\ No newline at end of file
+        return f"{self.tipo_ocorrencia} para {self.aluno.user.get_full_name()} em {self.data_registro.strftime('%Y-%m-%d')}"
+
+# #############################################################################
+# ### 6. Agregados Pré-calculados
+# #############################################################################
+
+class DesempenhoAluno(models.Model):
+    """
+    Resumo materializado do desempenho de cada aluno (média e frequência
+    sobre todo o Historico). Atualizado por DesempenhoService sempre que o
+    diário de classe grava notas, para que os painéis da coordenação leiam
+    uma linha por aluno em vez de reagregar o histórico inteiro.
+    """
+    FAIXAS_RISCO = (
+        ('bom', 'Bom'),
+        ('atencao', 'Atenção'),
+        ('risco', 'Risco'),
+    )
+
+    aluno = models.OneToOneField(Aluno, on_delete=models.CASCADE, primary_key=True, related_name='desempenho')
+    curso = models.ForeignKey(Curso, on_delete=models.SET_NULL, null=True, blank=True, related_name='desempenhos')
+    turma = models.ForeignKey(Turma, on_delete=models.SET_NULL, null=True, blank=True, related_name='desempenhos')
+    media = models.FloatField(blank=True, null=True)
+    frequencia = models.FloatField(blank=True, null=True)
+    total_registros = models.IntegerField(default=0)
+    faixa_risco = models.CharField(max_length=20, choices=FAIXAS_RISCO)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Desempenho do Aluno'
+        verbose_name_plural = 'Desempenho dos Alunos'
+        db_table = 'academico_desempenho_aluno'
+        indexes = [
+            models.Index(fields=['faixa_risco'], name='academico_desemp_faixa_idx'),
+            models.Index(fields=['curso', 'faixa_risco'], name='academico_desemp_curso_idx'),
+            models.Index(fields=['turma'], name='academico_desemp_turma_idx'),
+        ]
+
+    def __str__(self):
+        return f"Desempenho de {self.aluno} ({self.get_faixa_risco_display()})"
+
+
+@receiver(post_save, sender=Aluno)
+def sincronizar_turma_desempenho(sender, instance, **kwargs):
+    # Mantém turma/curso do resumo alinhados à turma atual do aluno
+    curso_id = instance.turma_atual.id_curso_id if instance.turma_atual_id else None
+    DesempenhoAluno.objects.filter(aluno=instance).update(turma=instance.turma_atual_id, curso=curso_id)
+
+
+@receiver(post_save, sender=Turma)
+def sincronizar_curso_desempenho(sender, instance, **kwargs):
+    DesempenhoAluno.objects.filter(turma=instance).exclude(curso=instance.id_curso_id).update(curso=instance.id_curso_id)
+
+
+@receiver([post_save, post_delete], sender=Historico)
+def recalcular_desempenho_historico(sender, instance, raw=False, **kwargs):
+    # Edições avulsas (admin, shell, exclusões). O diário de classe grava em
+    # lote com bulk_update, sem sinais, e recalcula os alunos de uma vez.
+    if raw:
+        return
+    from .services import DesempenhoService
+    DesempenhoService.recalcular([instance.id_aluno_id])
+
+
+class AlunoBusca(models.Model):
+    """
+    Texto de busca de cada aluno (nome, sobrenome, RA e e-mail, em minúsculas
+    e sem acentos). Mantido pelos sinais indexar_aluno_busca e
+    reindexar_usuario_busca, logo abaixo neste módulo, e indexado conforme
+    o banco: FTS5 com trigramas no SQLite, pg_trgm no PostgreSQL
+    (ver apps/academico/busca.py).
+    """
+    aluno = models.OneToOneField(Aluno, on_delete=models.CASCADE, primary_key=True, related_name='busca')
+    texto = models.TextField()
+
+    class Meta:
+        verbose_name = 'Índice de Busca do Aluno'
+        verbose_name_plural = 'Índice de Busca dos Alunos'
+        db_table = 'academico_aluno_busca'
+
+
+@receiver(post_save, sender=Aluno)
+def indexar_aluno_busca(sender, instance, **kwargs):
+    from .busca import indexar_alunos
+    indexar_alunos([instance.pk])
+
+
+@receiver(post_save, sender=User)
+def reindexar_usuario_busca(sender, instance, update_fields=None, **kwargs):
+    # Logins só gravam last_login: não há o que reindexar
+    if update_fields and not {'first_name', 'last_name', 'email'} & set(update_fields):
+        return
+    from .busca import indexar_alunos
+    indexar_alunos([instance.pk])
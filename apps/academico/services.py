@@ -0,0 +1,95 @@
+from django.db import transaction
+from django.db.models import Avg, Count
+
+from . import grading
+from .models import Aluno, DesempenhoAluno, Historico
+
+
+class DesempenhoService:
+    """
+    Mantém a tabela DesempenhoAluno sincronizada com o Historico.
+    """
+
+    # Critério dos painéis da coordenação (definido em apps.academico.grading)
+    MEDIA_BOA = grading.MEDIA_BOA
+    FREQUENCIA_BOA = grading.FREQUENCIA_BOA
+    MEDIA_RISCO = grading.MEDIA_RISCO
+    FREQUENCIA_RISCO = grading.FREQUENCIA_RISCO
+
+    @staticmethod
+    def classificar_faixa(media, frequencia):
+        """Retorna 'bom', 'atencao' ou 'risco' (médias nulas contam como zero)."""
+        media = float(media or 0.0)
+        frequencia = float(frequencia or 0.0)
+
+        if media >= DesempenhoService.MEDIA_BOA and frequencia >= DesempenhoService.FREQUENCIA_BOA:
+            return 'bom'
+        if media < DesempenhoService.MEDIA_RISCO or frequencia < DesempenhoService.FREQUENCIA_RISCO:
+            return 'risco'
+        return 'atencao'
+
+    @staticmethod
+    def classificar_situacao(media, frequencia):
+        """Situação exibida no painel de desempenho: 'Aprovado', 'Recuperação' ou 'Reprovado'."""
+        media = float(media or 0.0)
+        frequencia = float(frequencia or 0.0)
+
+        if media >= DesempenhoService.MEDIA_BOA and frequencia >= DesempenhoService.FREQUENCIA_RISCO:
+            return 'Aprovado'
+        if media < DesempenhoService.MEDIA_RISCO or frequencia < DesempenhoService.FREQUENCIA_RISCO:
+            return 'Reprovado'
+        return 'Recuperação'
+
+    @staticmethod
+    def recalcular(aluno_ids):
+        """
+        Recalcula o resumo dos alunos informados com uma agregação agrupada.
+        Alunos sem nenhum registro de histórico ficam sem linha de resumo.
+        """
+        aluno_ids = list(set(aluno_ids))
+        if not aluno_ids:
+            return 0
+
+        stats = Historico.objects.filter(id_aluno__in=aluno_ids).values('id_aluno').annotate(
+            avg_media=Avg('media_final'),
+            avg_freq=Avg('frequencia_percentual'),
+            total=Count('id')
+        )
+        turmas = {
+            a['pk']: (a['turma_atual_id'], a['turma_atual__id_curso_id'])
+            for a in Aluno.objects.filter(pk__in=aluno_ids).values('pk', 'turma_atual_id', 'turma_atual__id_curso_id')
+        }
+
+        resumos = []
+        for s in stats:
+            turma_id, curso_id = turmas.get(s['id_aluno'], (None, None))
+            resumos.append(DesempenhoAluno(
+                aluno_id=s['id_aluno'],
+                turma_id=turma_id,
+                curso_id=curso_id,
+                media=s['avg_media'],
+                frequencia=s['avg_freq'],
+                total_registros=s['total'],
+                faixa_risco=DesempenhoService.classificar_faixa(s['avg_media'], s['avg_freq'])
+            ))
+
+        with transaction.atomic():
+            sem_historico = set(aluno_ids) - {r.aluno_id for r in resumos}
+            if sem_historico:
+                DesempenhoAluno.objects.filter(aluno_id__in=sem_historico).delete()
+            DesempenhoAluno.objects.bulk_create(
+                resumos,
+                update_conflicts=True,
+                unique_fields=['aluno'],
+                update_fields=['turma', 'curso', 'media', 'frequencia', 'total_registros', 'faixa_risco', 'atualizado_em']
+            )
+        return len(resumos)
+
+    @staticmethod
+    def recalcular_todos(tamanho_lote=2000):
+        """Reconstrói o resumo de todos os alunos, em lotes. Retorna o total de linhas."""
+        total = 0
+        ids = list(Aluno.objects.order_by('pk').values_list('pk', flat=True))
+        for inicio in range(0, len(ids), tamanho_lote):
+            total += DesempenhoService.recalcular(ids[inicio:inicio + tamanho_lote])
+        return total
@@ -0,0 +1,3 @@
+"""
+Package de testes da app academico.
+"""
\ No newline at end of file
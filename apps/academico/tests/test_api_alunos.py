@@ -0,0 +1,112 @@
+"""
+Testes da API de alunos: paginação por cursor, seleção de campos e filtros.
+"""
+import json
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.academico.models import Aluno, Curso, Departamento, Secretaria, Turma
+from apps.core.paginacao import codificar_cursor
+from apps.usuarios.papeis import papeis_usuario
+
+
+class ApiAlunosTests(TestCase):
+    """GET de api_alunos."""
+
+    def setUp(self):
+        departamento = Departamento.objects.create(nome_departamento='Tecnologia', cod_departamento='TEC')
+        curso = Curso.objects.create(
+            cod_curso='TADS', nome_curso='Análise e Desenvolvimento', carga_horaria_total=1600,
+            modalidade='Presencial', turno='Noturno', tipo='Técnico', cod_departamento=departamento
+        )
+        self.turmas = [
+            Turma.objects.create(
+                nome=f'TADS 2025/{i + 1}', periodo='Noturno', ano_letivo=2025,
+                data_inicio=date(2025, 2, 1), id_curso=curso
+            )
+            for i in range(2)
+        ]
+        # Nomes repetidos: a ordem (nome, pk) precisa desempatar pelo pk
+        nomes = ['Bruno', 'Ana', 'Carla', 'Ana', 'Bruno', 'Ana', 'Diego']
+        for i, nome in enumerate(nomes):
+            Aluno.objects.create(
+                user=User.objects.create_user(username=f'aluno_api_{i}', first_name=nome, last_name=f'Silva {i}'),
+                RA_aluno=f'RA{i:05d}',
+                turma_atual=self.turmas[i % 2],
+                status_matricula='Trancado' if i == 6 else 'Ativo'
+            )
+
+        secretaria = User.objects.create_user(username='secretaria_api', password='senha123')
+        Secretaria.objects.create(user=secretaria)
+        self.client = Client()
+        self.client.force_login(secretaria)
+        # Papéis já em cache, como depois do primeiro acesso
+        papeis_usuario(secretaria)
+        self.url = reverse('api_alunos')
+
+    def _get(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(b''.join(response.streaming_content))
+
+    def _percorrer(self, **params):
+        """Segue o link 'next' até o fim; retorna os itens e o número de páginas."""
+        itens, paginas = [], 0
+        dados = self._get(self.url, **params)
+        while True:
+            itens.extend(dados['results'])
+            paginas += 1
+            if not dados['next']:
+                return itens, paginas
+            dados = self._get(dados['next'])
+
+    def test_paginas_cobrem_todos_sem_repetir(self):
+        itens, paginas = self._percorrer(limite=2)
+
+        esperado = list(Aluno.objects.order_by('user__first_name', 'pk').values_list('pk', flat=True))
+        self.assertEqual([i['id'] for i in itens], esperado)
+        self.assertEqual(paginas, 4)
+        self.assertEqual(itens[0], {
+            'id': esperado[0], 'nome': 'Ana Silva 1', 'matricula': 'RA00001',
+            'status': 'Ativo', 'curso': 'Análise e Desenvolvimento',
+        })
+
+    def test_consultas_constantes_por_pagina(self):
+        """A página seguinte custa o mesmo número de consultas que a primeira."""
+        with CaptureQueriesContext(connection) as primeira:
+            dados = self._get(self.url, limite=2)
+        with CaptureQueriesContext(connection) as seguinte:
+            self._get(dados['next'])
+        self.assertEqual(len(primeira.captured_queries), len(seguinte.captured_queries))
+
+    def test_selecao_de_campos(self):
+        dados = self._get(self.url, fields='nome,id', limite=1)
+        self.assertEqual(list(dados['results'][0]), ['id', 'nome'])
+
+        response = self.client.get(self.url, {'fields': 'id,senha'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_filtros_da_gestao(self):
+        itens, _ = self._percorrer(turma=self.turmas[0].pk, status='Ativo', fields='id', limite=1)
+        esperado = set(Aluno.objects.filter(
+            turma_atual=self.turmas[0], status_matricula='Ativo'
+        ).values_list('pk', flat=True))
+        self.assertEqual({i['id'] for i in itens}, esperado)
+
+        itens, _ = self._percorrer(q='ana', fields='nome')
+        self.assertEqual([i['nome'] for i in itens], ['Ana Silva 1', 'Ana Silva 3', 'Ana Silva 5'])
+
+    def test_cursor_invalido(self):
+        response = self.client.get(self.url, {'cursor': 'nao-e-um-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_com_valores_de_tipo_errado(self):
+        # Formato certo, mas o pk não é número: 400, e não erro ao montar o filtro
+        for valores in (['abc', 'x'], ['abc', [1]]):
+            response = self.client.get(self.url, {'cursor': codificar_cursor(valores)})
+            self.assertEqual(response.status_code, 400)
@@ -0,0 +1,82 @@
+"""
+Testes da busca de alunos (AlunoBusca + índice de texto) e do autocompletar.
+"""
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from apps.academico.busca import buscar_alunos, condicao_busca
+from apps.academico.models import Aluno, AlunoBusca
+from apps.usuarios.models import Profile
+
+
+class BuscaAlunosTests(TestCase):
+    """Sincronização por sinais e consultas do índice."""
+
+    def setUp(self):
+        self.alunos = {}
+        for i, (nome, sobrenome) in enumerate([
+            ('João', 'Conceição'), ('Joana', 'Silva'), ('Bruno', 'Silva Lima'), ('Ana', 'Souza')
+        ]):
+            user = User.objects.create_user(
+                username=f'aluno_busca_{i}', first_name=nome, last_name=sobrenome,
+                email=f'aluno{i}@senai.br'
+            )
+            self.alunos[nome] = Aluno.objects.create(user=user, RA_aluno=f'2025{i:04d}')
+
+    def _nomes(self, q):
+        return sorted(a['nome'] for a in buscar_alunos(q))
+
+    def test_busca_sem_acentos_e_com_varios_termos(self):
+        self.assertEqual(self._nomes('joao'), ['João Conceição'])
+        self.assertEqual(self._nomes('CONCEICAO'), ['João Conceição'])
+        self.assertEqual(self._nomes('silva'), ['Bruno Silva Lima', 'Joana Silva'])
+        self.assertEqual(self._nomes('silva lima'), ['Bruno Silva Lima'])
+        self.assertEqual(self._nomes('20250003'), ['Ana Souza'])
+        self.assertEqual(self._nomes('aluno1@'), ['Joana Silva'])
+        self.assertEqual(self._nomes('inexistente'), [])
+        self.assertEqual(buscar_alunos('   '), [])
+
+    def test_termos_curtos_usam_like(self):
+        """Termos com menos de 3 letras não formam trigramas."""
+        self.assertEqual(self._nomes('jo'), ['Joana Silva', 'João Conceição'])
+        self.assertEqual(self._nomes('an so'), ['Ana Souza'])
+
+    def test_condicao_combina_com_outros_filtros(self):
+        self.alunos['Bruno'].status_matricula = 'Trancado'
+        self.alunos['Bruno'].save()
+        ativos = Aluno.objects.filter(condicao_busca('silva'), status_matricula='Ativo')
+        self.assertEqual(list(ativos), [self.alunos['Joana']])
+
+    def test_sinais_mantem_o_indice(self):
+        user = self.alunos['Ana'].user
+        user.last_name = 'Ferreira'
+        user.save()
+        self.assertEqual(self._nomes('ferreira'), ['Ana Ferreira'])
+        self.assertEqual(self._nomes('souza'), [])
+
+        self.alunos['Ana'].delete()
+        self.assertEqual(self._nomes('ferreira'), [])
+        self.assertFalse(AlunoBusca.objects.filter(aluno_id=user.pk).exists())
+
+    def test_reindexar(self):
+        # Alterações por UPDATE direto não passam pelos sinais
+        User.objects.filter(pk=self.alunos['Bruno'].pk).update(first_name='Bernardo')
+        self.assertEqual(self._nomes('bernardo'), [])
+
+        call_command('reindexar_busca_alunos', stdout=StringIO())
+        self.assertEqual(self._nomes('bernardo'), ['Bernardo Silva Lima'])
+
+    def test_autocomplete(self):
+        secretaria = User.objects.create_user(username='secretaria_busca')
+        Profile.objects.create(user=secretaria, tipo='secretaria')
+        client = Client()
+        client.force_login(secretaria)
+
+        response = client.get(reverse('autocomplete_alunos'), {'q': 'silva', 'limite': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 1)
+        self.assertEqual(set(response.json()['results'][0]), {'id', 'nome', 'matricula', 'email'})
@@ -0,0 +1,95 @@
+"""
+Testes do resumo materializado de desempenho (DesempenhoAluno): o resumo
+acompanha o Historico quando o diário grava notas, quando um histórico é
+editado ou excluído e quando o comando recalcular_desempenho é executado.
+"""
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from apps.academico.models import (
+    Aluno, Curso, Departamento, DesempenhoAluno, Disciplina, Historico, Professor, Turma, TurmaDisciplinaProfessor
+)
+from apps.usuarios.models import Profile
+
+
+class DesempenhoResumoTests(TestCase):
+
+    def setUp(self):
+        departamento = Departamento.objects.create(nome_departamento='Tecnologia', cod_departamento='TEC')
+        self.curso = Curso.objects.create(
+            cod_curso='TADS', nome_curso='Análise e Desenvolvimento', carga_horaria_total=1600,
+            modalidade='Presencial', turno='Noturno', tipo='Técnico', cod_departamento=departamento
+        )
+        turma = Turma.objects.create(
+            nome='TADS 2025/1', periodo='Noturno', ano_letivo=2025, data_inicio=date(2025, 2, 1), id_curso=self.curso
+        )
+        professor_user = User.objects.create_user(username='prof_resumo')
+        Profile.objects.create(user=professor_user, tipo='professor')
+        self.alocacao = TurmaDisciplinaProfessor.objects.create(
+            turma=turma,
+            disciplina=Disciplina.objects.create(cod_disciplina='DISC001', nome='Lógica', carga_horaria=80),
+            professor=Professor.objects.create(user=professor_user)
+        )
+        self.aluno = Aluno.objects.create(
+            user=User.objects.create_user(username='aluno_resumo'), RA_aluno='RA00001', turma_atual=turma
+        )
+        self.client = Client()
+        self.client.force_login(professor_user)
+
+    def _resumo(self):
+        return DesempenhoAluno.objects.get(aluno=self.aluno)
+
+    def _lancar_no_diario(self, nota, faltas):
+        url = reverse('diario_classe', args=[self.alocacao.pk])
+        self.client.get(url)
+        historico = Historico.objects.get(id_aluno=self.aluno)
+        self.client.post(url, {
+            'form-TOTAL_FORMS': '1', 'form-INITIAL_FORMS': '1',
+            'form-MIN_NUM_FORMS': '0', 'form-MAX_NUM_FORMS': '1000',
+            'form-0-id': str(historico.pk), 'form-0-nota_final': str(nota), 'form-0-total_faltas': str(faltas),
+        })
+
+    def test_diario_atualiza_o_resumo(self):
+        self._lancar_no_diario(9.0, 0)
+        self.assertEqual(self._resumo().media, 9.0)
+        self.assertEqual(self._resumo().faixa_risco, 'bom')
+        self.assertEqual(self._resumo().curso_id, self.curso.pk)
+
+        self._lancar_no_diario(3.0, 0)
+        self.assertEqual(self._resumo().media, 3.0)
+        self.assertEqual(self._resumo().faixa_risco, 'risco')
+
+    def test_edicao_e_exclusao_do_historico(self):
+        historico = Historico.objects.create(
+            id_aluno=self.aluno, turma_disciplina_professor=self.alocacao,
+            media_final=8.0, nota_final=8.0, frequencia_percentual=90.0, periodo_realizacao='2025.1'
+        )
+        self.assertEqual(self._resumo().media, 8.0)
+
+        historico.media_final = 4.0
+        historico.save()
+        self.assertEqual(self._resumo().media, 4.0)
+        self.assertEqual(self._resumo().faixa_risco, 'risco')
+
+        historico.delete()
+        self.assertFalse(DesempenhoAluno.objects.filter(aluno=self.aluno).exists())
+
+    def test_comando_reconstroi_resumo_desatualizado(self):
+        Historico.objects.create(
+            id_aluno=self.aluno, turma_disciplina_professor=self.alocacao,
+            media_final=8.0, nota_final=8.0, frequencia_percentual=90.0, periodo_realizacao='2025.1'
+        )
+        # update() não dispara sinais: simula um resumo que ficou para trás
+        Historico.objects.filter(id_aluno=self.aluno).update(media_final=5.5)
+        self.assertEqual(self._resumo().media, 8.0)
+
+        saida = StringIO()
+        call_command('recalcular_desempenho', stdout=saida)
+        self.assertIn('1 resumos', saida.getvalue())
+        self.assertEqual(self._resumo().media, 5.5)
+        self.assertEqual(self._resumo().faixa_risco, 'atencao')
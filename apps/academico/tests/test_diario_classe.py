@@ -0,0 +1,104 @@
+"""
+Testes do diário de classe: criação em lote dos históricos e gravação
+com um único UPDATE, em número constante de consultas.
+"""
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.academico.models import (
+    Aluno, Curso, Departamento, DesempenhoAluno, Disciplina, Historico, Professor, Turma, TurmaDisciplinaProfessor
+)
+from apps.usuarios.models import Profile
+
+
+class DiarioClasseTests(TestCase):
+    """Regressão de consultas do diario_classe_view."""
+
+    def setUp(self):
+        departamento = Departamento.objects.create(nome_departamento='Tecnologia', cod_departamento='TEC')
+        curso = Curso.objects.create(
+            cod_curso='TADS', nome_curso='Análise e Desenvolvimento', carga_horaria_total=1600,
+            modalidade='Presencial', turno='Noturno', tipo='Técnico', cod_departamento=departamento
+        )
+        self.turma = Turma.objects.create(
+            nome='TADS 2025/1', periodo='Noturno', ano_letivo=2025, data_inicio=date(2025, 2, 1), id_curso=curso
+        )
+        professor_user = User.objects.create_user(username='prof_diario', password='senha123')
+        Profile.objects.create(user=professor_user, tipo='professor')
+        self.alocacao = TurmaDisciplinaProfessor.objects.create(
+            turma=self.turma,
+            disciplina=Disciplina.objects.create(cod_disciplina='DISC001', nome='Lógica', carga_horaria=80),
+            professor=Professor.objects.create(user=professor_user)
+        )
+        self.url = reverse('diario_classe', args=[self.alocacao.pk])
+        self.client = Client()
+        self.client.force_login(professor_user)
+        self.total_alunos = 0
+
+    def _criar_alunos(self, quantidade):
+        for _ in range(quantidade):
+            self.total_alunos += 1
+            Aluno.objects.create(
+                user=User.objects.create_user(username=f'aluno_diario_{self.total_alunos}', first_name=f'Aluno {self.total_alunos:03d}'),
+                RA_aluno=f'RA{self.total_alunos:05d}', turma_atual=self.turma
+            )
+
+    def _dados_post(self, nota, faltas):
+        historicos = list(Historico.objects.filter(turma_disciplina_professor=self.alocacao).order_by('id_aluno__user__first_name'))
+        dados = {
+            'form-TOTAL_FORMS': str(len(historicos)),
+            'form-INITIAL_FORMS': str(len(historicos)),
+            'form-MIN_NUM_FORMS': '0',
+            'form-MAX_NUM_FORMS': '1000',
+        }
+        for i, historico in enumerate(historicos):
+            dados[f'form-{i}-id'] = str(historico.pk)
+            dados[f'form-{i}-nota_final'] = str(nota)
+            dados[f'form-{i}-total_faltas'] = str(faltas)
+        return dados
+
+    def _consultas(self, metodo, *args):
+        with CaptureQueriesContext(connection) as ctx:
+            response = metodo(self.url, *args)
+        self.assertIn(response.status_code, (200, 302))
+        return len(ctx.captured_queries)
+
+    def test_get_cria_historicos_faltantes(self):
+        self._criar_alunos(3)
+        self.client.get(self.url)
+        self.assertEqual(Historico.objects.filter(turma_disciplina_professor=self.alocacao).count(), 3)
+
+        self._criar_alunos(2)
+        self.client.get(self.url)
+        self.assertEqual(Historico.objects.filter(turma_disciplina_professor=self.alocacao).count(), 5)
+
+    def test_consultas_constantes(self):
+        """GET e POST custam o mesmo com 5 ou 60 alunos."""
+        self._criar_alunos(5)
+        self.client.get(self.url)
+        get_poucos = self._consultas(self.client.get)
+        post_poucos = self._consultas(self.client.post, self._dados_post(8.0, 4))
+
+        self._criar_alunos(55)
+        self.client.get(self.url)
+        get_muitos = self._consultas(self.client.get)
+        post_muitos = self._consultas(self.client.post, self._dados_post(5.0, 4))
+
+        self.assertEqual(get_poucos, get_muitos)
+        self.assertEqual(post_poucos, post_muitos)
+
+    def test_post_recalcula_situacao(self):
+        self._criar_alunos(2)
+        self.client.get(self.url)
+        self.client.post(self.url, self._dados_post(7.0, 30))
+
+        historico = Historico.objects.filter(turma_disciplina_professor=self.alocacao).first()
+        self.assertEqual(historico.media_final, 7.0)
+        self.assertEqual(historico.frequencia_percentual, 62.5)
+        self.assertEqual(historico.status_aprovacao, 'Reprovado por Faltas')
+        self.assertEqual(DesempenhoAluno.objects.count(), 2)
@@ -0,0 +1,107 @@
+"""
+Testes do motor de cálculo (apps.academico.grading) e do recálculo em massa
+do histórico.
+"""
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from apps.academico import grading
+from apps.academico.models import (
+    Aluno, Curso, Departamento, DesempenhoAluno, Disciplina, Historico, Professor, Turma, TurmaDisciplinaProfessor
+)
+
+
+class GradingTests(SimpleTestCase):
+    """Regras do diário de classe, sem banco."""
+
+    def test_situacoes(self):
+        resultados = grading.calcular_lote([
+            (8.0, 4, 80),      # 95%
+            (5.9, 0, 80),      # nota abaixo do corte
+            (10.0, 21, 80),    # 73,75%: reprovado mesmo com nota máxima
+            (6.0, 20, 80),     # exatamente 75%
+            (None, None, 80),  # sem lançamento: nota e faltas contam como zero
+        ])
+        self.assertEqual(resultados, [
+            (95.0, grading.APROVADO),
+            (100.0, grading.RECUPERACAO),
+            (73.8, grading.REPROVADO_POR_FALTAS),
+            (75.0, grading.APROVADO),
+            (100.0, grading.RECUPERACAO),
+        ])
+
+    def test_situacao_usa_frequencia_exata(self):
+        """74,99% é gravado como 75,0, mas continua abaixo do mínimo."""
+        resultado = grading.calcular(9.0, 1000, 3999)
+        self.assertEqual(resultado.frequencia, 75.0)
+        self.assertEqual(resultado.status, grading.REPROVADO_POR_FALTAS)
+
+    def test_carga_horaria_ausente(self):
+        self.assertEqual(grading.calcular(7.0, 6, None).frequencia, 90.0)
+
+
+class RecalcularSituacaoHistoricoTests(TestCase):
+    """Comando recalcular_situacao_historico."""
+
+    def setUp(self):
+        departamento = Departamento.objects.create(nome_departamento='Tecnologia', cod_departamento='TEC')
+        curso = Curso.objects.create(
+            cod_curso='TADS', nome_curso='Análise e Desenvolvimento', carga_horaria_total=1600,
+            modalidade='Presencial', turno='Noturno', tipo='Técnico', cod_departamento=departamento
+        )
+        turma = Turma.objects.create(
+            nome='TADS 2025/1', periodo='Noturno', ano_letivo=2025, data_inicio=date(2025, 2, 1), id_curso=curso
+        )
+        alocacao = TurmaDisciplinaProfessor.objects.create(
+            turma=turma,
+            disciplina=Disciplina.objects.create(cod_disciplina='DISC001', nome='Lógica', carga_horaria=40),
+            professor=Professor.objects.create(user=User.objects.create_user(username='prof_grading'))
+        )
+        # (nota, faltas, frequência e situação gravadas antes do recálculo)
+        linhas = [
+            (8.0, 2, 95.0, 'Aprovado'),        # já correto
+            (4.0, 0, 100.0, 'Aprovado'),       # situação errada
+            (9.0, 12, 90.0, 'Aprovado'),       # faltas acima do limite
+            (None, None, None, 'Cursando'),    # sem lançamento: ignorado
+        ]
+        self.historicos = []
+        for i, (nota, faltas, freq, status) in enumerate(linhas):
+            aluno = Aluno.objects.create(
+                user=User.objects.create_user(username=f'aluno_grading_{i}'), RA_aluno=f'RA{i:05d}', turma_atual=turma
+            )
+            self.historicos.append(Historico.objects.create(
+                id_aluno=aluno, turma_disciplina_professor=alocacao, nota_final=nota, media_final=nota,
+                total_faltas=faltas, frequencia_percentual=freq, status_aprovacao=status, periodo_realizacao='2025.1'
+            ))
+
+    def _situacoes(self):
+        return [
+            Historico.objects.values_list('frequencia_percentual', 'status_aprovacao').get(pk=h.pk)
+            for h in self.historicos
+        ]
+
+    def test_recalcula_em_lotes(self):
+        saida = StringIO()
+        call_command('recalcular_situacao_historico', lote=2, stdout=saida)
+
+        self.assertEqual(self._situacoes(), [
+            (95.0, grading.APROVADO),
+            (100.0, grading.RECUPERACAO),
+            (70.0, grading.REPROVADO_POR_FALTAS),
+            (None, 'Cursando'),
+        ])
+        self.assertIn('2 de 3 registros atualizados', saida.getvalue())
+        # O resumo dos painéis acompanha a nova frequência
+        self.assertEqual(DesempenhoAluno.objects.get(aluno_id=self.historicos[2].id_aluno_id).frequencia, 70.0)
+
+    def test_dry_run_nao_grava(self):
+        antes = self._situacoes()
+        saida = StringIO()
+        call_command('recalcular_situacao_historico', dry_run=True, stdout=saida)
+
+        self.assertEqual(self._situacoes(), antes)
+        self.assertIn('2 de 3 registros seriam alterados', saida.getvalue())
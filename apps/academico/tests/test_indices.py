@@ -0,0 +1,41 @@
+"""
+Testes do plano de índices das consultas acadêmicas e do benchmark_indices.
+"""
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from apps.academico.management.commands.benchmark_indices import PLANO_INDICES
+from apps.academico.models import Aluno
+from apps.payments.models import Pagamento
+
+
+class IndicesConsultasTests(TestCase):
+
+    def _indices(self, model):
+        with connection.cursor() as cursor:
+            restricoes = connection.introspection.get_constraints(cursor, model._meta.db_table)
+        return {nome for nome, info in restricoes.items() if info['index']}
+
+    def test_indices_do_plano_existem(self):
+        for model, nomes in PLANO_INDICES.items():
+            self.assertLessEqual(set(nomes), self._indices(model), model.__name__)
+
+    def test_pendencias_do_aluno_usam_o_indice(self):
+        user = User.objects.create_user(username='aluno_indices')
+        plano = Pagamento.objects.filter(aluno=user, status='pendente').explain()
+        if connection.vendor == 'sqlite':
+            self.assertIn('pagamento_aluno_status_idx', plano)
+
+    def test_benchmark_descarta_dados_e_mantem_indices(self):
+        saida = StringIO()
+        call_command('benchmark_indices', alunos=40, repeticoes=1, stdout=saida)
+
+        self.assertIn('secretaria_dashboard', saida.getvalue())
+        self.assertIn('Benchmark concluído', saida.getvalue())
+        self.assertFalse(Aluno.objects.exists())
+        for model, nomes in PLANO_INDICES.items():
+            self.assertLessEqual(set(nomes), self._indices(model), model.__name__)
@@ -0,0 +1,46 @@
+"""
+Testes do modo em massa (--bulk) do seed_database.
+"""
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from apps.academico.busca import buscar_alunos
+from apps.academico.models import Aluno, CursoDisciplina, Curso, DesempenhoAluno, Historico, Turma
+
+
+class SeedDatabaseBulkTests(TestCase):
+
+    def _popular(self, **opcoes):
+        call_command('seed_database', bulk=True, stdout=StringIO(), **opcoes)
+
+    def test_volumes_configuraveis(self):
+        self._popular(alunos=30, cursos=7, turmas=4, disciplinas=25, historico=3, lote=8)
+
+        self.assertEqual(Aluno.objects.count(), 30)
+        self.assertEqual(Curso.objects.count(), 7)
+        self.assertEqual(Turma.objects.count(), 4)
+        self.assertEqual(Historico.objects.count(), 30 * 3)
+        self.assertEqual(CursoDisciplina.objects.filter(curso__cod_curso='CUR007').count(), 6)
+        self.assertEqual(sum(Turma.objects.values_list('alunos_matriculados', flat=True)), 30)
+
+        # Sinais não disparam no bulk_create: resumo e índice de busca são refeitos ao final
+        self.assertEqual(DesempenhoAluno.objects.count(), 30)
+        aluno = Aluno.objects.select_related('user').first()
+        self.assertIn(aluno.pk, [a['id'] for a in buscar_alunos(aluno.RA_aluno)])
+        self.assertTrue(aluno.user.check_password('aluno'))
+
+    def test_mesma_semente_mesmos_dados_com_qualquer_lote(self):
+        self._popular(alunos=12, lote=5)
+        primeira = list(User.objects.filter(aluno__isnull=False).order_by('username').values_list('first_name', 'last_name'))
+
+        call_command('seed_database', bulk=True, clear=True, alunos=12, lote=12, stdout=StringIO())
+        segunda = list(User.objects.filter(aluno__isnull=False).order_by('username').values_list('first_name', 'last_name'))
+        self.assertEqual(primeira, segunda)
+
+    def test_volumes_exigem_bulk(self):
+        with self.assertRaises(CommandError):
+            call_command('seed_database', alunos=5, cursos=3, stdout=StringIO())
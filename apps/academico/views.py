@@ -2,18 +2,26 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.core.paginator import Paginator
-from django.db.models import Q, Sum
+from django.db.models import Sum
 from django.views.decorators.http import require_http_methods
 from django.http import JsonResponse, HttpResponseBadRequest, HttpResponseNotAllowed
 from django.forms.models import model_to_dict
 from django.contrib.auth.models import User
 from django.forms import modelform_factory
+from django.db import transaction
+from django.utils import timezone
 import json
 import requests  # ← ADICIONADO: Para a API ViaCEP
 
 
+from . import grading
+from .busca import condicao_busca
+from .filtros import filtrar_alunos
 from .forms import AlunoForm, AlunoEditForm, DiarioClasseForm, DiarioClasseFormSet, OcorrenciaForm
 from .models import Aluno, Historico, Secretaria, Turma, TurmaDisciplinaProfessor, Professor, RegistroOcorrencia
+from .services import DesempenhoService
+from apps.core.paginacao import ParametroInvalido, ler_campos, ler_limite, paginar, resposta_paginada
+from apps.dashboards.estatisticas import invalidar_estatisticas
 
 
 # #############################################################################
@@ -42,14 +50,10 @@ def lista_alunos_view(request):
     alunos = Aluno.objects.all()
     
     if search_query:
-        alunos = alunos.filter(
-            Q(RA_aluno__icontains=search_query) |            # Corrigido: de 'matricula' para 'RA_aluno'
-            Q(user__first_name__icontains=search_query) |
-            Q(user__last_name__icontains=search_query) |
-            Q(user__email__icontains=search_query)
-            # Nota: A busca por CPF estava no 'Profile' antigo e foi removida.
-            # Se o CPF for essencial, ele deve ser adicionado ao modelo 'Aluno'.
-        )
+        # RA, nome, sobrenome ou e-mail, pelo índice de busca (apps/academico/busca.py)
+        # Nota: A busca por CPF estava no 'Profile' antigo e foi removida.
+        # Se o CPF for essencial, ele deve ser adicionado ao modelo 'Aluno'.
+        alunos = alunos.filter(condicao_busca(search_query))
     
     if status_filter:
         alunos = alunos.filter(status_matricula=status_filter) # Corrigido: 'matricula__status' para 'status_matricula'
@@ -161,31 +165,61 @@ def cadastro_aluno_view(request):
 # #############################################################################
 
 
+# Campo da API -> colunas lidas com .values()
+CAMPOS_API_ALUNOS = {
+    'id': ('pk',),
+    'nome': ('user__first_name', 'user__last_name'),
+    'matricula': ('RA_aluno',),
+    'status': ('status_matricula',),
+    'curso': ('turma_atual__id_curso__nome_curso',),
+}
+ORDENACAO_API_ALUNOS = ('user__first_name', 'pk')
+
+
+# Campo da API -> valor a partir da linha
+VALORES_API_ALUNOS = {
+    'id': lambda linha: linha['pk'],
+    'nome': lambda linha: f"{linha['user__first_name']} {linha['user__last_name']}".strip(),
+    'matricula': lambda linha: linha['RA_aluno'],
+    'status': lambda linha: linha['status_matricula'],
+    'curso': lambda linha: linha['turma_atual__id_curso__nome_curso'] or '',
+}
+
+
+def _aluno_api(linha, campos):
+    """Monta o item da API a partir de uma linha de .values()"""
+    return {campo: VALORES_API_ALUNOS[campo](linha) for campo in campos}
+
+
 @login_required
 @user_passes_test(is_secretaria)
 @require_http_methods(['GET', 'POST'])
 def api_alunos(request):
-    """ GET -> lista alunos (JSON). POST -> cria novo aluno (JSON). """
+    """ GET -> lista alunos (JSON, paginada por cursor). POST -> cria novo aluno (JSON). """
     
     if request.method == 'GET':
-        alunos = Aluno.objects.select_related('user', 'turma_atual__id_curso').all()
-        data = []
-        for a in alunos:
-            nome = a.user.get_full_name() or a.user.first_name or ''
-            
-            # Lógica de Matrícula removida
-            status = a.status_matricula
-            curso = a.turma_atual.id_curso.nome_curso if a.turma_atual and a.turma_atual.id_curso else ''
-            
-            data.append({
-                'id': a.pk,
-                'nome': nome,
-                'matricula': a.RA_aluno, # Corrigido para RA_aluno
-                'status': status,
-                'curso': curso,
-            })
-        return JsonResponse({'results': data})
-
+        # Filtros iguais aos da gestão de alunos (?q=, ?turma=, ?status=),
+        # paginação por cursor (?cursor=, ?limite=) e seleção de campos (?fields=)
+        try:
+            campos = ler_campos(request.GET.get('fields'), CAMPOS_API_ALUNOS)
+            limite = ler_limite(request.GET.get('limite'))
+            colunas = {'pk', 'user__first_name'}
+            for campo in campos:
+                colunas.update(CAMPOS_API_ALUNOS[campo])
+
+            alunos = filtrar_alunos(
+                Aluno.objects.all(),
+                busca=request.GET.get('q'),
+                turma=request.GET.get('turma'),
+                status=request.GET.get('status'),
+            ).values(*colunas)
+            linhas, proximo = paginar(
+                alunos, ORDENACAO_API_ALUNOS, cursor=request.GET.get('cursor'), limite=limite
+            )
+        except ParametroInvalido as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+        return resposta_paginada(request, (_aluno_api(linha, campos) for linha in linhas), proximo)
 
     if request.method == 'POST':
         try:
@@ -391,61 +425,75 @@ def minhas_turmas_view(request):
         'alocacoes': alocacoes
     })
 
+def calcular_situacao_diario(historicos, carga_horaria_disciplina):
+    """
+    Recalcula frequência, média e situação das linhas do diário em uma
+    única passada (sem acessar o banco). As regras ficam em apps.academico.grading.
+    """
+    resultados = grading.calcular_lote(
+        (h.nota_final, h.total_faltas, carga_horaria_disciplina) for h in historicos
+    )
+    for historico, resultado in zip(historicos, resultados):
+        historico.frequencia_percentual = resultado.frequencia
+        historico.status_aprovacao = resultado.status
+
+        # O dashboard do aluno lê 'media_final', mas o professor digita 'nota_final'
+        if historico.nota_final is not None:
+            historico.media_final = historico.nota_final
+
+
 @login_required
 def diario_classe_view(request, alocacao_id):
     """
     Tela estilo planilha para lançar notas e faltas de todos os alunos da turma.
     """
     # 1. Segurança: Garante que a alocação pertence ao professor logado
-    alocacao = get_object_or_404(TurmaDisciplinaProfessor, pk=alocacao_id)
-    if alocacao.professor.user != request.user:
+    alocacao = get_object_or_404(
+        TurmaDisciplinaProfessor.objects.select_related('professor', 'turma', 'disciplina'), pk=alocacao_id
+    )
+    if alocacao.professor.user_id != request.user.id:
         messages.error(request, "Você não tem permissão para editar esta turma.")
         return redirect('home')
 
     # 2. Garante que existam registros de Histórico para todos os alunos da turma
-    alunos_turma = Aluno.objects.filter(turma_atual=alocacao.turma)
-    for aluno in alunos_turma:
-        Historico.objects.get_or_create(
-            id_aluno=aluno,
-            turma_disciplina_professor=alocacao,
-            defaults={'periodo_realizacao': '2025.1'}
-        )
+    #    (apenas os que faltam, em um único INSERT)
+    alunos_sem_historico = Aluno.objects.filter(turma_atual=alocacao.turma).exclude(
+        historico__turma_disciplina_professor=alocacao
+    ).values_list('pk', flat=True)
+    novos = [
+        Historico(id_aluno_id=aluno_id, turma_disciplina_professor=alocacao, periodo_realizacao='2025.1')
+        for aluno_id in alunos_sem_historico
+    ]
+    if novos:
+        Historico.objects.bulk_create(novos, ignore_conflicts=True)
 
     # 3. Filtra os históricos desta matéria específica
     queryset = Historico.objects.filter(
         turma_disciplina_professor=alocacao
-    ).order_by('id_aluno__user__first_name')
+    ).select_related('id_aluno__user').order_by('id_aluno__user__first_name')
 
     if request.method == 'POST':
         formset = DiarioClasseFormSet(request.POST, queryset=queryset)
         if formset.is_valid():
             instances = formset.save(commit=False)
-            carga_horaria_disciplina = alocacao.disciplina.carga_horaria or 60 # Default de segurança
+            carga_horaria_disciplina = alocacao.disciplina.carga_horaria or grading.CARGA_HORARIA_PADRAO
+
+            calcular_situacao_diario(instances, carga_horaria_disciplina)
 
+            # Um único UPDATE para todas as linhas alteradas (bulk_update não
+            # dispara auto_now nem sinais: data_lancamento e caches são tratados aqui)
+            agora = timezone.now()
             for historico in instances:
-                # === Lógica Realista de Cálculo Automático ===
-                
-                # 1. Calcular Frequência % baseada nas faltas
-                faltas = historico.total_faltas or 0
-                freq = ((carga_horaria_disciplina - faltas) / carga_horaria_disciplina) * 100
-                historico.frequencia_percentual = round(freq, 1)
-
-                # 2. CORREÇÃO: Sincronizar Media Final com Nota Final
-                # O dashboard do aluno lê 'media_final', mas o professor digita 'nota_final'
-                if historico.nota_final is not None:
-                    historico.media_final = historico.nota_final
-
-                # 3. Definir Status (Aprovado/Reprovado)
-                nota = historico.nota_final or 0
-                
-                if freq < 75:
-                    historico.status_aprovacao = 'Reprovado por Faltas'
-                elif nota >= 6.0:
-                    historico.status_aprovacao = 'Aprovado'
-                else:
-                    historico.status_aprovacao = 'Recuperação'
-                
-                historico.save()
+                historico.data_lancamento = agora
+            with transaction.atomic():
+                Historico.objects.bulk_update(instances, [
+                    'nota_final', 'total_faltas', 'media_final', 'frequencia_percentual',
+                    'status_aprovacao', 'data_lancamento'
+                ])
+                # Atualiza o resumo pré-calculado usado pelos painéis da coordenação
+                DesempenhoService.recalcular([h.id_aluno_id for h in instances])
+            if instances:
+                transaction.on_commit(invalidar_estatisticas)
             
             messages.success(request, "Diário de classe atualizado com sucesso!")
             return redirect('diario_classe', alocacao_id=alocacao_id)
@@ -455,7 +503,7 @@ def diario_classe_view(request, alocacao_id):
     context = {
         'formset': formset,
         'alocacao': alocacao,
-        'alunos_nomes': [h.id_aluno.user.get_full_name() for h in queryset] 
+        'alunos_nomes': [form.instance.id_aluno.user.get_full_name() for form in formset]
     }
     return render(request, 'academico/professor/diario_classe.html', context)
 
@@ -0,0 +1,3 @@
+"""
+Utilitários compartilhados entre as apps (cache, etc.).
+"""
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Convenções de chaves de cache do projeto.
+
+As chaves seguem o formato ``<namespace>:v<versao>:<partes...>``. Cada
+namespace guarda um número de versão no próprio cache; invalidar o namespace
+incrementa a versão, tornando órfãs todas as chaves antigas de uma só vez
+(elas expiram sozinhas pelo timeout).
+"""
+import functools
+import time
+
+from django.core.cache import cache
+
+_AUSENTE = object()
+
+
+def _chave_versao(namespace):
+    return f'{namespace}:versao'
+
+
+def versao_namespace(namespace):
+    """Versão atual do namespace (criada na primeira leitura)."""
+    chave = _chave_versao(namespace)
+    versao = cache.get(chave)
+    if versao is None:
+        # Começa em um valor baseado no relógio: se a chave de versão for
+        # descartada pelo backend, entradas antigas não voltam a ser válidas
+        cache.add(chave, time.time_ns() // 1_000_000, None)
+        versao = cache.get(chave)
+    return versao
+
+
+def chave_cache(namespace, *partes):
+    """Monta a chave versionada de um namespace."""
+    sufixo = ':'.join(str(p) for p in partes)
+    chave = f'{namespace}:v{versao_namespace(namespace)}'
+    return f'{chave}:{sufixo}' if sufixo else chave
+
+
+def invalidar_namespace(namespace):
+    """Invalida todas as chaves do namespace."""
+    chave = _chave_versao(namespace)
+    try:
+        cache.incr(chave)
+    except ValueError:
+        versao_namespace(namespace)
+
+
+def cached_view_fragment(namespace, *partes, timeout=None):
+    """
+    Decorator que guarda em cache o retorno de uma função que monta parte do
+    contexto de uma view. Os argumentos posicionais da chamada entram na chave.
+
+    ``timeout`` pode ser um número de segundos ou uma função sem argumentos que
+    o retorna (útil para ler um setting a cada chamada); ``None`` usa o padrão
+    do backend.
+
+        @cached_view_fragment('estatisticas', timeout=300)
+        def estatisticas_curso(curso_id): ...
+
+    A função decorada ganha ``.invalidar()``, atalho para invalidar_namespace.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            chave = chave_cache(namespace, *partes, func.__name__, *args)
+            valor = cache.get(chave, _AUSENTE)
+            if valor is _AUSENTE:
+                valor = func(*args)
+                segundos = timeout() if callable(timeout) else timeout
+                if segundos is None:
+                    cache.set(chave, valor)
+                else:
+                    cache.set(chave, valor, segundos)
+            return valor
+
+        wrapper.invalidar = functools.partial(invalidar_namespace, namespace)
+        return wrapper
+    return decorator
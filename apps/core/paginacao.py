@@ -0,0 +1,123 @@
+"""
+Paginação por chave (keyset) para as APIs JSON.
+
+Em vez de OFFSET, cada página começa depois da última linha entregue: o
+cliente recebe um cursor opaco com os valores da ordenação dessa linha e o
+devolve em ``?cursor=``. O custo de cada página é o mesmo, seja a primeira
+ou a milésima, e a resposta é serializada item a item (StreamingHttpResponse),
+sem montar a lista inteira em memória.
+
+Os campos de ordenação devem ser não nulos e terminar em uma chave única
+(normalmente ``pk``). Campos com ``-`` na frente são ordenados do maior
+para o menor, como no order_by.
+"""
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+
+LIMITE_PADRAO = 50
+LIMITE_MAXIMO = 500
+
+
+class ParametroInvalido(ValueError):
+    """Cursor, limite ou lista de campos inválidos na query string."""
+
+
+def codificar_cursor(valores):
+    dados = json.dumps(list(valores), cls=DjangoJSONEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(dados.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decodificar_cursor(cursor, quantidade):
+    """Valores do cursor (lista com `quantidade` itens, sem listas ou objetos aninhados)."""
+    try:
+        dados = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        valores = json.loads(dados)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ParametroInvalido('Cursor inválido')
+    if (not isinstance(valores, list) or len(valores) != quantidade
+            or any(isinstance(v, (list, dict)) for v in valores)):
+        raise ParametroInvalido('Cursor inválido')
+    return valores
+
+
+def ler_limite(valor, padrao=LIMITE_PADRAO):
+    """Tamanho da página pedido em ?limite=, restrito a 1..LIMITE_MAXIMO."""
+    if valor in (None, ''):
+        return padrao
+    try:
+        limite = int(valor)
+    except ValueError:
+        raise ParametroInvalido('Limite inválido')
+    return max(1, min(limite, LIMITE_MAXIMO))
+
+
+def ler_campos(valor, disponiveis):
+    """Campos pedidos em ?fields=a,b (todos, se ausente), na ordem de `disponiveis`."""
+    if not valor:
+        return list(disponiveis)
+    pedidos = {c.strip() for c in valor.split(',') if c.strip()}
+    desconhecidos = pedidos - set(disponiveis)
+    if desconhecidos:
+        raise ParametroInvalido(f"Campos desconhecidos: {', '.join(sorted(desconhecidos))}")
+    return [c for c in disponiveis if c in pedidos]
+
+
+def filtrar_apos(queryset, ordenacao, valores):
+    """Linhas estritamente depois de `valores` na ordem de `ordenacao`."""
+    condicao = Q()
+    for i, campo in enumerate(ordenacao):
+        iguais = {_nome(ordenacao[j]): valores[j] for j in range(i)}
+        operador = 'lt' if campo.startswith('-') else 'gt'
+        condicao |= Q(**iguais, **{f'{_nome(campo)}__{operador}': valores[i]})
+    return queryset.filter(condicao)
+
+
+def _nome(campo):
+    return campo.lstrip('-')
+
+
+def paginar(queryset, ordenacao, cursor=None, limite=LIMITE_PADRAO):
+    """
+    Uma página de um queryset de .values() que inclua os campos de `ordenacao`.
+    Retorna (linhas, próximo cursor ou None).
+    """
+    if cursor:
+        valores = decodificar_cursor(cursor, len(ordenacao))
+        # Valores de tipo errado para o campo (cursor adulterado) falham ao montar o filtro
+        try:
+            queryset = filtrar_apos(queryset, ordenacao, valores)
+        except (TypeError, ValueError, ValidationError):
+            raise ParametroInvalido('Cursor inválido')
+    linhas = list(queryset.order_by(*ordenacao)[:limite + 1])
+
+    proximo = None
+    if len(linhas) > limite:
+        linhas = linhas[:limite]
+        proximo = codificar_cursor(linhas[-1][_nome(campo)] for campo in ordenacao)
+    return linhas, proximo
+
+
+def resposta_paginada(request, itens, proximo_cursor):
+    """
+    JSON {"results": [...], "next_cursor": ..., "next": ...} gerado aos
+    pedaços. `next` é a URL da página seguinte, com os mesmos filtros.
+    """
+    proximo = None
+    if proximo_cursor:
+        params = request.GET.copy()
+        params['cursor'] = proximo_cursor
+        proximo = f'{request.path}?{params.urlencode()}'
+
+    def gerar():
+        yield '{"results": ['
+        for i, item in enumerate(itens):
+            yield (',' if i else '') + json.dumps(item, cls=DjangoJSONEncoder)
+        yield '], "next_cursor": %s, "next": %s}' % (json.dumps(proximo_cursor), json.dumps(proximo))
+
+    return StreamingHttpResponse(gerar(), content_type='application/json')
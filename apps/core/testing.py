@@ -0,0 +1,28 @@
+"""
+Runner dos testes (TEST_RUNNER). Troca o cache configurado, que por padrão
+fica em arquivos compartilhados por toda a máquina (CACHE_DIR) ou no Redis,
+por um cache em memória do próprio processo: os testes não apagam nem
+contaminam o cache do servidor de desenvolvimento, e execuções em paralelo
+não interferem umas nas outras.
+"""
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+CACHE_TESTES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'senai-testes',
+    }
+}
+
+
+class TestRunner(DiscoverRunner):
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._cache_testes = override_settings(CACHES=CACHE_TESTES)
+        self._cache_testes.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._cache_testes.disable()
+        super().teardown_test_environment(**kwargs)
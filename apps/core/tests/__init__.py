@@ -0,0 +1,3 @@
+"""
+Package de testes dos utilitários compartilhados.
+"""
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Testes das convenções de chaves de cache (apps/core/cache.py).
+"""
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.cache import cached_view_fragment, chave_cache, invalidar_namespace
+from apps.core.testing import CACHE_TESTES
+
+
+@override_settings(CACHES=CACHE_TESTES)
+class CacheNamespaceTests(SimpleTestCase):
+    """Chaves versionadas por namespace e cache de fragmentos."""
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_invalidar_muda_apenas_o_namespace(self):
+        chave_a = chave_cache('teste_a', 'x', 1)
+        chave_b = chave_cache('teste_b', 'x', 1)
+
+        invalidar_namespace('teste_a')
+
+        self.assertNotEqual(chave_cache('teste_a', 'x', 1), chave_a)
+        self.assertEqual(chave_cache('teste_b', 'x', 1), chave_b)
+
+    def test_fragmento_reaproveitado_ate_invalidar(self):
+        chamadas = []
+
+        @cached_view_fragment('teste_fragmento', timeout=60)
+        def fragmento(valor):
+            chamadas.append(valor)
+            return {'valor': valor}
+
+        self.assertEqual(fragmento(1), {'valor': 1})
+        self.assertEqual(fragmento(1), {'valor': 1})
+        self.assertEqual(fragmento(2), {'valor': 2})
+        self.assertEqual(chamadas, [1, 2])
+
+        fragmento.invalidar()
+        fragmento(1)
+        self.assertEqual(chamadas, [1, 2, 1])
+
+    def test_valor_nulo_tambem_fica_em_cache(self):
+        chamadas = []
+
+        @cached_view_fragment('teste_nulo')
+        def fragmento():
+            chamadas.append(None)
+            return None
+
+        fragmento()
+        fragmento()
+        self.assertEqual(len(chamadas), 1)
@@ -0,0 +1,103 @@
+"""
+Medição de carga das telas por papel (comando benchmark_dashboards).
+
+Cada tela é requisitada pelo Client de teste com um usuário logado. Para
+cada uma são registrados os percentis de latência, o número de consultas e
+o pico de memória alocada durante a requisição (tracemalloc). O resultado é
+um dicionário serializável em JSON, que pode ser comparado com o de uma
+execução anterior (baseline).
+"""
+import time
+import tracemalloc
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+PERCENTIS = (50, 95, 99)
+
+# Métricas comparadas com o baseline: (nome, tolerância em % se aplica)
+METRICAS_COMPARADAS = (
+    ('p95_ms', True),
+    ('memoria_pico_kb', True),
+    ('consultas', False),
+)
+
+
+def percentil(valores, p):
+    """Percentil p (0 a 100) com interpolação linear entre as amostras."""
+    ordenados = sorted(valores)
+    posicao = (len(ordenados) - 1) * p / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+
+def _requisitar(client, url):
+    response = client.get(url)
+    # PDFs (FileResponse) só são gerados ao serem lidos; o Client fecha a
+    # resposta ao fim do iterador sem derrubar a conexão com o banco
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
+    return response
+
+
+def medir_tela(client, url, repeticoes, aquecimento=1):
+    """
+    Requisita `url` `aquecimento` vezes sem medir e depois `repeticoes`
+    vezes. Retorna {'status', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms',
+    'consultas', 'memoria_pico_kb'}.
+    """
+    for _ in range(aquecimento):
+        _requisitar(client, url)
+
+    tempos, consultas = [], []
+    for _ in range(repeticoes):
+        with CaptureQueriesContext(connection) as ctx:
+            inicio = time.perf_counter()
+            response = _requisitar(client, url)
+            tempos.append((time.perf_counter() - inicio) * 1000)
+        consultas.append(len(ctx.captured_queries))
+
+    # Memória numa requisição à parte: o tracemalloc deixa tudo bem mais lento
+    tracemalloc.start()
+    try:
+        _requisitar(client, url)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    resultado = {'status': response.status_code}
+    resultado.update({f'p{p}_ms': round(percentil(tempos, p), 3) for p in PERCENTIS})
+    resultado.update({
+        'max_ms': round(max(tempos), 3),
+        'consultas': max(consultas),
+        'memoria_pico_kb': round(pico / 1024, 1),
+    })
+    return resultado
+
+
+def comparar(atual, baseline, tolerancia):
+    """
+    Compara as telas presentes nos dois resultados ({'telas': {...}}).
+    Retorna uma linha por tela e métrica: {'tela', 'metrica', 'antes',
+    'depois', 'variacao', 'regressao'}. Latência e memória regridem quando
+    sobem mais que `tolerancia` %; consultas, quando sobem.
+    """
+    linhas = []
+    for tela, depois in atual['telas'].items():
+        antes = baseline['telas'].get(tela)
+        if antes is None:
+            continue
+        for metrica, usa_tolerancia in METRICAS_COMPARADAS:
+            valor_antes, valor_depois = antes[metrica], depois[metrica]
+            variacao = (valor_depois - valor_antes) / valor_antes * 100 if valor_antes else 0.0
+            linhas.append({
+                'tela': tela,
+                'metrica': metrica,
+                'antes': valor_antes,
+                'depois': valor_depois,
+                'variacao': round(variacao, 1),
+                'regressao': valor_depois > valor_antes and (not usa_tolerancia or variacao > tolerancia),
+            })
+    return linhas
@@ -0,0 +1,43 @@
+"""
+Estatísticas institucionais exibidas na landing page.
+Os números ficam em cache por ESTATISTICAS_CACHE_TTL segundos e são
+invalidados pelos sinais registrados em apps/dashboards/signals.py.
+"""
+from django.conf import settings
+from django.db.models import Count, Q
+
+from apps.academico import grading
+from apps.academico.models import Aluno, Curso, Historico, Professor
+from apps.core.cache import cached_view_fragment, invalidar_namespace
+
+NAMESPACE_ESTATISTICAS = 'dashboards:estatisticas'
+
+# Média mínima usada na taxa de aprovação da landing page
+MEDIA_APROVACAO = grading.NOTA_APROVACAO
+
+
+def calcular_estatisticas():
+    """Consulta o banco e retorna o dicionário de estatísticas."""
+    notas = Historico.objects.exclude(media_final__isnull=True).aggregate(
+        total=Count('pk'),
+        aprovacoes=Count('pk', filter=Q(media_final__gte=MEDIA_APROVACAO))
+    )
+    total_notas = notas['total']
+
+    return {
+        'total_alunos': Aluno.objects.count(),
+        'total_professores': Professor.objects.count(),
+        'total_cursos': Curso.objects.count(),
+        'taxa_aprovacao': (notas['aprovacoes'] / total_notas * 100) if total_notas > 0 else 0,
+    }
+
+
+@cached_view_fragment(NAMESPACE_ESTATISTICAS, timeout=lambda: settings.ESTATISTICAS_CACHE_TTL)
+def obter_estatisticas():
+    """Retorna as estatísticas do cache, recalculando quando expiradas."""
+    return calcular_estatisticas()
+
+
+def invalidar_estatisticas():
+    """Descarta as estatísticas em cache; a próxima visita recalcula."""
+    invalidar_namespace(NAMESPACE_ESTATISTICAS)
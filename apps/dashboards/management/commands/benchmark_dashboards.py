@@ -0,0 +1,200 @@
+import json
+import platform
+from io import StringIO
+
+import django
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.academico.models import Aluno, Coordenacao, Professor, Secretaria
+from apps.dashboards.benchmark import comparar, medir_tela
+
+# (tela, papel do usuário, rota, argumentos da rota a partir dos registros usados)
+TELAS = [
+    ('aluno_dashboard', 'aluno', 'aluno_dashboard', None),
+    ('boletim', 'aluno', 'boletim', None),
+    ('aluno_financeiro', 'aluno', 'aluno_financeiro', None),
+    ('professor_dashboard', 'professor', 'professor_dashboard', None),
+    ('secretaria_dashboard', 'secretaria', 'secretaria_dashboard', None),
+    ('gestao_alunos', 'secretaria', 'gestao_alunos', None),
+    ('coordenacao_dashboard', 'coordenacao', 'coordenacao_dashboard', None),
+    ('coordenacao_desempenho', 'coordenacao', 'coordenacao_desempenho', None),
+    ('coordenacao_gestao', 'coordenacao', 'coordenacao_gestao', None),
+    ('pdf_aluno', 'secretaria', 'relatorio_aluno_geral_pdf', lambda r: [r['aluno'].pk]),
+    ('pdf_professor', 'professor', 'relatorio_professor_geral_pdf', None),
+    ('pdf_secretaria', 'secretaria', 'relatorio_secretaria_geral_pdf', None),
+    ('pdf_coordenacao', 'coordenacao', 'relatorio_coordenacao_pdf', lambda r: [r['coordenacao'].user_id]),
+    ('pdf_turma', 'coordenacao', 'baixar_relatorio_turma', lambda r: [r['aluno'].turma_atual_id]),
+]
+
+
+class _Rollback(Exception):
+    """Usada para desfazer a base sintética ao final do benchmark."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Teste de carga das telas de cada papel (dashboards e PDFs): popula uma base '
+        'sintética com seed_database --bulk, requisita cada tela pelo Client de teste e '
+        'registra percentis de latência, consultas e pico de memória. A base sintética '
+        'é descartada ao final. Pode gravar o resultado em JSON e compará-lo com um baseline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--alunos',
+            type=int,
+            default=1000,
+            help='Alunos da base sintética (padrão: 1000)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Semente da base sintética (padrão: 42)'
+        )
+        parser.add_argument(
+            '--usar-banco',
+            action='store_true',
+            help='Mede sobre os dados já existentes no banco, sem popular'
+        )
+        parser.add_argument(
+            '--repeticoes',
+            type=int,
+            default=20,
+            help='Requisições medidas por tela (padrão: 20)'
+        )
+        parser.add_argument(
+            '--aquecimento',
+            type=int,
+            default=2,
+            help='Requisições descartadas antes de medir cada tela (padrão: 2)'
+        )
+        parser.add_argument(
+            '--telas',
+            nargs='+',
+            choices=[tela for tela, *_ in TELAS],
+            help='Mede só as telas informadas (padrão: todas)'
+        )
+        parser.add_argument(
+            '--json',
+            help='Arquivo onde gravar o resultado'
+        )
+        parser.add_argument(
+            '--baseline',
+            help='Resultado JSON anterior a comparar; regressões encerram o comando com erro'
+        )
+        parser.add_argument(
+            '--tolerancia',
+            type=float,
+            default=20.0,
+            help='Aumento máximo, em %%, de p95 e memória em relação ao baseline (padrão: 20)'
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as arquivo:
+                baseline = json.load(arquivo)
+
+        try:
+            with transaction.atomic():
+                if not options['usar_banco']:
+                    self.stdout.write(f'Populando base sintética com {options["alunos"]} alunos...')
+                    call_command(
+                        'seed_database', bulk=True, clear=True,
+                        alunos=options['alunos'], seed=options['seed'], stdout=StringIO()
+                    )
+                resultado = self._medir(options)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+        self._exibir(resultado)
+        if options['json']:
+            with open(options['json'], 'w', encoding='utf-8') as arquivo:
+                json.dump(resultado, arquivo, ensure_ascii=False, indent=2)
+            self.stdout.write(f'Resultado gravado em {options["json"]}')
+
+        if baseline is not None:
+            regressoes = self._comparar(resultado, baseline, options['tolerancia'])
+            if regressoes:
+                raise CommandError(f'{regressoes} métrica(s) pioraram além da tolerância em relação ao baseline')
+
+        self.stdout.write(self.style.SUCCESS('✓ Benchmark concluído'))
+
+    # === Medição ===
+
+    def _registros(self):
+        registros = {
+            'aluno': Aluno.objects.filter(historico__isnull=False, turma_atual__isnull=False).order_by('pk').first(),
+            'professor': Professor.objects.filter(turmadisciplinaprofessor__isnull=False).order_by('pk').first(),
+            'secretaria': Secretaria.objects.order_by('pk').first(),
+            'coordenacao': Coordenacao.objects.order_by('pk').first(),
+        }
+        faltando = [papel for papel, registro in registros.items() if registro is None]
+        if faltando:
+            raise CommandError(f'Sem usuários para medir: {", ".join(faltando)}')
+        return registros
+
+    def _medir(self, options):
+        registros = self._registros()
+        clientes = {}
+        telas = {}
+        # O Client de teste usa o host 'testserver'
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            for tela, papel, rota, argumentos in TELAS:
+                if options['telas'] and tela not in options['telas']:
+                    continue
+                if papel not in clientes:
+                    clientes[papel] = Client()
+                    clientes[papel].force_login(registros[papel].user)
+                url = reverse(rota, args=argumentos(registros) if argumentos else None)
+                telas[tela] = medir_tela(clientes[papel], url, options['repeticoes'], options['aquecimento'])
+                self.stdout.write(f'  ✓ {tela}')
+
+        return {
+            'meta': {
+                'data': timezone.now().isoformat(timespec='seconds'),
+                'alunos': Aluno.objects.count(),
+                'seed': None if options['usar_banco'] else options['seed'],
+                'repeticoes': options['repeticoes'],
+                'banco': connection.vendor,
+                'django': django.get_version(),
+                'python': platform.python_version(),
+            },
+            'telas': telas,
+        }
+
+    # === Saída ===
+
+    def _exibir(self, resultado):
+        self.stdout.write(
+            f'\n{"tela":<24} | {"status":>6} | {"p50 (ms)":>9} | {"p95 (ms)":>9} | {"p99 (ms)":>9} | '
+            f'{"consultas":>9} | {"memória (KB)":>12}'
+        )
+        self.stdout.write('-' * 98)
+        for tela, m in resultado['telas'].items():
+            self.stdout.write(
+                f'{tela:<24} | {m["status"]:>6} | {m["p50_ms"]:>9.2f} | {m["p95_ms"]:>9.2f} | '
+                f'{m["p99_ms"]:>9.2f} | {m["consultas"]:>9} | {m["memoria_pico_kb"]:>12.1f}'
+            )
+
+    def _comparar(self, resultado, baseline, tolerancia):
+        linhas = comparar(resultado, baseline, tolerancia)
+        self.stdout.write(f'\nComparação com o baseline ({baseline["meta"]["data"]}, tolerância {tolerancia:.0f}%):')
+        self.stdout.write(f'{"tela":<24} | {"métrica":<15} | {"antes":>10} | {"depois":>10} | {"variação":>9}')
+        self.stdout.write('-' * 80)
+        for linha in linhas:
+            texto = (
+                f'{linha["tela"]:<24} | {linha["metrica"]:<15} | {linha["antes"]:>10} | '
+                f'{linha["depois"]:>10} | {linha["variacao"]:>8.1f}%'
+            )
+            self.stdout.write(self.style.ERROR(texto) if linha['regressao'] else texto)
+        return sum(linha['regressao'] for linha in linhas)
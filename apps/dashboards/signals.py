@@ -0,0 +1,20 @@
+"""
+Sinais que mantêm o cache das estatísticas institucionais coerente.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.academico.models import Aluno, Curso, Historico, Professor
+
+from .estatisticas import invalidar_estatisticas
+
+
+@receiver([post_save, post_delete], sender=Aluno)
+@receiver([post_save, post_delete], sender=Professor)
+@receiver([post_save, post_delete], sender=Curso)
+@receiver([post_save, post_delete], sender=Historico)
+def invalidar_estatisticas_institucionais(sender, **kwargs):
+    # Só invalida após o commit, para que nenhuma requisição concorrente
+    # guarde no cache os números anteriores à alteração
+    transaction.on_commit(invalidar_estatisticas)
@@ -0,0 +1,3 @@
+"""
+Package de testes da app dashboards.
+"""
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Testes do teste de carga das telas (benchmark_dashboards).
+"""
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from apps.academico.models import Aluno
+from apps.dashboards.benchmark import comparar, percentil
+
+
+class BenchmarkHelpersTests(TestCase):
+
+    def test_percentil_interpola(self):
+        valores = [10, 20, 30, 40, 50]
+        self.assertEqual(percentil(valores, 50), 30)
+        self.assertEqual(percentil(valores, 95), 48)
+        self.assertEqual(percentil([7], 99), 7)
+
+    def test_comparar_aplica_tolerancia(self):
+        baseline = {'telas': {'painel': {'p95_ms': 100, 'memoria_pico_kb': 200, 'consultas': 5}}}
+        atual = {'telas': {
+            'painel': {'p95_ms': 115, 'memoria_pico_kb': 300, 'consultas': 6},
+            'nova': {'p95_ms': 1, 'memoria_pico_kb': 1, 'consultas': 1},
+        }}
+        regressoes = {l['metrica'] for l in comparar(atual, baseline, tolerancia=20) if l['regressao']}
+        # Latência dentro da tolerância; memória acima; qualquer consulta a mais conta
+        self.assertEqual(regressoes, {'memoria_pico_kb', 'consultas'})
+
+
+class BenchmarkDashboardsCommandTests(TestCase):
+
+    def test_mede_telas_grava_json_e_descarta_base(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, 'resultado.json')
+            saida = StringIO()
+            call_command(
+                'benchmark_dashboards', alunos=20, repeticoes=2, aquecimento=0,
+                telas=['secretaria_dashboard', 'boletim', 'pdf_turma'], json=caminho, stdout=saida
+            )
+            with open(caminho, encoding='utf-8') as arquivo:
+                resultado = json.load(arquivo)
+
+            self.assertEqual(set(resultado['telas']), {'secretaria_dashboard', 'boletim', 'pdf_turma'})
+            for metricas in resultado['telas'].values():
+                self.assertEqual(metricas['status'], 200)
+                self.assertGreater(metricas['consultas'], 0)
+            self.assertEqual(resultado['meta']['alunos'], 20)
+            self.assertFalse(Aluno.objects.exists())
+
+            # Baseline com consultas a menos: o comando acusa a regressão
+            resultado['telas']['boletim']['consultas'] -= 1
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                json.dump(resultado, arquivo)
+            with self.assertRaises(CommandError):
+                call_command(
+                    'benchmark_dashboards', alunos=20, repeticoes=2, aquecimento=0,
+                    telas=['boletim'], baseline=caminho, stdout=StringIO()
+                )
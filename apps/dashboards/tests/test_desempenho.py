@@ -0,0 +1,166 @@
+"""
+Testes do painel de desempenho da coordenação.
+Garante que o número de consultas não cresce com a quantidade de alunos ou cursos.
+"""
+import json
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.academico.models import (
+    Aluno, Curso, Departamento, Disciplina, Historico, Professor, Turma, TurmaDisciplinaProfessor
+)
+from apps.academico.services import DesempenhoService
+from apps.usuarios.models import Profile
+from apps.usuarios.papeis import papeis_usuario
+
+
+class CoordenacaoTestBase(TestCase):
+    """Coordenador autenticado, um curso com duas turmas e uma disciplina."""
+
+    def setUp(self):
+        self.client = Client()
+        coordenador = User.objects.create_user(username='coord_test', password='senha123')
+        Profile.objects.create(user=coordenador, tipo='coordenacao')
+        self.client.force_login(coordenador)
+        # Papéis já em cache, como depois do primeiro acesso
+        papeis_usuario(coordenador)
+
+        departamento = Departamento.objects.create(nome_departamento='Tecnologia', cod_departamento='TEC')
+        self.curso = Curso.objects.create(
+            cod_curso='TADS', nome_curso='Análise e Desenvolvimento', carga_horaria_total=1600,
+            modalidade='Presencial', turno='Noturno', tipo='Técnico', cod_departamento=departamento
+        )
+        disciplina = Disciplina.objects.create(cod_disciplina='DISC001', nome='Lógica', carga_horaria=60)
+        professor = Professor.objects.create(user=User.objects.create_user(username='prof_test'))
+        self.turmas = []
+        self.alocacoes = []
+        for i in range(2):
+            turma = Turma.objects.create(
+                nome=f'TADS 2025/{i + 1}', periodo='Noturno', ano_letivo=2025,
+                data_inicio=date(2025, 2, 1), id_curso=self.curso
+            )
+            self.turmas.append(turma)
+            self.alocacoes.append(TurmaDisciplinaProfessor.objects.create(
+                turma=turma, disciplina=disciplina, professor=professor
+            ))
+        self.total_alunos = 0
+
+    def _criar_alunos(self, quantidade, media=8.0, frequencia=90.0):
+        ids = []
+        for _ in range(quantidade):
+            self.total_alunos += 1
+            indice = self.total_alunos % len(self.turmas)
+            user = User.objects.create_user(username=f'aluno_test_{self.total_alunos}', first_name='Aluno')
+            aluno = Aluno.objects.create(user=user, RA_aluno=f'RA{self.total_alunos:05d}', turma_atual=self.turmas[indice])
+            Historico.objects.create(
+                id_aluno=aluno, turma_disciplina_professor=self.alocacoes[indice],
+                media_final=media, nota_final=media, frequencia_percentual=frequencia,
+                periodo_realizacao='2025.1'
+            )
+            ids.append(aluno.pk)
+        DesempenhoService.recalcular(ids)
+
+
+class CoordenacaoDesempenhoQueryTests(CoordenacaoTestBase):
+    """Regressão de consultas do coordenacao_desempenho_view."""
+
+    def _contar_consultas(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('coordenacao_desempenho'))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), json.loads(response.context['desempenho_data_json'])
+
+    def test_consultas_constantes(self):
+        """O total de consultas é o mesmo com 3 ou 30 alunos."""
+        self._criar_alunos(3)
+        consultas_poucos, _ = self._contar_consultas()
+
+        self._criar_alunos(27)
+        Aluno.objects.create(user=User.objects.create_user(username='sem_historico'), RA_aluno='RA99999')
+        consultas_muitos, dados = self._contar_consultas()
+
+        self.assertEqual(consultas_poucos, consultas_muitos)
+        self.assertEqual(len(dados['alunos']), 31)
+
+    def test_classificacao_e_medias_por_turma(self):
+        """Situação dos alunos e médias das turmas batem com o histórico."""
+        self._criar_alunos(2, media=8.0, frequencia=90.0)
+        self._criar_alunos(2, media=6.0, frequencia=80.0)
+        self._criar_alunos(2, media=3.0, frequencia=90.0)
+
+        _, dados = self._contar_consultas()
+
+        self.assertEqual(dados['grafico_notas'], {'Aprovado': 2, 'Recuperação': 2, 'Reprovado': 2})
+        medias = {t['nome']: t['media_geral'] for t in dados['turmas']}
+        esperado = {
+            turma.nome: round(sum(h.media_final for h in Historico.objects.filter(turma_disciplina_professor__turma=turma)) /
+                              Historico.objects.filter(turma_disciplina_professor__turma=turma).count(), 1)
+            for turma in self.turmas
+        }
+        self.assertEqual(medias, esperado)
+
+
+class CoordenacaoDashboardComparativoTests(CoordenacaoTestBase):
+    """Comparativo por curso do coordenacao_dashboard_view."""
+
+    def _comparativo(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('coordenacao_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), json.loads(response.context['dashboard_data_json'])['grafico_comparativo']
+
+    def test_consultas_constantes(self):
+        """Novos cursos não acrescentam consultas ao painel."""
+        self._criar_alunos(3)
+        consultas_um_curso, _ = self._comparativo()
+
+        departamento = self.curso.cod_departamento
+        for i in range(5):
+            Curso.objects.create(
+                cod_curso=f'EXTRA{i}', nome_curso=f'Curso Extra {i}', carga_horaria_total=800,
+                modalidade='Presencial', turno='Manhã', tipo='Técnico', cod_departamento=departamento
+            )
+        consultas_seis_cursos, grafico = self._comparativo()
+
+        self.assertEqual(consultas_um_curso, consultas_seis_cursos)
+        self.assertEqual(len(grafico['labels']), 6)
+
+    def test_classificacao_por_curso(self):
+        """Aprovados, recuperação e reprovados seguem a média de cada aluno."""
+        self._criar_alunos(3, media=8.0)
+        self._criar_alunos(2, media=6.0)
+        self._criar_alunos(1, media=4.0)
+
+        _, grafico = self._comparativo()
+
+        indice = grafico['labels'].index(self.curso.nome_curso)
+        self.assertEqual(grafico['aprovados'][indice], 3)
+        self.assertEqual(grafico['recuperacao'][indice], 2)
+        self.assertEqual(grafico['reprovados'][indice], 1)
+
+    def test_cursos_com_o_mesmo_nome_nao_se_misturam(self):
+        """Cada curso tem sua barra, mesmo com nome repetido."""
+        self._criar_alunos(2, media=8.0)
+        homonimo = Curso.objects.create(
+            cod_curso='TADS2', nome_curso=self.curso.nome_curso, carga_horaria_total=1600,
+            modalidade='EAD', turno='Noturno', tipo='Técnico', cod_departamento=self.curso.cod_departamento
+        )
+        turma = Turma.objects.create(
+            nome='TADS EAD 2025/1', periodo='Noturno', ano_letivo=2025, data_inicio=date(2025, 2, 1), id_curso=homonimo
+        )
+        aluno = Aluno.objects.create(user=User.objects.create_user(username='aluno_ead'), RA_aluno='EAD00001', turma_atual=turma)
+        Historico.objects.create(
+            id_aluno=aluno, turma_disciplina_professor=self.alocacoes[0],
+            media_final=4.0, nota_final=4.0, frequencia_percentual=90.0, periodo_realizacao='2025.1'
+        )
+        DesempenhoService.recalcular([aluno.pk])
+
+        _, grafico = self._comparativo()
+
+        self.assertEqual(grafico['labels'], [self.curso.nome_curso, self.curso.nome_curso])
+        self.assertEqual(sorted(zip(grafico['aprovados'], grafico['reprovados'])), [(0, 1), (2, 0)])
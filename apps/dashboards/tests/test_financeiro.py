@@ -0,0 +1,85 @@
+"""
+Testes do controle financeiro da secretaria: indicadores calculados no banco
+e lançamentos servidos pela API paginada em vez de embutidos na página.
+"""
+import json
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.academico.models import Aluno
+from apps.core.paginacao import codificar_cursor
+from apps.payments.models import Pagamento
+from apps.usuarios.models import Profile
+from apps.usuarios.papeis import papeis_usuario
+
+
+class ControleFinanceiroTests(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        secretaria = User.objects.create_user(username='secretaria_test')
+        Profile.objects.create(user=secretaria, tipo='secretaria')
+        self.client.force_login(secretaria)
+        papeis_usuario(secretaria)
+
+        self.aluno = User.objects.create_user(username='aluno_fin', first_name='Maria', last_name='Souza')
+        self.outro = User.objects.create_user(username='aluno_outro', first_name='João')
+        Aluno.objects.create(user=self.aluno, RA_aluno='RA00001')
+        Aluno.objects.create(user=self.outro, RA_aluno='RA00002')
+        Pagamento.objects.bulk_create([
+            Pagamento(aluno=self.aluno, descricao='Mensalidade 1', valor='300.00', status='pago', periodo='2025-03'),
+            Pagamento(aluno=self.aluno, descricao='Mensalidade 2', valor='100.00', status='pendente', periodo='2025-04'),
+            Pagamento(aluno=self.outro, descricao='Taxa', valor='50.00', status='cancelado'),
+        ])
+
+    def _json(self, url=None, **params):
+        response = self.client.get(url or reverse('listar_pagamentos'), params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(b''.join(response.streaming_content))
+
+    def test_indicadores_nao_crescem_com_os_dados(self):
+        with CaptureQueriesContext(connection) as poucos:
+            response = self.client.get(reverse('controle_financeiro'))
+        self.assertEqual(response.context['kpi_recebido'], Decimal('300.00'))
+        self.assertEqual(response.context['kpi_pendente'], Decimal('100.00'))
+        self.assertEqual(response.context['kpi_inadimplencia'], Decimal('25.0'))
+        self.assertNotContains(response, 'Mensalidade 1')
+
+        Pagamento.objects.bulk_create(
+            Pagamento(aluno=self.outro, descricao=f'Extra {i}', valor='10.00') for i in range(30)
+        )
+        with CaptureQueriesContext(connection) as muitos:
+            response = self.client.get(reverse('controle_financeiro'))
+        self.assertEqual(len(poucos.captured_queries), len(muitos.captured_queries))
+        self.assertEqual(response.context['kpi_pendente'], Decimal('400.00'))
+
+    def test_lancamentos_paginados_do_mais_recente(self):
+        dados = self._json(limite=2)
+        descricoes = [p['descricao'] for p in dados['results']]
+        dados = self._json(dados['next'])
+        descricoes.extend(p['descricao'] for p in dados['results'])
+        self.assertEqual(descricoes, ['Taxa', 'Mensalidade 2', 'Mensalidade 1'])
+        self.assertIsNone(dados['next'])
+
+    def test_filtros(self):
+        self.assertEqual([p['descricao'] for p in self._json(status='pago')['results']], ['Mensalidade 1'])
+        self.assertEqual([p['descricao'] for p in self._json(periodo='2025-04')['results']], ['Mensalidade 2'])
+        self.assertEqual([p['aluno'] for p in self._json(aluno=self.outro.pk)['results']], ['João'])
+        self.assertEqual(len(self._json(q='souza')['results']), 2)
+        self.assertEqual([p['descricao'] for p in self._json(q='RA00002')['results']], ['Taxa'])
+
+        response = self.client.get(reverse('listar_pagamentos'), {'aluno': 'abc'})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(reverse('listar_pagamentos'), {'cursor': codificar_cursor(['abc'])})
+        self.assertEqual(response.status_code, 400)
+
+    def test_apenas_secretaria(self):
+        self.client.force_login(self.aluno)
+        response = self.client.get(reverse('listar_pagamentos'))
+        self.assertNotEqual(response.status_code, 200)
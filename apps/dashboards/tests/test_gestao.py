@@ -0,0 +1,87 @@
+"""
+Testes da gestão acadêmica da coordenação: a página não embute as listagens
+e as APIs paginadas respondem em número constante de consultas.
+"""
+import json
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.academico.models import Disciplina, Professor, TurmaDisciplinaProfessor
+
+from .test_desempenho import CoordenacaoTestBase
+
+
+class CoordenacaoGestaoTests(CoordenacaoTestBase):
+    """coordenacao_gestao_view e as listagens api/gestao/<entidade>/."""
+
+    def _json(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(b''.join(response.streaming_content))
+
+    def _consultas(self, url, **params):
+        with CaptureQueriesContext(connection) as ctx:
+            self._json(url, **params)
+        return len(ctx.captured_queries)
+
+    def test_pagina_nao_cresce_com_os_dados(self):
+        self._criar_alunos(2)
+        with CaptureQueriesContext(connection) as poucos:
+            response = self.client.get(reverse('coordenacao_gestao'))
+        tamanho_poucos = len(response.content)
+
+        self._criar_alunos(30)
+        with CaptureQueriesContext(connection) as muitos:
+            response = self.client.get(reverse('coordenacao_gestao'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(poucos.captured_queries), len(muitos.captured_queries))
+        self.assertEqual(tamanho_poucos, len(response.content))
+        self.assertNotContains(response, 'RA00001')
+
+    def test_alunos_paginados_e_busca(self):
+        self._criar_alunos(5)
+        url = reverse('listar_alunos_gestao')
+
+        dados = self._json(url, limite=2)
+        ids = [a['id'] for a in dados['results']]
+        while dados['next']:
+            dados = self._json(dados['next'])
+            ids.extend(a['id'] for a in dados['results'])
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(len(set(ids)), 5)
+
+        dados = self._json(url, q='RA00003')
+        self.assertEqual([a['matricula'] for a in dados['results']], ['RA00003'])
+        self.assertEqual(dados['results'][0]['turma_nome'], self.turmas[1].nome)
+
+    def test_professores_com_total_de_turmas(self):
+        """O total de turmas vem anotado: mais professores não geram mais consultas."""
+        url = reverse('listar_professores_gestao')
+        consultas_um = self._consultas(url)
+
+        disciplina = Disciplina.objects.create(cod_disciplina='DISC002', nome='Banco de Dados', carga_horaria=40)
+        for i in range(4):
+            professor = Professor.objects.create(
+                user=User.objects.create_user(username=f'prof_extra_{i}', first_name=f'Extra {i}')
+            )
+            if i == 0:
+                TurmaDisciplinaProfessor.objects.create(turma=self.turmas[0], disciplina=disciplina, professor=professor)
+        self.assertEqual(consultas_um, self._consultas(url))
+
+        turmas = {p['id']: p['turmas'] for p in self._json(url)['results']}
+        # prof_test leciona Lógica nas duas turmas do setUp
+        self.assertEqual(turmas[Professor.objects.get(user__username='prof_test').pk], 2)
+        self.assertEqual(turmas[Professor.objects.get(user__username='prof_extra_0').pk], 1)
+        self.assertEqual(turmas[Professor.objects.get(user__username='prof_extra_1').pk], 0)
+
+    def test_turmas_e_disciplinas(self):
+        turmas = self._json(reverse('listar_turmas_gestao'))['results']
+        self.assertEqual([t['codigo'] for t in turmas], [t.nome for t in self.turmas])
+        self.assertEqual(turmas[0]['data_inicio'], '2025-02-01')
+
+        disciplinas = self._json(reverse('listar_disciplinas_gestao'), q='lóg')['results']
+        self.assertEqual([d['codigo'] for d in disciplinas], ['DISC001'])
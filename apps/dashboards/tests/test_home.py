@@ -0,0 +1,45 @@
+"""
+Testes do cache de estatísticas institucionais da landing page.
+"""
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+
+from apps.academico.models import Professor
+from apps.core.testing import CACHE_TESTES
+
+
+@override_settings(CACHES=CACHE_TESTES)
+class HomeEstatisticasCacheTests(TestCase):
+    """A landing page anônima não consulta o banco com o cache aquecido."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_visita_com_cache_sem_consultas(self):
+        """Após a primeira visita, as seguintes não tocam o banco."""
+        self.client.get(reverse('home'))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('home'))
+        self.assertEqual(response.status_code, 200)
+
+    def test_alteracao_invalida_cache(self):
+        """Salvar ou excluir um modelo monitorado descarta os números em cache."""
+        response = self.client.get(reverse('home'))
+        self.assertEqual(response.context['total_professores'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            professor = Professor.objects.create(user=User.objects.create_user(username='prof_home'))
+        response = self.client.get(reverse('home'))
+        self.assertEqual(response.context['total_professores'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            professor.delete()
+        response = self.client.get(reverse('home'))
+        self.assertEqual(response.context['total_professores'], 0)
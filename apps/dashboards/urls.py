@@ -7,11 +7,17 @@ from .views import (
     coordenacao_dashboard_view,
     coordenacao_desempenho_view,
     coordenacao_gestao_view,
+    listar_alunos_gestao_view,
+    autocomplete_alunos_view,
+    listar_turmas_gestao_view,
+    listar_professores_gestao_view,
+    listar_disciplinas_gestao_view,
     coordenacao_comunicacao_view,
     coordenacao_relatorios_view,
     coordenacao_aprovacao_view,
     gestao_alunos_view,
     controle_financeiro_view,
+    listar_pagamentos_view,
     gestao_documentos_view,
     comunicacao_secretaria_view,
     perfil_view,
@@ -60,6 +66,13 @@ urlpatterns = [
     # 4. APIS DE GESTÃO ACADÊMICA (CRUD COMPLETO)
     # ========================================================
     
+    # Listagens paginadas (carregadas sob demanda pela tela de gestão)
+    path('api/gestao/alunos/', listar_alunos_gestao_view, name='listar_alunos_gestao'),
+    path('api/gestao/alunos/busca/', autocomplete_alunos_view, name='autocomplete_alunos'),
+    path('api/gestao/turmas/', listar_turmas_gestao_view, name='listar_turmas_gestao'),
+    path('api/gestao/professores/', listar_professores_gestao_view, name='listar_professores_gestao'),
+    path('api/gestao/disciplinas/', listar_disciplinas_gestao_view, name='listar_disciplinas_gestao'),
+
     # Alunos
     path('api/gestao/aluno/save/', save_aluno_view, name='save_aluno'),
     path('api/gestao/aluno/delete/<int:pk>/', delete_aluno_view, name='delete_aluno'),
@@ -90,6 +103,7 @@ urlpatterns = [
     path('gestao/alunos/', gestao_alunos_view, name='gestao_alunos'),
     path('gestao/documentos/', gestao_documentos_view, name='gestao_documentos'),
     path('controle/financeiro/', controle_financeiro_view, name='controle_financeiro'),
+    path('api/financeiro/pagamentos/', listar_pagamentos_view, name='listar_pagamentos'),
     path('comunicacao/secretaria/', comunicacao_secretaria_view, name='comunicacao_secretaria'),
 
     # ========================================================
@@ -16,22 +16,31 @@ from django.urls import reverse
 import os
 
 # Imports dos modelos
+from apps.academico import grading
+from apps.academico.busca import buscar_alunos, condicao_busca
+from apps.academico.filtros import filtrar_alunos
+from apps.core.paginacao import ParametroInvalido, ler_limite, paginar, resposta_paginada
 from apps.academico.models import (
     Turma, Aluno, Professor, Secretaria, Coordenacao, 
-    Historico, Curso, TurmaDisciplinaProfessor, Disciplina
+    Historico, Curso, TurmaDisciplinaProfessor, Disciplina, DesempenhoAluno
 )
+from apps.academico.services import DesempenhoService
+from apps.dashboards.estatisticas import obter_estatisticas
 from apps.usuarios.models import Profile, PendingRegistration
+from apps.usuarios.papeis import papeis_request, papeis_usuario
 from apps.payments.models import Pagamento
+from apps.payments.services.financeiro_service import FinanceiroService
 from apps.relatorios.models import DocumentoEmitido
 
 # =============================================================================
 # 1. DECORATORS E PERMISSÕES
 # =============================================================================
 
-def isaluno(user): return user.is_authenticated and hasattr(user, 'profile') and user.profile.tipo == 'aluno'
-def isprofessor(user): return user.is_authenticated and hasattr(user, 'profile') and user.profile.tipo == 'professor'
-def issecretaria(user): return user.is_authenticated and hasattr(user, 'profile') and user.profile.tipo == 'secretaria'
-def iscoordenacao(user): return user.is_authenticated and hasattr(user, 'profile') and user.profile.tipo == 'coordenacao'
+# Papéis resolvidos uma vez por requisição e guardados em cache (apps/usuarios/papeis.py)
+def isaluno(user): return 'aluno' in papeis_usuario(user)
+def isprofessor(user): return 'professor' in papeis_usuario(user)
+def issecretaria(user): return 'secretaria' in papeis_usuario(user)
+def iscoordenacao(user): return 'coordenacao' in papeis_usuario(user)
 
 def rolerequired(*roles):
     """
@@ -40,15 +49,9 @@ def rolerequired(*roles):
     def decorator(view_func):
         @login_required
         def wrapper(request, *args, **kwargs):
-            userroles = []
-            if isaluno(request.user): userroles.append("aluno")
-            if isprofessor(request.user): userroles.append("professor")
-            if issecretaria(request.user): userroles.append("secretaria")
-            if iscoordenacao(request.user): userroles.append("coordenacao")
-            
             if request.user.is_superuser: return view_func(request, *args, **kwargs)
 
-            if not any(role in userroles for role in roles):
+            if papeis_request(request).isdisjoint(roles):
                 messages.error(request, "Acesso negado.")
                 return redirect('home')
             return view_func(request, *args, **kwargs)
@@ -71,25 +74,9 @@ def home(request):
         elif issecretaria(request.user): return redirect('secretaria_dashboard')
         elif iscoordenacao(request.user): return redirect('coordenacao_dashboard')
     
-    # Lógica adicionada para recuperar os dados do Dashboard Institucional
-    total_alunos = Aluno.objects.count()
-    total_professores = Professor.objects.count()
-    total_cursos = Curso.objects.count()
+    # Estatísticas do Dashboard Institucional (em cache, ver estatisticas.py)
+    context = obter_estatisticas()
 
-    # Cálculo da taxa de aprovação (Baseado em históricos com média >= 6.0)
-    historicos_validos = Historico.objects.exclude(media_final__isnull=True)
-    total_notas = historicos_validos.count()
-    aprovacoes = historicos_validos.filter(media_final__gte=6.0).count()
-    
-    taxa_aprovacao = (aprovacoes / total_notas * 100) if total_notas > 0 else 0
-    
-    context = {
-        'total_alunos': total_alunos,
-        'total_professores': total_professores,
-        'total_cursos': total_cursos,
-        'taxa_aprovacao': taxa_aprovacao
-    }
-    
     return render(request, "home.html", context)
 
 # =============================================================================
@@ -164,20 +151,7 @@ def gestao_alunos_view(request):
     filter_turma = request.GET.get('turma')
     filter_status = request.GET.get('status')
 
-    if search_query and search_query != 'None':
-        alunos_qs = alunos_qs.filter(
-            Q(user__first_name__icontains=search_query) |
-            Q(user__last_name__icontains=search_query) |
-            Q(RA_aluno__icontains=search_query) |
-            Q(user__email__icontains=search_query)
-        )
-    
-    if filter_turma and filter_turma != 'todas' and filter_turma != 'None':
-        if filter_turma.isdigit():
-            alunos_qs = alunos_qs.filter(turma_atual__id=filter_turma)
-        
-    if filter_status and filter_status != 'todos' and filter_status != 'None':
-        alunos_qs = alunos_qs.filter(status_matricula=filter_status)
+    alunos_qs = filtrar_alunos(alunos_qs, busca=search_query, turma=filter_turma, status=filter_status)
 
     total_alunos = alunos_qs.count()
     turmas_disponiveis = Turma.objects.all().order_by('nome')
@@ -187,7 +161,7 @@ def gestao_alunos_view(request):
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
-    pode_editar = (getattr(request.user.profile, 'tipo', '') == 'coordenacao')
+    pode_editar = 'coordenacao' in papeis_request(request)
 
     context = {
         'page_obj': page_obj,
@@ -229,8 +203,8 @@ def professor_dashboard_view(request):
         nota = float(hist.media_final) if hist.media_final is not None else 0.0
         freq = float(hist.frequencia_percentual) if hist.frequencia_percentual is not None else 0.0
 
-        if nota < 6.0: motivo.append(f"Nota: {nota}")
-        if freq < 75.0: motivo.append(f"Freq: {freq:.0f}%")
+        if nota < grading.NOTA_APROVACAO: motivo.append(f"Nota: {nota}")
+        if freq < grading.FREQUENCIA_MINIMA: motivo.append(f"Freq: {freq:.0f}%")
         
         if motivo:
             alunos_risco_list.append({
@@ -302,62 +276,39 @@ def coordenacao_dashboard_view(request):
     total_professores = Professor.objects.count()
     total_turmas = Turma.objects.count()
     
-    student_stats = Historico.objects.filter(id_aluno__status_matricula='Ativo').values('id_aluno').annotate(
-        avg_media=Avg('media_final'),
-        avg_freq=Avg('frequencia_percentual')
+    resumos = DesempenhoAluno.objects.filter(aluno__status_matricula='Ativo').values(
+        'media', 'frequencia', 'faixa_risco', 'aluno__user__first_name', 'aluno__user__last_name'
     )
 
-    student_ids = [s['id_aluno'] for s in student_stats]
-    alunos_objs = Aluno.objects.select_related('user').filter(user__id__in=student_ids)
-    aluno_name_map = {a.user.id: a.user.get_full_name() for a in alunos_objs}
-
     scatter_data = {'bom': [], 'atencao': [], 'risco': []}
-    risco_ids = set()
-
-    for s in student_stats:
-        aluno_id = s['id_aluno']
-        media = float(s['avg_media'] or 0.0)
-        freq = float(s['avg_freq'] or 0.0)
-        ponto = {'x': round(freq, 1), 'y': round(media, 1), 'aluno': aluno_name_map.get(aluno_id, '')}
-
-        if media >= 7.0 and freq >= 85.0:
-            scatter_data['bom'].append(ponto)
-        elif media < 5.0 or freq < 75.0:
-            scatter_data['risco'].append(ponto)
-            risco_ids.add(aluno_id)
-        else:
-            scatter_data['atencao'].append(ponto)
+
+    for r in resumos:
+        nome = f"{r['aluno__user__first_name']} {r['aluno__user__last_name']}".strip()
+        ponto = {'x': round(float(r['frequencia'] or 0.0), 1), 'y': round(float(r['media'] or 0.0), 1), 'aluno': nome}
+        scatter_data[r['faixa_risco']].append(ponto)
 
     atividades = [
         {'texto': 'Análise de desempenho global iniciada', 'data': 'Hoje'},
         {'texto': 'Conselho de classe agendado', 'data': 'Ontem'}
     ]
 
-    count_risco = len(risco_ids)
+    count_risco = len(scatter_data['risco'])
+
+    # Comparativo por curso: agregação condicional sobre o resumo de desempenho,
+    # todos os cursos em uma única consulta
+    media_boa, media_risco = DesempenhoService.MEDIA_BOA, DesempenhoService.MEDIA_RISCO
+    cursos = Curso.objects.order_by('nome_curso', 'pk').values('pk', 'nome_curso').annotate(
+        aprovados=Count('desempenhos', filter=Q(desempenhos__media__gte=media_boa)),
+        recuperacao=Count('desempenhos', filter=Q(desempenhos__media__gte=media_risco, desempenhos__media__lt=media_boa)),
+        reprovados=Count('desempenhos', filter=Q(desempenhos__media__lt=media_risco) | Q(desempenhos__media__isnull=True)),
+    )
 
     grafico_comparativo = {'labels': [], 'aprovados': [], 'recuperacao': [], 'reprovados': []}
-    cursos = Curso.objects.all().order_by('nome_curso')
     for curso in cursos:
-        grafico_comparativo['labels'].append(curso.nome_curso)
-        alunos_no_curso = Aluno.objects.filter(turma_atual__id_curso=curso).select_related('user')
-        alunos_ids = [a.user.id for a in alunos_no_curso]
-        if not alunos_ids:
-            grafico_comparativo['aprovados'].append(0)
-            grafico_comparativo['recuperacao'].append(0)
-            grafico_comparativo['reprovados'].append(0)
-            continue
-
-        stats = Historico.objects.filter(id_aluno__user__id__in=alunos_ids).values('id_aluno').annotate(avg_media=Avg('media_final'))
-        apro=rec=rep=0
-        for st in stats:
-            m = float(st['avg_media'] or 0)
-            if m >= 7.0: apro += 1
-            elif m >= 5.0: rec += 1
-            else: rep += 1
-
-        grafico_comparativo['aprovados'].append(apro)
-        grafico_comparativo['recuperacao'].append(rec)
-        grafico_comparativo['reprovados'].append(rep)
+        grafico_comparativo['labels'].append(curso['nome_curso'])
+        grafico_comparativo['aprovados'].append(curso['aprovados'])
+        grafico_comparativo['recuperacao'].append(curso['recuperacao'])
+        grafico_comparativo['reprovados'].append(curso['reprovados'])
 
     context.update({
         'total_alunos': total_alunos,
@@ -405,8 +356,8 @@ def aluno_dashboard_view(request):
         chart_data.append(round(nota, 1))
 
         cor = 'success'
-        if nota < 6.0: cor = 'danger'
-        elif nota < 7.0: cor = 'warning'
+        if nota < grading.NOTA_APROVACAO: cor = 'danger'
+        elif nota < grading.MEDIA_BOA: cor = 'warning'
         
         prof_nome = 'N/A'
         try:
@@ -446,11 +397,7 @@ def gestao_documentos_view(request):
     documentos = DocumentoEmitido.objects.select_related('aluno__user', 'solicitante').all()
     search_query = request.GET.get('q')
     if search_query:
-        documentos = documentos.filter(
-            Q(aluno__user__first_name__icontains=search_query) |
-            Q(aluno__user__last_name__icontains=search_query) |
-            Q(aluno__RA_aluno__icontains=search_query)
-        )
+        documentos = documentos.filter(condicao_busca(search_query, campo='aluno'))
     documentos = documentos[:50]
     alunos = Aluno.objects.select_related('user').all().order_by('user__first_name')
     context = {'documentos': documentos, 'alunos': alunos, 'search_query': search_query}
@@ -458,26 +405,61 @@ def gestao_documentos_view(request):
 
 @rolerequired("secretaria")
 def controle_financeiro_view(request):
-    pagamentos = Pagamento.objects.select_related('aluno').all().order_by('-data_criacao')
-    recebido = pagamentos.filter(status='pago').aggregate(total=Sum('valor'))['total'] or 0
-    pendente = pagamentos.filter(status='pendente').aggregate(total=Sum('valor'))['total'] or 0
-    
-    total_geral = recebido + pendente
-    kpi_inadimplencia = (pendente / total_geral * 100) if total_geral > 0 else 0
-
+    """
+    Controle financeiro da secretaria. Os indicadores saem de uma única
+    agregação; os lançamentos são carregados pela página, paginados, pela
+    API listar_pagamentos, e o aluno do novo lançamento é escolhido pelo
+    autocompletar (autocomplete_alunos).
+    """
+    indicadores = FinanceiroService.indicadores()
     context = {
-        'pagamentos': pagamentos,
-        'kpi_recebido': recebido,
-        'kpi_pendente': pendente,
-        'kpi_inadimplencia': round(kpi_inadimplencia, 1),
-        'alunos_para_select': Aluno.objects.select_related('user').all()
+        'kpi_recebido': indicadores['recebido'],
+        'kpi_pendente': indicadores['pendente'],
+        'kpi_inadimplencia': indicadores['inadimplencia'],
+        'status_pagamento': Pagamento.STATUS_CHOICES,
     }
     return render(request, "dashboards/controle_financeiro.html", context)
 
+@rolerequired("secretaria")
+def listar_pagamentos_view(request):
+    """
+    Lançamentos do controle financeiro, dos mais recentes para os mais
+    antigos. Filtros: ?status=, ?periodo= (AAAA-MM), ?aluno= (id) e ?q=
+    (nome, RA ou e-mail do aluno); paginação por ?cursor= e ?limite=.
+    """
+    pagamentos = Pagamento.objects.all()
+    if request.GET.get('status'):
+        pagamentos = pagamentos.filter(status=request.GET['status'])
+    if request.GET.get('periodo'):
+        pagamentos = pagamentos.filter(periodo=request.GET['periodo'])
+    if request.GET.get('aluno'):
+        if not request.GET['aluno'].isdigit():
+            return JsonResponse({'error': 'Aluno inválido'}, status=400)
+        pagamentos = pagamentos.filter(aluno_id=request.GET['aluno'])
+    if request.GET.get('q'):
+        # Aluno.pk é o próprio id do usuário, que é a FK do pagamento
+        pagamentos = pagamentos.filter(condicao_busca(request.GET['q'], campo='aluno'))
+
+    pagamentos = pagamentos.values(
+        'pk', 'aluno__first_name', 'aluno__last_name', 'aluno__username', 'descricao',
+        'aluno__aluno__turma_atual__id_curso__nome_curso', 'data_criacao', 'valor', 'status', 'periodo'
+    )
+    # O pk acompanha a ordem de criação e, ao contrário da data, é único
+    return _listagem_gestao(request, pagamentos, ('-pk',), lambda p: {
+        'id': p['pk'],
+        'aluno': f"{p['aluno__first_name']} {p['aluno__last_name']}".strip() or p['aluno__username'],
+        'descricao': p['descricao'],
+        'curso': p['aluno__aluno__turma_atual__id_curso__nome_curso'] or '-',
+        'data': p['data_criacao'].strftime('%d/%m/%Y'),
+        'valor': p['valor'],
+        'status': p['status'],
+        'periodo': p['periodo'] or '',
+    })
+
 @rolerequired("aluno")
 def aluno_financeiro_view(request):
     pagamentos = Pagamento.objects.filter(aluno=request.user).order_by('-data_criacao')
-    total = sum(p.valor for p in pagamentos.filter(status='pendente'))
+    total = pagamentos.filter(status='pendente').aggregate(total=Sum('valor'))['total'] or 0
     context = {'pagamentos': pagamentos, 'total_pendente': total}
     return render(request, "dashboards/aluno_financeiro.html", context)
 
@@ -624,7 +606,11 @@ def perfil_view(request):
 @rolerequired("coordenacao")
 def coordenacao_desempenho_view(request):
     # --- 1. Dados das Turmas e Gráfico de Frequência ---
-    turmas_qs = Turma.objects.all()
+    # Uma única consulta agrupada por turma (média e frequência de todo o histórico)
+    turmas_qs = Turma.objects.order_by('pk').values('nome', 'alunos_matriculados').annotate(
+        media_t=Avg('turmadisciplinaprofessor__historico__media_final'),
+        freq_t=Avg('turmadisciplinaprofessor__historico__frequencia_percentual')
+    )
     turmas_data = []
     
     # Listas para o gráfico de frequência (Barras)
@@ -632,28 +618,25 @@ def coordenacao_desempenho_view(request):
     freq_values = []
 
     for t in turmas_qs:
-        # Calcula média e frequência agregada da turma
-        stats = Historico.objects.filter(turma_disciplina_professor__turma=t).aggregate(
-            media_t=Avg('media_final'),
-            freq_t=Avg('frequencia_percentual')
-        )
-        
-        media_t = stats['media_t'] or 0
-        freq_t = stats['freq_t'] or 0
-        alunos_count = t.alunos_matriculados 
+        media_t = t['media_t'] or 0
+        freq_t = t['freq_t'] or 0
 
         turmas_data.append({
-            'codigo': t.nome,
-            'alunos': alunos_count,
-            'nome': t.nome, 
+            'codigo': t['nome'],
+            'alunos': t['alunos_matriculados'],
+            'nome': t['nome'], 
             'media_geral': round(media_t, 1)
         })
 
-        freq_labels.append(t.nome)
+        freq_labels.append(t['nome'])
         freq_values.append(round(freq_t, 1))
 
     # --- 2. Dados dos Alunos e Gráfico de Notas ---
-    alunos_qs = Aluno.objects.select_related('user', 'turma_atual').all()
+    # Uma única consulta: aluno + resumo pré-calculado (LEFT JOIN em DesempenhoAluno)
+    alunos_qs = Aluno.objects.values(
+        'RA_aluno', 'user__first_name', 'user__last_name', 'turma_atual__nome',
+        'desempenho__media', 'desempenho__frequencia', 'desempenho__total_registros'
+    )
     alunos_data = []
     
     status_counts = {
@@ -662,35 +645,21 @@ def coordenacao_desempenho_view(request):
         'Reprovado': 0
     }
 
-    for aluno in alunos_qs:
-        hists = Historico.objects.filter(id_aluno=aluno)
-        
-        if not hists.exists():
+    for a in alunos_qs:
+        if a['desempenho__total_registros'] is None:
             media_a = 0.0
             freq_a = 0.0
             situacao = 'Cursando' 
         else:
-            agg = hists.aggregate(
-                media_a=Avg('media_final'),
-                freq_a=Avg('frequencia_percentual')
-            )
-            media_a = float(agg['media_a'] or 0.0)
-            freq_a = float(agg['freq_a'] or 0.0)
-            
-            if media_a >= 7.0 and freq_a >= 75.0:
-                situacao = 'Aprovado'
-                status_counts['Aprovado'] += 1
-            elif media_a < 5.0 or freq_a < 75.0:
-                situacao = 'Reprovado'
-                status_counts['Reprovado'] += 1
-            else:
-                situacao = 'Recuperação'
-                status_counts['Recuperação'] += 1
+            media_a = float(a['desempenho__media'] or 0.0)
+            freq_a = float(a['desempenho__frequencia'] or 0.0)
+            situacao = DesempenhoService.classificar_situacao(media_a, freq_a)
+            status_counts[situacao] += 1
 
         alunos_data.append({
-            'nome': aluno.user.get_full_name(),
-            'matricula': aluno.RA_aluno,
-            'turma': aluno.turma_atual.nome if aluno.turma_atual else 'Sem Turma',
+            'nome': f"{a['user__first_name']} {a['user__last_name']}".strip(),
+            'matricula': a['RA_aluno'],
+            'turma': a['turma_atual__nome'] or 'Sem Turma',
             'media': round(media_a, 1),
             'frequencia': round(freq_a, 1),
             'situacao': situacao
@@ -713,70 +682,13 @@ def coordenacao_desempenho_view(request):
 def coordenacao_gestao_view(request):
     """
     Dashboard de Gestão Acadêmica.
-    Agora prepara dados completos para manipulação via Modal/API.
+    Alunos, turmas, professores e disciplinas são carregados pela página sob
+    demanda, paginados, pelas APIs de listagem abaixo (api/gestao/<entidade>/).
     """
-    
-    # 1. ALUNOS
-    alunos_qs = Aluno.objects.select_related('user', 'turma_atual').all().order_by('user__first_name')
-    alunos_json = []
-    for a in alunos_qs:
-        alunos_json.append({
-            'id': a.pk,
-            'nome': a.user.get_full_name(),
-            'email': a.user.email,
-            'matricula': a.RA_aluno,
-            'turma_id': a.turma_atual.pk if a.turma_atual else '',
-            'turma_nome': a.turma_atual.nome if a.turma_atual else 'Sem Turma',
-            'status': a.status_matricula
-        })
-
-    # 2. TURMAS
-    turmas_qs = Turma.objects.select_related('id_curso').all().order_by('nome')
-    turmas_json = []
-    for t in turmas_qs:
-        turmas_json.append({
-            'id': t.pk,
-            'codigo': t.nome,
-            'curso_id': t.id_curso.pk,
-            'curso_nome': t.id_curso.nome_curso,
-            'matriculados': t.alunos_matriculados,
-            'vagas': t.capacidade_maxima,
-            'data_inicio': t.data_inicio.strftime('%Y-%m-%d') if t.data_inicio else '',
-            'data_fim': t.data_fim.strftime('%Y-%m-%d') if t.data_fim else ''
-        })
-    
-    # 3. PROFESSORES
-    professores_qs = Professor.objects.select_related('user').all()
-    professores_json = []
-    for p in professores_qs:
-        qtd_turmas = TurmaDisciplinaProfessor.objects.filter(professor=p).values('turma').distinct().count()
-        professores_json.append({
-            'id': p.pk,
-            'nome': p.user.get_full_name(),
-            'email': p.user.email,
-            'registro': p.registro_funcional or '',
-            'turmas': qtd_turmas
-        })
-
-    # 4. DISCIPLINAS
-    disciplinas_qs = Disciplina.objects.all().order_by('nome')
-    disciplinas_json = []
-    for d in disciplinas_qs:
-        disciplinas_json.append({
-            'id': d.pk,
-            'codigo': d.cod_disciplina,
-            'nome': d.nome,
-            'carga_horaria': d.carga_horaria
-        })
-
-    # Listas Auxiliares
-    cursos_list = list(Curso.objects.values('id', 'nome_curso'))
+    # Lista auxiliar (pequena) usada no modal de turmas
+    cursos_list = list(Curso.objects.order_by('nome_curso').values('id', 'nome_curso'))
 
     context = {
-        'alunos_json': json.dumps(alunos_json, cls=DjangoJSONEncoder),
-        'turmas_json': json.dumps(turmas_json, cls=DjangoJSONEncoder),
-        'professores_json': json.dumps(professores_json, cls=DjangoJSONEncoder),
-        'disciplinas_json': json.dumps(disciplinas_json, cls=DjangoJSONEncoder),
         'cursos_json': json.dumps(cursos_list, cls=DjangoJSONEncoder)
     }
     
@@ -786,6 +698,108 @@ def coordenacao_gestao_view(request):
 # 7. APIS PARA GESTÃO (CRUD)
 # =============================================================================
 
+def _listagem_gestao(request, queryset, ordenacao, serializar):
+    """
+    Página JSON de uma listagem da gestão: ?cursor= e ?limite= (paginação
+    por chave, ver apps/core/paginacao.py). `queryset` é um .values().
+    """
+    try:
+        linhas, proximo = paginar(
+            queryset, ordenacao, cursor=request.GET.get('cursor'), limite=ler_limite(request.GET.get('limite'))
+        )
+    except ParametroInvalido as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    return resposta_paginada(request, (serializar(linha) for linha in linhas), proximo)
+
+
+@rolerequired("coordenacao")
+def listar_alunos_gestao_view(request):
+    alunos = filtrar_alunos(Aluno.objects.all(), busca=request.GET.get('q')).values(
+        'pk', 'user__first_name', 'user__last_name', 'user__email', 'RA_aluno',
+        'turma_atual_id', 'turma_atual__nome', 'status_matricula'
+    )
+    return _listagem_gestao(request, alunos, ('user__first_name', 'pk'), lambda a: {
+        'id': a['pk'],
+        'nome': f"{a['user__first_name']} {a['user__last_name']}".strip(),
+        'email': a['user__email'],
+        'matricula': a['RA_aluno'],
+        'turma_id': a['turma_atual_id'] or '',
+        'turma_nome': a['turma_atual__nome'] or 'Sem Turma',
+        'status': a['status_matricula'],
+    })
+
+
+@rolerequired("secretaria", "coordenacao")
+def autocomplete_alunos_view(request):
+    """Sugestões de alunos enquanto se digita (?q=, ?limite= até 50)."""
+    try:
+        limite = max(1, min(int(request.GET.get('limite', 10)), 50))
+    except ValueError:
+        return JsonResponse({'error': 'Limite inválido'}, status=400)
+    return JsonResponse({'results': buscar_alunos(request.GET.get('q', ''), limite)})
+
+
+@rolerequired("coordenacao")
+def listar_turmas_gestao_view(request):
+    turmas = Turma.objects.all()
+    busca = request.GET.get('q')
+    if busca:
+        turmas = turmas.filter(Q(nome__icontains=busca) | Q(id_curso__nome_curso__icontains=busca))
+    turmas = turmas.values(
+        'pk', 'nome', 'id_curso_id', 'id_curso__nome_curso', 'alunos_matriculados',
+        'capacidade_maxima', 'data_inicio', 'data_fim'
+    )
+    return _listagem_gestao(request, turmas, ('nome', 'pk'), lambda t: {
+        'id': t['pk'],
+        'codigo': t['nome'],
+        'curso_id': t['id_curso_id'],
+        'curso_nome': t['id_curso__nome_curso'],
+        'matriculados': t['alunos_matriculados'],
+        'vagas': t['capacidade_maxima'],
+        'data_inicio': t['data_inicio'].strftime('%Y-%m-%d') if t['data_inicio'] else '',
+        'data_fim': t['data_fim'].strftime('%Y-%m-%d') if t['data_fim'] else '',
+    })
+
+
+@rolerequired("coordenacao")
+def listar_professores_gestao_view(request):
+    professores = Professor.objects.all()
+    busca = request.GET.get('q')
+    if busca:
+        professores = professores.filter(
+            Q(user__first_name__icontains=busca) |
+            Q(user__last_name__icontains=busca) |
+            Q(user__email__icontains=busca) |
+            Q(registro_funcional__icontains=busca)
+        )
+    # Quantidade de turmas de cada professor na mesma consulta
+    professores = professores.annotate(
+        qtd_turmas=Count('turmadisciplinaprofessor__turma', distinct=True)
+    ).values('pk', 'user__first_name', 'user__last_name', 'user__email', 'registro_funcional', 'qtd_turmas')
+    return _listagem_gestao(request, professores, ('user__first_name', 'pk'), lambda p: {
+        'id': p['pk'],
+        'nome': f"{p['user__first_name']} {p['user__last_name']}".strip(),
+        'email': p['user__email'],
+        'registro': p['registro_funcional'] or '',
+        'turmas': p['qtd_turmas'],
+    })
+
+
+@rolerequired("coordenacao")
+def listar_disciplinas_gestao_view(request):
+    disciplinas = Disciplina.objects.all()
+    busca = request.GET.get('q')
+    if busca:
+        disciplinas = disciplinas.filter(Q(nome__icontains=busca) | Q(cod_disciplina__icontains=busca))
+    disciplinas = disciplinas.values('pk', 'cod_disciplina', 'nome', 'carga_horaria')
+    return _listagem_gestao(request, disciplinas, ('nome', 'pk'), lambda d: {
+        'id': d['pk'],
+        'codigo': d['cod_disciplina'],
+        'nome': d['nome'],
+        'carga_horaria': d['carga_horaria'],
+    })
+
+
 # --- ALUNO ---
 @require_http_methods(["POST"])
 @login_required
@@ -885,6 +899,8 @@ def save_turma_view(request):
 
         if turma_id:
             Turma.objects.filter(pk=turma_id).update(**defaults)
+            # update() não dispara post_save: mantém o curso do resumo de desempenho
+            DesempenhoAluno.objects.filter(turma_id=turma_id).update(curso=curso)
             msg = "Turma atualizada."
         else:
             Turma.objects.create(**defaults)
@@ -0,0 +1,7 @@
+from django.contrib import admin
+
+from .models import BillingRun, FinanceiroSnapshot, ModeloCobranca
+
+admin.site.register(ModeloCobranca)
+admin.site.register(BillingRun)
+admin.site.register(FinanceiroSnapshot)
@@ -0,0 +1,121 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from apps.dashboards.benchmark import PERCENTIS, percentil
+from apps.payments.models import Pagamento
+
+BACKEND_FALSO = 'apps.payments.services.stripe_fake.FakeStripeBackend'
+
+
+class _Rollback(Exception):
+    """Usada para desfazer os dados sintéticos ao final do benchmark."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede iniciar_pagamento com cliques repetidos no mesmo pagamento (duplo clique, '
+        'recarregar), com e sem reaproveitar a sessão de checkout salva. Por padrão usa o '
+        'backend falso do Stripe com latência simulada, sem rede. Tudo é desfeito ao final.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pagamentos',
+            type=int,
+            default=50,
+            help='Pagamentos pendentes a abrir (padrão: 50)'
+        )
+        parser.add_argument(
+            '--cliques',
+            type=int,
+            default=3,
+            help='Requisições por pagamento (padrão: 3)'
+        )
+        parser.add_argument(
+            '--latencia',
+            type=float,
+            default=300.0,
+            help='Latência simulada do Stripe, em ms, no backend falso (padrão: 300)'
+        )
+        parser.add_argument(
+            '--backend',
+            default=BACKEND_FALSO,
+            help='Backend do Stripe (padrão: o falso). Com o da API, use --api-base para apontar a um stripe-mock'
+        )
+        parser.add_argument(
+            '--api-base',
+            default=None,
+            help='Endereço da API do Stripe a usar (ex.: http://localhost:12111)'
+        )
+
+    def handle(self, *args, **options):
+        ajustes = {
+            'STRIPE_BACKEND': options['backend'],
+            'STRIPE_FAKE_LATENCIA_MS': options['latencia'],
+            'ALLOWED_HOSTS': [*settings.ALLOWED_HOSTS, 'testserver'],
+        }
+        if options['api_base']:
+            ajustes['STRIPE_API_BASE'] = options['api_base']
+
+        resultados = {}
+        with override_settings(**ajustes):
+            for modo, reaproveitar in (('sem reuso', False), ('com reuso', True)):
+                resultados[modo] = self._executar(options, reaproveitar)
+                self.stdout.write(f'  ✓ {modo}')
+
+        self._exibir(resultados)
+        self.stdout.write(self.style.SUCCESS('✓ Benchmark concluído'))
+
+    def _executar(self, options, reaproveitar):
+        primeiros, repetidos = [], []
+        sessoes_criadas = 0
+        try:
+            with transaction.atomic():
+                aluno = User.objects.create_user(username='benchmark_checkout', email='aluno@example.com')
+                Pagamento.objects.bulk_create(
+                    Pagamento(aluno=aluno, descricao=f'Mensalidade {i}', valor='150.00')
+                    for i in range(options['pagamentos'])
+                )
+                client = Client()
+                client.force_login(aluno)
+
+                for pagamento in Pagamento.objects.filter(aluno=aluno):
+                    url = reverse('iniciar_pagamento', args=[pagamento.pk])
+                    sessao_anterior = None
+                    for clique in range(options['cliques']):
+                        if not reaproveitar:
+                            # Comportamento anterior: toda requisição abria uma sessão nova
+                            Pagamento.objects.filter(pk=pagamento.pk).update(
+                                stripe_checkout_url=None, stripe_checkout_expira_em=None
+                            )
+                        inicio = time.perf_counter()
+                        client.get(url)
+                        (repetidos if clique else primeiros).append((time.perf_counter() - inicio) * 1000)
+
+                        sessao = Pagamento.objects.values_list('stripe_checkout_id', flat=True).get(pk=pagamento.pk)
+                        if sessao != sessao_anterior:
+                            sessoes_criadas += 1
+                            sessao_anterior = sessao
+                raise _Rollback()
+        except _Rollback:
+            pass
+        return {'primeiros': primeiros, 'repetidos': repetidos, 'sessoes': sessoes_criadas}
+
+    def _exibir(self, resultados):
+        colunas = ' | '.join(f'{f"p{p} (ms)":>9}' for p in PERCENTIS)
+        self.stdout.write(f'\n{"modo":<10} | {"clique":<9} | {colunas} | {"sessões criadas":>15}')
+        self.stdout.write('-' * 80)
+        for modo, r in resultados.items():
+            for clique, tempos in (('primeiro', r['primeiros']), ('repetido', r['repetidos'])):
+                if not tempos:
+                    continue
+                valores = ' | '.join(f'{percentil(tempos, p):>9.2f}' for p in PERCENTIS)
+                sessoes = r['sessoes'] if clique == 'primeiro' else ''
+                self.stdout.write(f'{modo:<10} | {clique:<9} | {valores} | {sessoes:>15}')
@@ -0,0 +1,179 @@
+import json
+import random
+import time
+
+import stripe
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from apps.dashboards.benchmark import PERCENTIS, percentil
+from apps.payments.models import Pagamento, WebhookEvent
+from apps.payments.services.webhook_service import WebhookService
+
+SEGREDO_LOCAL = 'whsec_benchmark_local'
+
+
+class _Rollback(Exception):
+    """Usada para desfazer os dados sintéticos ao final do benchmark."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Reenvia um fluxo de eventos do Stripe ao webhook, assinados com um segredo local, '
+        'e mede a resposta do webhook e a drenagem da fila (processar_webhooks). Compara '
+        'com a atualização na própria requisição. Tudo é desfeito ao final.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--eventos',
+            type=int,
+            default=2000,
+            help='Eventos sintéticos (checkout.session.completed) a gerar (padrão: 2000)'
+        )
+        parser.add_argument(
+            '--duplicados',
+            type=float,
+            default=10.0,
+            help='Percentual de reenvios do mesmo evento, como nos retries do Stripe (padrão: 10)'
+        )
+        parser.add_argument(
+            '--arquivo',
+            help='Fluxo gravado (JSON Lines, um evento por linha) a reenviar no lugar dos sintéticos'
+        )
+        parser.add_argument(
+            '--gravar',
+            help='Grava o fluxo sintético gerado em JSON Lines, para reenviar depois com --arquivo'
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=500,
+            help='Tamanho do lote do worker (padrão: 500)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Semente dos eventos sintéticos (padrão: 42)'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                if options['arquivo']:
+                    with open(options['arquivo'], encoding='utf-8') as arquivo:
+                        eventos = [json.loads(linha) for linha in arquivo if linha.strip()]
+                else:
+                    eventos = self._gerar_eventos(options)
+                    if options['gravar']:
+                        with open(options['gravar'], 'w', encoding='utf-8') as arquivo:
+                            arquivo.writelines(json.dumps(evento) + '\n' for evento in eventos)
+                        self.stdout.write(f'Fluxo gravado em {options["gravar"]}')
+
+                self._preparar_pagamentos(eventos)
+                self.stdout.write(f'Reenviando {len(eventos)} eventos ao webhook...')
+                # Os dois modos partem do mesmo estado; cada um é desfeito ao terminar
+                resultados = {
+                    'na requisição': self._executar(eventos, options, assincrono=False),
+                    'fila + worker': self._executar(eventos, options, assincrono=True),
+                }
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+        self._exibir(resultados)
+        self.stdout.write(self.style.SUCCESS('✓ Benchmark concluído'))
+
+    def _gerar_eventos(self, options):
+        rng = random.Random(options['seed'])
+        primeiro_id = (Pagamento.objects.order_by('-id').values_list('id', flat=True).first() or 0) + 1
+
+        eventos = []
+        for i in range(options['eventos']):
+            evento = {
+                'id': f'evt_bench_{i:08d}',
+                'object': 'event',
+                'type': 'checkout.session.completed',
+                'data': {'object': {
+                    'id': f'cs_bench_{i:08d}',
+                    'object': 'checkout.session',
+                    'payment_intent': f'pi_bench_{i:08d}',
+                    'payment_status': 'paid',
+                    'metadata': {'pagamento_id': str(primeiro_id + i)},
+                }},
+            }
+            eventos.append(evento)
+            if rng.random() * 100 < options['duplicados']:
+                eventos.append(evento)
+        return eventos
+
+    def _preparar_pagamentos(self, eventos):
+        """Cria, pendentes, os pagamentos citados nos eventos que não existem neste banco."""
+        ids = set()
+        for evento in eventos:
+            metadata = evento.get('data', {}).get('object', {}).get('metadata') or {}
+            if str(metadata.get('pagamento_id', '')).isdigit():
+                ids.add(int(metadata['pagamento_id']))
+        faltando = ids - set(Pagamento.objects.filter(id__in=ids).values_list('id', flat=True))
+        if faltando:
+            aluno = User.objects.create_user(username='benchmark_webhooks')
+            Pagamento.objects.bulk_create(
+                Pagamento(id=pagamento_id, aluno=aluno, descricao=f'Mensalidade {pagamento_id}', valor='150.00')
+                for pagamento_id in sorted(faltando)
+            )
+
+    def _executar(self, eventos, options, assincrono):
+        client = Client()
+        url = reverse('stripe_webhook')
+        corpos = [json.dumps(evento) for evento in eventos]
+        tempos = []
+
+        try:
+            with transaction.atomic():
+                with override_settings(
+                    STRIPE_WEBHOOK_SECRET=SEGREDO_LOCAL,
+                    PAGAMENTOS_WEBHOOK_ASSINCRONO=assincrono,
+                    ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+                ):
+                    inicio_total = time.perf_counter()
+                    for corpo in corpos:
+                        assinatura = stripe.WebhookSignature.generate_signature_header(corpo, SEGREDO_LOCAL)
+                        inicio = time.perf_counter()
+                        client.post(url, corpo, content_type='application/json', HTTP_STRIPE_SIGNATURE=assinatura)
+                        tempos.append((time.perf_counter() - inicio) * 1000)
+                    duracao_envio = time.perf_counter() - inicio_total
+
+                inicio = time.perf_counter()
+                WebhookService.processar_fila(tamanho_lote=options['lote'])
+                duracao_worker = time.perf_counter() - inicio
+
+                resultado = {
+                    'tempos': tempos,
+                    'envio_s': duracao_envio,
+                    'worker_s': duracao_worker,
+                    'eventos_gravados': WebhookEvent.objects.count(),
+                    'pagos': Pagamento.objects.filter(status='pago').count(),
+                }
+                raise _Rollback()
+        except _Rollback:
+            pass
+        return resultado
+
+    def _exibir(self, resultados):
+        cabecalho = ' | '.join(f'{f"p{p} (ms)":>9}' for p in PERCENTIS)
+        self.stdout.write(
+            f'\n{"modo":<15} | {cabecalho} | {"envio (s)":>9} | {"worker (s)":>10} | {"eventos":>7} | {"pagos":>6}'
+        )
+        self.stdout.write('-' * 96)
+        for modo, r in resultados.items():
+            percentis = ' | '.join(f'{percentil(r["tempos"], p):>9.2f}' for p in PERCENTIS)
+            self.stdout.write(
+                f'{modo:<15} | {percentis} | {r["envio_s"]:>9.2f} | {r["worker_s"]:>10.2f} | '
+                f'{r["eventos_gravados"]:>7} | {r["pagos"]:>6}'
+            )
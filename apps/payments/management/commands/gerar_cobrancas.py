@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.payments.services.cobranca_service import CobrancaService
+
+
+class Command(BaseCommand):
+    help = (
+        'Gera as cobranças de uma competência para todos os alunos ativos, a partir dos '
+        'modelos de cobrança ativos. Rodar de novo o mesmo período não duplica cobranças.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--periodo',
+            default=None,
+            help='Competência no formato AAAA-MM (padrão: mês atual)'
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=1000,
+            help='Registros por INSERT (padrão: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        periodo = options['periodo'] or timezone.localdate().strftime('%Y-%m')
+        try:
+            execucao = CobrancaService.gerar_cobrancas(periodo, tamanho_lote=options['lote'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f'Alunos ativos: {execucao.alunos_ativos}')
+        self.stdout.write(f'Já existentes: {execucao.cobrancas_existentes}')
+        if execucao.alunos_sem_modelo:
+            self.stdout.write(self.style.WARNING(f'Alunos sem modelo de cobrança: {execucao.alunos_sem_modelo}'))
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ {execucao.cobrancas_criadas} cobrança(s) gerada(s) para {periodo} '
+            f'(R$ {execucao.valor_total:.2f}) em {execucao.duracao_ms} ms'
+        ))
@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.payments.services.financeiro_service import FinanceiroService
+
+
+class Command(BaseCommand):
+    help = (
+        'Grava o snapshot financeiro do dia (totais de pagamentos por curso e status), '
+        'usado nos relatórios e na evolução da inadimplência. Agende para rodar à noite; '
+        'rodar de novo no mesmo dia substitui o snapshot.'
+    )
+
+    def handle(self, *args, **options):
+        data = timezone.localdate()
+        inicio = time.perf_counter()
+        linhas = FinanceiroService.gerar_snapshot(data)
+        duracao_ms = int((time.perf_counter() - inicio) * 1000)
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Snapshot de {data:%d/%m/%Y} gravado: {linhas} linha(s) em {duracao_ms} ms'
+        ))
@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.payments.services.webhook_service import WebhookService
+
+
+class Command(BaseCommand):
+    help = (
+        'Aplica os eventos pendentes da caixa de entrada de webhooks do Stripe (WebhookEvent), '
+        'em lotes. Sem --continuo, processa até esvaziar a fila e termina (uso em cron).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--continuo',
+            action='store_true',
+            help='Continua aguardando novos eventos após esvaziar a fila'
+        )
+        parser.add_argument(
+            '--intervalo',
+            type=float,
+            default=1.0,
+            help='Segundos entre consultas à fila no modo contínuo (padrão: 1)'
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=500,
+            help='Eventos reservados e aplicados por vez (padrão: 500)'
+        )
+        parser.add_argument(
+            '--limite',
+            type=int,
+            default=None,
+            help='Quantidade máxima de eventos por rodada'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                liberados = WebhookService.liberar_travados()
+                if liberados:
+                    self.stdout.write(self.style.WARNING(f'↺ {liberados} evento(s) travado(s) ou com erro devolvido(s) à fila'))
+
+                inicio = time.perf_counter()
+                processados, erros = WebhookService.processar_fila(
+                    tamanho_lote=options['lote'], limite=options['limite']
+                )
+                if processados or erros:
+                    duracao = time.perf_counter() - inicio
+                    self.stdout.write(self.style.SUCCESS(
+                        f'✓ {processados} evento(s) processado(s), {erros} erro(s) em {duracao:.2f}s'
+                    ))
+
+                if not options['continuo']:
+                    break
+                if not (processados or erros):
+                    time.sleep(options['intervalo'])
+        except KeyboardInterrupt:
+            self.stdout.write('Worker interrompido.')
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pagamento',
+            index=models.Index(fields=['aluno', 'status'], name='pagamento_aluno_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pagamento',
+            index=models.Index(fields=['status'], name='pagamento_status_idx'),
+        ),
+    ]
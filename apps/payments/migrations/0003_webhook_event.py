@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0002_indices_consultas'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stripe_event_id', models.CharField(max_length=255, unique=True)),
+                ('tipo', models.CharField(max_length=100)),
+                ('payload', models.JSONField()),
+                ('status', models.CharField(choices=[('pendente', 'Pendente'), ('processando', 'Processando'), ('processado', 'Processado'), ('ignorado', 'Ignorado'), ('erro', 'Erro')], default='pendente', max_length=12)),
+                ('tentativas', models.PositiveSmallIntegerField(default=0)),
+                ('erro_mensagem', models.TextField(blank=True)),
+                ('lote', models.UUIDField(blank=True, null=True)),
+                ('recebido_em', models.DateTimeField(auto_now_add=True)),
+                ('processado_em', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['recebido_em'],
+                'indexes': [models.Index(fields=['status', 'recebido_em'], name='webhook_fila_idx'), models.Index(fields=['lote'], name='webhook_lote_idx')],
+            },
+        ),
+    ]
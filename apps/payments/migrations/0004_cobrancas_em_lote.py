@@ -0,0 +1,71 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academico', '0005_indices_consultas'),
+        ('payments', '0003_webhook_event'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pagamento',
+            name='periodo',
+            field=models.CharField(blank=True, help_text='Competência no formato AAAA-MM', max_length=7, null=True),
+        ),
+        migrations.CreateModel(
+            name='BillingRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('periodo', models.CharField(max_length=7)),
+                ('alunos_ativos', models.PositiveIntegerField(default=0)),
+                ('cobrancas_criadas', models.PositiveIntegerField(default=0)),
+                ('cobrancas_existentes', models.PositiveIntegerField(default=0)),
+                ('alunos_sem_modelo', models.PositiveIntegerField(default=0)),
+                ('valor_total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('duracao_ms', models.PositiveIntegerField(default=0)),
+                ('data_execucao', models.DateTimeField(auto_now_add=True)),
+                ('solicitante', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='billing_runs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Geração de Cobranças',
+                'verbose_name_plural': 'Gerações de Cobranças',
+                'ordering': ['-data_execucao'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ModeloCobranca',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('descricao', models.CharField(help_text='Ex.: Mensalidade (a competência é acrescentada)', max_length=255)),
+                ('valor', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('ativo', models.BooleanField(default=True)),
+                ('data_criacao', models.DateTimeField(auto_now_add=True)),
+                ('curso', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='modelos_cobranca', to='academico.curso')),
+                ('turma', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='modelos_cobranca', to='academico.turma')),
+            ],
+            options={
+                'verbose_name': 'Modelo de Cobrança',
+                'verbose_name_plural': 'Modelos de Cobrança',
+            },
+        ),
+        migrations.AddField(
+            model_name='pagamento',
+            name='modelo_cobranca',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pagamentos', to='payments.modelocobranca'),
+        ),
+        migrations.AddConstraint(
+            model_name='pagamento',
+            constraint=models.UniqueConstraint(fields=('aluno', 'modelo_cobranca', 'periodo'), name='pagamento_cobranca_periodo_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='modelocobranca',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('curso__isnull', False), ('turma__isnull', True)), models.Q(('curso__isnull', True), ('turma__isnull', False)), _connector='OR'), name='modelo_cobranca_curso_ou_turma'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0004_cobrancas_em_lote'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pagamento',
+            name='stripe_checkout_expira_em',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='pagamento',
+            name='stripe_checkout_url',
+            field=models.URLField(blank=True, max_length=1024, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0005_sessao_checkout'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='pagamento',
+            name='pagamento_status_idx',
+        ),
+        migrations.AddIndex(
+            model_name='pagamento',
+            index=models.Index(fields=['status', 'valor'], name='pagamento_status_valor_idx'),
+        ),
+    ]
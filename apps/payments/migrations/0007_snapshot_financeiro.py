@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academico', '0005_indices_consultas'),
+        ('payments', '0006_indice_indicadores_financeiros'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FinanceiroSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('data', models.DateField()),
+                ('status', models.CharField(choices=[('pendente', 'Pendente'), ('pago', 'Pago'), ('cancelado', 'Cancelado'), ('falha', 'Falha')], max_length=20)),
+                ('quantidade', models.PositiveIntegerField(default=0)),
+                ('valor_total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('gerado_em', models.DateTimeField(auto_now_add=True)),
+                ('curso', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='snapshots_financeiros', to='academico.curso')),
+            ],
+            options={
+                'verbose_name': 'Snapshot Financeiro',
+                'verbose_name_plural': 'Snapshots Financeiros',
+                'ordering': ['-data'],
+                'indexes': [models.Index(fields=['data', 'status'], name='snapshot_fin_data_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 14:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_snapshot_financeiro'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pagamento',
+            name='billing_run',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pagamentos', to='payments.billingrun'),
+        ),
+    ]
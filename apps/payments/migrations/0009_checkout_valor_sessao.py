@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 14:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0008_cobranca_billing_run'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pagamento',
+            name='stripe_checkout_valor_centavos',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
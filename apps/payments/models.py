@@ -21,10 +21,170 @@ class Pagamento(models.Model):
     # Campos exclusivos do Stripe
     stripe_checkout_id = models.CharField(max_length=255, unique=True, blank=True, null=True)
     stripe_payment_intent = models.CharField(max_length=255, blank=True, null=True)
+    # Sessão de checkout reaproveitada enquanto não expira (ver StripeService)
+    stripe_checkout_url = models.URLField(max_length=1024, blank=True, null=True)
+    stripe_checkout_expira_em = models.DateTimeField(blank=True, null=True)
+    # Valor (em centavos) cobrado na sessão salva: mudou o valor, a sessão não serve mais
+    stripe_checkout_valor_centavos = models.PositiveIntegerField(blank=True, null=True)
     
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pendente')
     data_criacao = models.DateTimeField(auto_now_add=True)
     data_atualizacao = models.DateTimeField(auto_now=True)
 
+    # Preenchidos nas cobranças geradas em lote (ver CobrancaService);
+    # ficam vazios nos lançamentos manuais
+    modelo_cobranca = models.ForeignKey(
+        'ModeloCobranca',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='pagamentos'
+    )
+    periodo = models.CharField(max_length=7, blank=True, null=True, help_text="Competência no formato AAAA-MM")
+    billing_run = models.ForeignKey(
+        'BillingRun',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='pagamentos'
+    )
+
+    class Meta:
+        constraints = [
+            # Uma cobrança por aluno, modelo e competência: gerar de novo o mesmo período não duplica
+            models.UniqueConstraint(
+                fields=['aluno', 'modelo_cobranca', 'periodo'], name='pagamento_cobranca_periodo_uniq'
+            ),
+        ]
+        indexes = [
+            # Pendências de um aluno (dashboard, financeiro e relatórios)
+            models.Index(fields=['aluno', 'status'], name='pagamento_aluno_status_idx'),
+            # Totais por status do controle financeiro: com o valor no índice,
+            # a agregação dos indicadores não precisa ler a tabela
+            models.Index(fields=['status', 'valor'], name='pagamento_status_valor_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.descricao} - {self.aluno} ({self.status})"
+
+class ModeloCobranca(models.Model):
+    """
+    Cobrança recorrente (ex.: mensalidade) de um curso ou de uma turma.
+    Alunos de uma turma com modelos próprios recebem só os da turma; os
+    demais recebem os do curso da turma.
+    """
+    descricao = models.CharField(max_length=255, help_text="Ex.: Mensalidade (a competência é acrescentada)")
+    valor = models.DecimalField(max_digits=10, decimal_places=2)
+    curso = models.ForeignKey(
+        'academico.Curso', on_delete=models.CASCADE, null=True, blank=True, related_name='modelos_cobranca'
+    )
+    turma = models.ForeignKey(
+        'academico.Turma', on_delete=models.CASCADE, null=True, blank=True, related_name='modelos_cobranca'
+    )
+    ativo = models.BooleanField(default=True)
+    data_criacao = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Modelo de Cobrança'
+        verbose_name_plural = 'Modelos de Cobrança'
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    models.Q(curso__isnull=False, turma__isnull=True)
+                    | models.Q(curso__isnull=True, turma__isnull=False)
+                ),
+                name='modelo_cobranca_curso_ou_turma',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.descricao} - {self.turma or self.curso} (R$ {self.valor})"
+
+
+class BillingRun(models.Model):
+    """Registro de cada geração de cobranças em lote (CobrancaService.gerar_cobrancas)."""
+    periodo = models.CharField(max_length=7)
+    solicitante = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='billing_runs'
+    )
+    alunos_ativos = models.PositiveIntegerField(default=0)
+    cobrancas_criadas = models.PositiveIntegerField(default=0)
+    cobrancas_existentes = models.PositiveIntegerField(default=0)
+    alunos_sem_modelo = models.PositiveIntegerField(default=0)
+    valor_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    duracao_ms = models.PositiveIntegerField(default=0)
+    data_execucao = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-data_execucao']
+        verbose_name = 'Geração de Cobranças'
+        verbose_name_plural = 'Gerações de Cobranças'
+
+    def __str__(self):
+        return f"{self.periodo}: {self.cobrancas_criadas} cobrança(s) em {self.duracao_ms} ms"
+
+
+class FinanceiroSnapshot(models.Model):
+    """
+    Fotografia diária dos pagamentos por curso e status, gerada à noite por
+    gerar_snapshot_financeiro. Os relatórios leem totais e a evolução da
+    inadimplência daqui em vez de reagregar a tabela de pagamentos.
+    O curso é o da turma atual do aluno; alunos sem turma ficam em curso nulo.
+    """
+    data = models.DateField()
+    curso = models.ForeignKey(
+        'academico.Curso', on_delete=models.SET_NULL, null=True, blank=True, related_name='snapshots_financeiros'
+    )
+    status = models.CharField(max_length=20, choices=Pagamento.STATUS_CHOICES)
+    quantidade = models.PositiveIntegerField(default=0)
+    valor_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    gerado_em = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-data']
+        verbose_name = 'Snapshot Financeiro'
+        verbose_name_plural = 'Snapshots Financeiros'
+        indexes = [
+            # Séries de tendência e o snapshot mais recente
+            models.Index(fields=['data', 'status'], name='snapshot_fin_data_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.data} {self.curso or 'Sem curso'} {self.status}: R$ {self.valor_total}"
+
+
+class WebhookEvent(models.Model):
+    """
+    Caixa de entrada dos webhooks do Stripe. A view só verifica a assinatura
+    e grava o evento; o worker (processar_webhooks) aplica os eventos em lote.
+    O id do evento é único: reenvios do Stripe são descartados na gravação.
+    """
+    STATUS_CHOICES = [
+        ('pendente', 'Pendente'),
+        ('processando', 'Processando'),
+        ('processado', 'Processado'),
+        ('ignorado', 'Ignorado'),
+        ('erro', 'Erro'),
+    ]
+
+    stripe_event_id = models.CharField(max_length=255, unique=True)
+    tipo = models.CharField(max_length=100)
+    payload = models.JSONField()
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default='pendente')
+    tentativas = models.PositiveSmallIntegerField(default=0)
+    erro_mensagem = models.TextField(blank=True)
+    # Identifica o lote do worker que reservou o evento
+    lote = models.UUIDField(null=True, blank=True)
+    recebido_em = models.DateTimeField(auto_now_add=True)
+    processado_em = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['recebido_em']
+        indexes = [
+            # O worker busca os pendentes mais antigos primeiro
+            models.Index(fields=['status', 'recebido_em'], name='webhook_fila_idx'),
+            models.Index(fields=['lote'], name='webhook_lote_idx'),
+        ]
+
     def __str__(self):
-        return f"{self.descricao} - {self.aluno} ({self.status})"
\ No newline at end of file
+        return f"{self.tipo} ({self.stripe_event_id}) - {self.status}"
@@ -0,0 +1,102 @@
+# apps/payments/services/cobranca_service.py
+import logging
+import re
+import time
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from apps.academico.models import Aluno
+from apps.payments.models import BillingRun, ModeloCobranca, Pagamento
+
+logger = logging.getLogger(__name__)
+
+FORMATO_PERIODO = re.compile(r'^\d{4}-(0[1-9]|1[0-2])$')
+
+
+class CobrancaService:
+
+    @staticmethod
+    def validar_periodo(periodo):
+        """Levanta ValueError se `periodo` não estiver no formato AAAA-MM."""
+        if not isinstance(periodo, str) or not FORMATO_PERIODO.match(periodo):
+            raise ValueError('Período inválido: use o formato AAAA-MM.')
+
+    @staticmethod
+    def _modelos_ativos():
+        """Modelos ativos agrupados por turma e por curso: ({turma_id: [...]}, {curso_id: [...]})."""
+        por_turma, por_curso = defaultdict(list), defaultdict(list)
+        for modelo in ModeloCobranca.objects.filter(ativo=True):
+            if modelo.turma_id:
+                por_turma[modelo.turma_id].append(modelo)
+            else:
+                por_curso[modelo.curso_id].append(modelo)
+        return por_turma, por_curso
+
+    @staticmethod
+    def gerar_cobrancas(periodo, solicitante=None, tamanho_lote=1000):
+        """
+        Gera, numa transação, as cobranças da competência `periodo` (AAAA-MM)
+        para todos os alunos ativos com turma, a partir dos modelos ativos.
+        Cobranças que já existem para o aluno, o modelo e o período são
+        mantidas, então rodar de novo o mesmo período não duplica nada.
+        Criadas e valor total são contados, depois da inserção, sobre as
+        cobranças gravadas por esta execução (billing_run), não sobre as
+        montadas: as descartadas por conflito com outra geração simultânea
+        ficam de fora. Retorna o BillingRun registrado.
+        """
+        CobrancaService.validar_periodo(periodo)
+        inicio = time.perf_counter()
+        ano, mes = periodo.split('-')
+        por_turma, por_curso = CobrancaService._modelos_ativos()
+        modelo_ids = [m.pk for modelos in (*por_turma.values(), *por_curso.values()) for m in modelos]
+
+        with transaction.atomic():
+            existentes = set(Pagamento.objects.filter(
+                periodo=periodo, modelo_cobranca_id__in=modelo_ids
+            ).values_list('aluno_id', 'modelo_cobranca_id'))
+
+            alunos = Aluno.objects.filter(status_matricula='Ativo', turma_atual__isnull=False).values_list(
+                'user_id', 'turma_atual_id', 'turma_atual__id_curso_id'
+            )
+            execucao = BillingRun.objects.create(periodo=periodo, solicitante=solicitante)
+            novas = []
+            alunos_ativos = sem_modelo = 0
+            for user_id, turma_id, curso_id in alunos.iterator(chunk_size=tamanho_lote):
+                alunos_ativos += 1
+                modelos = por_turma.get(turma_id) or por_curso.get(curso_id)
+                if not modelos:
+                    sem_modelo += 1
+                    continue
+                for modelo in modelos:
+                    if (user_id, modelo.pk) in existentes:
+                        continue
+                    novas.append(Pagamento(
+                        aluno_id=user_id,
+                        descricao=f'{modelo.descricao} {mes}/{ano}',
+                        valor=modelo.valor,
+                        status='pendente',
+                        modelo_cobranca=modelo,
+                        periodo=periodo,
+                        billing_run=execucao,
+                    ))
+
+            # ignore_conflicts: outra geração simultânea do mesmo período não derruba esta
+            Pagamento.objects.bulk_create(novas, batch_size=tamanho_lote, ignore_conflicts=True)
+
+            criadas = execucao.pagamentos.aggregate(quantidade=Count('pk'), valor=Sum('valor'))
+            execucao.alunos_ativos = alunos_ativos
+            execucao.cobrancas_criadas = criadas['quantidade']
+            execucao.cobrancas_existentes = len(existentes)
+            execucao.alunos_sem_modelo = sem_modelo
+            execucao.valor_total = (criadas['valor'] or Decimal('0')).quantize(Decimal('0.01'))
+            execucao.duracao_ms = round((time.perf_counter() - inicio) * 1000)
+            execucao.save()
+
+        logger.info(
+            'Cobranças %s: %s criada(s), %s já existente(s), %s aluno(s) sem modelo (%s ms)',
+            periodo, execucao.cobrancas_criadas, execucao.cobrancas_existentes, sem_modelo, execucao.duracao_ms
+        )
+        return execucao
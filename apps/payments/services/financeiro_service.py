@@ -0,0 +1,109 @@
+# apps/payments/services/financeiro_service.py
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Max, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.payments.models import FinanceiroSnapshot, Pagamento
+
+ZERO = Value(Decimal('0.00'), output_field=DecimalField(max_digits=14, decimal_places=2))
+
+
+def _soma(campo, *condicoes, **filtro):
+    return Coalesce(Sum(campo, filter=Q(*condicoes, **filtro) if condicoes or filtro else None), ZERO)
+
+
+def _totais_resumo(campo):
+    """Faturado (sem as cobranças canceladas), recebido e pendente."""
+    return {
+        'total': _soma(campo, ~Q(status='cancelado')),
+        'pago': _soma(campo, status='pago'),
+        'pendente': _soma(campo, status='pendente'),
+    }
+
+
+def _percentual(parte, total):
+    return round(parte / total * 100, 1) if total > 0 else 0
+
+
+class FinanceiroService:
+
+    @staticmethod
+    def indicadores(pagamentos=None):
+        """
+        Recebido, pendente e inadimplência (% do pendente sobre recebido +
+        pendente) numa única consulta com agregação condicional.
+        """
+        pagamentos = Pagamento.objects.all() if pagamentos is None else pagamentos
+        totais = pagamentos.aggregate(
+            recebido=_soma('valor', status='pago'),
+            pendente=_soma('valor', status='pendente'),
+        )
+        return {
+            'recebido': totais['recebido'],
+            'pendente': totais['pendente'],
+            'inadimplencia': _percentual(totais['pendente'], totais['recebido'] + totais['pendente']),
+        }
+
+    @staticmethod
+    def gerar_snapshot(data=None):
+        """
+        Grava o snapshot financeiro de `data` (padrão: hoje) com uma única
+        agregação agrupada por curso e status. Gerar de novo o mesmo dia
+        substitui as linhas anteriores. Retorna o número de linhas gravadas.
+        """
+        data = data or timezone.localdate()
+        grupos = (
+            Pagamento.objects
+            .values('status', curso_id=F('aluno__aluno__turma_atual__id_curso'))
+            .annotate(quantidade=Count('pk'), valor_total=Sum('valor'))
+            .order_by()
+        )
+        snapshots = [FinanceiroSnapshot(data=data, **grupo) for grupo in grupos]
+        with transaction.atomic():
+            FinanceiroSnapshot.objects.filter(data=data).delete()
+            FinanceiroSnapshot.objects.bulk_create(snapshots)
+        return len(snapshots)
+
+    @staticmethod
+    def resumo():
+        """
+        Totais do relatório da secretaria (faturado, recebido, pendente e
+        taxa de recebimento) do snapshot mais recente. Cobranças canceladas
+        não entram no faturado, e o pendente é só o de status 'pendente',
+        como em tendencia(). Enquanto nenhum snapshot foi gerado, calcula
+        sobre os pagamentos; 'data' vem None.
+        """
+        data = FinanceiroSnapshot.objects.aggregate(ultima=Max('data'))['ultima']
+        if data:
+            totais = FinanceiroSnapshot.objects.filter(data=data).aggregate(**_totais_resumo('valor_total'))
+        else:
+            totais = Pagamento.objects.aggregate(**_totais_resumo('valor'))
+        return {
+            'data': data,
+            **totais,
+            'taxa_recebimento': _percentual(totais['pago'], totais['total']),
+        }
+
+    @staticmethod
+    def tendencia(dias=30, curso=None):
+        """
+        Evolução dos últimos `dias` dias a partir dos snapshots, do mais
+        antigo ao mais recente (dias sem snapshot ficam de fora):
+        [{'data', 'recebido', 'pendente', 'inadimplencia'}, ...].
+        """
+        snapshots = FinanceiroSnapshot.objects.filter(data__gt=timezone.localdate() - timedelta(days=dias))
+        if curso is not None:
+            snapshots = snapshots.filter(curso=curso)
+        serie = (
+            snapshots.values('data')
+            .annotate(recebido=_soma('valor_total', status='pago'), pendente=_soma('valor_total', status='pendente'))
+            .order_by('data')
+        )
+        return [
+            {**dia, 'inadimplencia': _percentual(dia['pendente'], dia['recebido'] + dia['pendente'])}
+            for dia in serie
+        ]
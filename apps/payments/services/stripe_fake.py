@@ -0,0 +1,39 @@
+# apps/payments/services/stripe_fake.py
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+
+class FakeStripeBackend:
+    """
+    Backend do Stripe sem rede, para desenvolvimento e testes de carga
+    (STRIPE_BACKEND='apps.payments.services.stripe_fake.FakeStripeBackend').
+    Simula a latência da API (STRIPE_FAKE_LATENCIA_MS), respeita as chaves
+    de idempotência como o Stripe e conta as chamadas recebidas. A URL
+    devolvida é a própria success_url, então o fluxo segue sem o Stripe.
+    """
+    VALIDADE_SESSAO = 24 * 60 * 60
+
+    def __init__(self):
+        self._trava = threading.Lock()
+        self.sessoes = {}
+        self.chamadas = 0
+
+    def criar_sessao_checkout(self, params, chave_idempotencia):
+        with self._trava:
+            self.chamadas += 1
+        latencia = settings.STRIPE_FAKE_LATENCIA_MS
+        if latencia:
+            time.sleep(latencia / 1000)
+
+        with self._trava:
+            if chave_idempotencia not in self.sessoes:
+                session_id = f'cs_fake_{uuid.uuid4().hex}'
+                self.sessoes[chave_idempotencia] = (
+                    session_id,
+                    params['success_url'].replace('{CHECKOUT_SESSION_ID}', session_id),
+                    int(time.time()) + self.VALIDADE_SESSAO,
+                )
+            return self.sessoes[chave_idempotencia]
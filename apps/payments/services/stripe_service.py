@@ -1,27 +1,83 @@
 # apps/payments/services/stripe_service.py
+import logging
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+
+import requests
 import stripe
 from django.conf import settings
-from django.urls import reverse
+from django.utils.module_loading import import_string
+from django.utils.timezone import now
+
+logger = logging.getLogger(__name__)
+
+
+class StripeAPIBackend:
+    """
+    Cria as sessões na API do Stripe. Um único StripeClient por processo,
+    com sessão HTTP keep-alive (pool de conexões), timeouts e novas
+    tentativas em falhas de rede; a chave não fica no módulo global.
+    """
+
+    def __init__(self):
+        sessao_http = requests.Session()
+        adaptador = requests.adapters.HTTPAdapter(pool_maxsize=settings.STRIPE_POOL_CONEXOES)
+        sessao_http.mount('https://', adaptador)
+        sessao_http.mount('http://', adaptador)
+
+        self.cliente = stripe.StripeClient(
+            settings.STRIPE_SECRET_KEY,
+            http_client=stripe.RequestsClient(
+                timeout=(settings.STRIPE_TIMEOUT_CONEXAO, settings.STRIPE_TIMEOUT_LEITURA),
+                session=sessao_http,
+            ),
+            max_network_retries=settings.STRIPE_MAX_TENTATIVAS,
+            # Ex.: stripe-mock local para testes de carga sem rede
+            base_addresses={'api': settings.STRIPE_API_BASE} if settings.STRIPE_API_BASE else None,
+        )
+
+    def criar_sessao_checkout(self, params, chave_idempotencia):
+        """Retorna (id, url, expires_at em segundos desde a época)."""
+        sessao = self.cliente.v1.checkout.sessions.create(
+            params=params, options={'idempotency_key': chave_idempotencia}
+        )
+        return sessao.id, sessao.url, sessao.expires_at
+
+
+@lru_cache(maxsize=None)
+def _carregar_backend(caminho):
+    return import_string(caminho)()
+
+
+def obter_backend():
+    """Backend do Stripe configurado em STRIPE_BACKEND (um por processo)."""
+    return _carregar_backend(settings.STRIPE_BACKEND)
 
-# Configura a chave secreta uma única vez
-stripe.api_key = settings.STRIPE_SECRET_KEY
 
 class StripeService:
+    # Sessões a menos disso de expirar não são reaproveitadas: o aluno
+    # precisa de tempo para concluir o pagamento
+    MARGEM_REUSO = timedelta(minutes=10)
+
+    @staticmethod
+    def centavos(valor_decimal):
+        """Valor em centavos (o Stripe trabalha com inteiros). Ex: 100.00 vira 10000"""
+        return int(valor_decimal * 100)
+
     @staticmethod
-    def criar_sessao_checkout(pagamento_id, valor_decimal, descricao, email_usuario, domain_url):
+    def criar_sessao_checkout(pagamento_id, valor_decimal, descricao, email_usuario, domain_url,
+                              chave_idempotencia=None):
         """
         Cria uma sessão de checkout no Stripe.
-        Retorna a URL para onde o usuário deve ser redirecionado.
+        Retorna (id, url, expira_em) ou (None, None, None) se o Stripe falhar.
         """
         try:
-            # Converte valor para centavos (Stripe trabalha com inteiros)
-            # Ex: 100.00 vira 10000
-            valor_em_centavos = int(valor_decimal * 100)
-
-            checkout_session = stripe.checkout.Session.create(
-                customer_email=email_usuario,
-                payment_method_types=['card'], # Adicione 'boleto' se tiver ativado no painel do Stripe
-                line_items=[{
+            valor_em_centavos = StripeService.centavos(valor_decimal)
+
+            params = {
+                'customer_email': email_usuario,
+                'payment_method_types': ['card'], # Adicione 'boleto' se tiver ativado no painel do Stripe
+                'line_items': [{
                     'price_data': {
                         'currency': 'brl',
                         'product_data': {
@@ -31,17 +87,57 @@ class StripeService:
                     },
                     'quantity': 1,
                 }],
-                mode='payment',
+                'mode': 'payment',
                 # URLs de retorno
-                success_url=f"{domain_url}/pagamentos/sucesso?session_id={{CHECKOUT_SESSION_ID}}",
-                cancel_url=f"{domain_url}/pagamentos/cancelado",
+                'success_url': f"{domain_url}/pagamentos/sucesso?session_id={{CHECKOUT_SESSION_ID}}",
+                'cancel_url': f"{domain_url}/pagamentos/cancelado",
                 # Metadados para identificar o pagamento depois no Webhook
-                metadata={
+                'metadata': {
                     'pagamento_id': pagamento_id,
-                }
+                },
+            }
+            session_id, session_url, expires_at = obter_backend().criar_sessao_checkout(
+                params, chave_idempotencia or f'checkout-{pagamento_id}-{valor_em_centavos}'
             )
-            return checkout_session.id, checkout_session.url
-            
+            return session_id, session_url, datetime.fromtimestamp(expires_at, tz=dt_timezone.utc)
+
         except Exception as e:
-            print(f"Erro ao criar sessão Stripe: {e}")
-            return None, None
\ No newline at end of file
+            logger.exception("Erro ao criar sessão Stripe: %s", e)
+            return None, None, None
+
+    @staticmethod
+    def obter_checkout_url(pagamento, email_usuario, domain_url):
+        """
+        URL de checkout do pagamento. Reaproveita a sessão salva enquanto
+        não estiver perto de expirar e cobrar o valor atual do pagamento;
+        senão cria outra no Stripe. Retorna None se o Stripe falhar.
+        """
+        valor_em_centavos = StripeService.centavos(pagamento.valor)
+        if (pagamento.stripe_checkout_url and pagamento.stripe_checkout_expira_em
+                and pagamento.stripe_checkout_expira_em > now() + StripeService.MARGEM_REUSO
+                and pagamento.stripe_checkout_valor_centavos == valor_em_centavos):
+            return pagamento.stripe_checkout_url
+
+        # Cliques simultâneos partem da mesma sessão anterior e geram a mesma
+        # chave: o Stripe devolve a mesma sessão em vez de criar outra
+        chave = f'checkout-{pagamento.pk}-{valor_em_centavos}-{pagamento.stripe_checkout_id or "inicial"}'
+        session_id, session_url, expira_em = StripeService.criar_sessao_checkout(
+            pagamento_id=pagamento.pk,
+            valor_decimal=pagamento.valor,
+            descricao=pagamento.descricao,
+            email_usuario=email_usuario,
+            domain_url=domain_url,
+            chave_idempotencia=chave,
+        )
+        if not session_url:
+            return None
+
+        pagamento.stripe_checkout_id = session_id
+        pagamento.stripe_checkout_url = session_url
+        pagamento.stripe_checkout_expira_em = expira_em
+        pagamento.stripe_checkout_valor_centavos = valor_em_centavos
+        pagamento.save(update_fields=[
+            'stripe_checkout_id', 'stripe_checkout_url', 'stripe_checkout_expira_em',
+            'stripe_checkout_valor_centavos', 'data_atualizacao'
+        ])
+        return session_url
@@ -0,0 +1,175 @@
+# apps/payments/services/webhook_service.py
+import json
+import logging
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+import stripe
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils.timezone import now
+
+from apps.payments.models import Pagamento, WebhookEvent
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookService:
+    # Status do Pagamento aplicado por tipo de evento; os demais tipos são ignorados
+    STATUS_POR_TIPO = {
+        'checkout.session.completed': 'pago',
+    }
+
+    # Eventos reservados há mais tempo que isso são considerados abandonados
+    # (worker interrompido) e voltam para a fila
+    TEMPO_MAXIMO_PROCESSAMENTO = timedelta(minutes=10)
+
+    # Eventos com erro voltam para a fila depois desse intervalo, até
+    # MAX_TENTATIVAS: o reenvio do Stripe é descartado pelo id único, então
+    # sem isso uma falha passageira perderia a confirmação do pagamento
+    MAX_TENTATIVAS = 5
+    INTERVALO_NOVA_TENTATIVA = timedelta(minutes=1)
+
+    @staticmethod
+    def verificar_evento(payload, assinatura):
+        """
+        Confere a assinatura do Stripe e retorna o evento como dicionário.
+        Levanta ValueError (payload inválido) ou SignatureVerificationError.
+        """
+        stripe.WebhookSignature.verify_header(
+            payload, assinatura, settings.STRIPE_WEBHOOK_SECRET, stripe.Webhook.DEFAULT_TOLERANCE
+        )
+        evento = json.loads(payload)
+        if not isinstance(evento, dict) or 'id' not in evento or 'type' not in evento:
+            raise ValueError('Evento sem id ou tipo.')
+        return evento
+
+    @staticmethod
+    def registrar_evento(evento):
+        """
+        Grava o evento na caixa de entrada com um único INSERT. Reenvios do
+        mesmo evento esbarram no id único e são descartados pelo banco.
+        """
+        WebhookEvent.objects.bulk_create(
+            [WebhookEvent(stripe_event_id=evento['id'], tipo=evento['type'], payload=evento)],
+            ignore_conflicts=True,
+        )
+
+    @staticmethod
+    def reservar_lote(tamanho):
+        """
+        Reserva até `tamanho` pendentes, dos mais antigos, para este worker.
+        A reserva é um UPDATE condicional marcado com um id de lote: eventos
+        que outro worker pegou antes ficam de fora.
+        """
+        while True:
+            ids = list(WebhookEvent.objects.filter(status='pendente').order_by(
+                'recebido_em'
+            ).values_list('id', flat=True)[:tamanho])
+            if not ids:
+                return []
+
+            lote = uuid.uuid4()
+            reservados = WebhookEvent.objects.filter(id__in=ids, status='pendente').update(
+                status='processando', lote=lote, processado_em=now()
+            )
+            if reservados:
+                return list(WebhookEvent.objects.filter(lote=lote).order_by('recebido_em'))
+
+    @staticmethod
+    def liberar_travados():
+        """
+        Devolve para a fila eventos presos em 'processando' e os que falharam
+        com menos de MAX_TENTATIVAS tentativas. Retorna quantos.
+        """
+        momento = now()
+        travados = WebhookEvent.objects.filter(
+            status='processando', processado_em__lt=momento - WebhookService.TEMPO_MAXIMO_PROCESSAMENTO
+        ).update(status='pendente', lote=None)
+        com_erro = WebhookEvent.objects.filter(
+            status='erro',
+            tentativas__lt=WebhookService.MAX_TENTATIVAS,
+            processado_em__lt=momento - WebhookService.INTERVALO_NOVA_TENTATIVA,
+        ).update(status='pendente', lote=None)
+        return travados + com_erro
+
+    @staticmethod
+    def _pagamento_id(evento):
+        sessao = evento.payload.get('data', {}).get('object', {})
+        pagamento_id = (sessao.get('metadata') or {}).get('pagamento_id')
+        try:
+            return int(pagamento_id)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def processar_lote(eventos):
+        """
+        Aplica um lote de eventos reservados. Os pagamentos envolvidos são
+        lidos numa consulta e gravados num único executemany; os eventos
+        recebem um UPDATE por status final. Retorna (processados, erros).
+        """
+        ids = {WebhookService._pagamento_id(evento) for evento in eventos} - {None}
+        pagamentos = Pagamento.objects.in_bulk(ids)
+        alterados = {}
+        por_status = defaultdict(list)
+        falhas = []
+
+        for evento in eventos:
+            try:
+                novo_status = WebhookService.STATUS_POR_TIPO.get(evento.tipo)
+                pagamento = pagamentos.get(WebhookService._pagamento_id(evento))
+                if novo_status is None:
+                    por_status['ignorado'].append(evento.pk)
+                elif pagamento is None:
+                    por_status['ignorado'].append(evento.pk)
+                    logger.warning('Evento %s (%s) sem pagamento correspondente', evento.stripe_event_id, evento.tipo)
+                else:
+                    sessao = evento.payload['data']['object']
+                    pagamento.status = novo_status
+                    pagamento.stripe_payment_intent = sessao.get('payment_intent') or pagamento.stripe_payment_intent
+                    alterados[pagamento.pk] = pagamento
+                    por_status['processado'].append(evento.pk)
+                    logger.info('Pagamento %s: %s (evento %s)', pagamento.pk, novo_status, evento.stripe_event_id)
+            except Exception as e:
+                falhas.append((evento.pk, str(e)))
+                logger.exception('Erro ao processar o evento %s', evento.stripe_event_id)
+
+        momento = now()
+        with transaction.atomic():
+            if alterados:
+                # bulk_update monta um CASE por linha e custa mais que o próprio UPDATE
+                with connection.cursor() as cursor:
+                    cursor.executemany(
+                        f"UPDATE {connection.ops.quote_name(Pagamento._meta.db_table)} "
+                        "SET status = %s, stripe_payment_intent = %s, data_atualizacao = %s WHERE id = %s",
+                        [
+                            (p.status, p.stripe_payment_intent, connection.ops.adapt_datetimefield_value(momento), p.pk)
+                            for p in alterados.values()
+                        ]
+                    )
+            for status, evento_ids in por_status.items():
+                WebhookEvent.objects.filter(pk__in=evento_ids).update(
+                    status=status, tentativas=F('tentativas') + 1, erro_mensagem='', processado_em=momento
+                )
+            for evento_id, mensagem in falhas:
+                WebhookEvent.objects.filter(pk=evento_id).update(
+                    status='erro', tentativas=F('tentativas') + 1, erro_mensagem=mensagem, processado_em=momento
+                )
+        return len(eventos) - len(falhas), len(falhas)
+
+    @staticmethod
+    def processar_fila(tamanho_lote=500, limite=None):
+        """Processa lotes até esvaziar a fila (ou atingir o limite de eventos). Retorna (processados, erros)."""
+        processados = erros = 0
+        while limite is None or processados + erros < limite:
+            restante = tamanho_lote if limite is None else min(tamanho_lote, limite - processados - erros)
+            eventos = WebhookService.reservar_lote(restante)
+            if not eventos:
+                break
+            ok, falhas = WebhookService.processar_lote(eventos)
+            processados += ok
+            erros += falhas
+        return processados, erros
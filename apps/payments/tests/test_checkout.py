@@ -0,0 +1,85 @@
+"""
+Testes do reaproveitamento das sessões de checkout do Stripe (backend falso).
+"""
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from django.utils.timezone import now
+
+from apps.payments.models import Pagamento
+from apps.payments.services.stripe_service import obter_backend
+
+BACKEND_FALSO = 'apps.payments.services.stripe_fake.FakeStripeBackend'
+
+
+@override_settings(STRIPE_BACKEND=BACKEND_FALSO, STRIPE_FAKE_LATENCIA_MS=0)
+class CheckoutStripeTests(TestCase):
+
+    def setUp(self):
+        self.aluno = User.objects.create_user(username='aluno_checkout', email='aluno@example.com')
+        self.pagamento = Pagamento.objects.create(aluno=self.aluno, descricao='Mensalidade', valor='150.00')
+        self.client = Client()
+        self.client.force_login(self.aluno)
+        self.url = reverse('iniciar_pagamento', args=[self.pagamento.id])
+
+    def test_cliques_repetidos_reaproveitam_a_sessao(self):
+        chamadas = obter_backend().chamadas
+        primeira = self.client.get(self.url)
+        segunda = self.client.get(self.url)
+
+        self.assertEqual(primeira.status_code, 302)
+        self.assertEqual(primeira.url, segunda.url)
+        self.assertEqual(obter_backend().chamadas - chamadas, 1)
+        self.pagamento.refresh_from_db()
+        self.assertEqual(primeira.url, self.pagamento.stripe_checkout_url)
+        self.assertIn(self.pagamento.stripe_checkout_id, primeira.url)
+        self.assertGreater(self.pagamento.stripe_checkout_expira_em, now() + timedelta(hours=23))
+
+    def test_sessao_perto_de_expirar_e_recriada(self):
+        primeira = self.client.get(self.url)
+        Pagamento.objects.filter(pk=self.pagamento.pk).update(stripe_checkout_expira_em=now() + timedelta(minutes=1))
+
+        segunda = self.client.get(self.url)
+
+        self.assertNotEqual(primeira.url, segunda.url)
+
+    def test_valor_alterado_abre_nova_sessao(self):
+        chamadas = obter_backend().chamadas
+        primeira = self.client.get(self.url)
+        self.pagamento.refresh_from_db()
+        self.assertEqual(self.pagamento.stripe_checkout_valor_centavos, 15000)
+
+        Pagamento.objects.filter(pk=self.pagamento.pk).update(valor='175.50')
+        segunda = self.client.get(self.url)
+        terceira = self.client.get(self.url)
+
+        self.assertNotEqual(primeira.url, segunda.url)
+        self.assertEqual(segunda.url, terceira.url)
+        self.assertEqual(obter_backend().chamadas - chamadas, 2)
+        self.pagamento.refresh_from_db()
+        self.assertEqual(self.pagamento.stripe_checkout_valor_centavos, 17550)
+
+    def test_falha_no_stripe(self):
+        with override_settings(STRIPE_BACKEND='apps.payments.tests.test_checkout.BackendIndisponivel'):
+            with self.assertLogs('apps.payments', level='ERROR'):
+                response = self.client.get(self.url)
+
+        self.assertTemplateUsed(response, 'pagamentos/erro.html')
+        self.pagamento.refresh_from_db()
+        self.assertIsNone(self.pagamento.stripe_checkout_url)
+
+    def test_benchmark_descarta_dados(self):
+        saida = StringIO()
+        call_command('benchmark_checkout', pagamentos=3, cliques=2, latencia=0, stdout=saida)
+
+        self.assertIn('com reuso', saida.getvalue())
+        self.assertEqual(Pagamento.objects.count(), 1)
+
+
+class BackendIndisponivel:
+    def criar_sessao_checkout(self, params, chave_idempotencia):
+        raise ConnectionError('Stripe indisponível')
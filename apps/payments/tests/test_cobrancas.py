@@ -0,0 +1,134 @@
+"""
+Testes da geração de cobranças em lote (ModeloCobranca + BillingRun).
+"""
+import json
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from apps.academico.models import Aluno, Curso, Departamento, Secretaria, Turma
+from apps.payments.models import BillingRun, ModeloCobranca, Pagamento
+from apps.payments.services.cobranca_service import CobrancaService
+from apps.usuarios.models import Profile
+
+
+class GeracaoCobrancasTests(TestCase):
+
+    def setUp(self):
+        departamento = Departamento.objects.create(nome_departamento='Tecnologia', cod_departamento='TEC')
+        self.curso = Curso.objects.create(
+            cod_curso='TADS', nome_curso='Análise e Desenvolvimento', carga_horaria_total=1600,
+            modalidade='Presencial', turno='Noturno', tipo='Técnico', cod_departamento=departamento
+        )
+        self.turma_a, self.turma_b = [
+            Turma.objects.create(
+                nome=f'TADS 2025/{i}', periodo='Noturno', ano_letivo=2025,
+                data_inicio=date(2025, 2, 1), id_curso=self.curso
+            )
+            for i in (1, 2)
+        ]
+        self.alunos = []
+        for i, (turma, status) in enumerate([
+            (self.turma_a, 'Ativo'), (self.turma_a, 'Ativo'), (self.turma_b, 'Ativo'),
+            (self.turma_b, 'Trancado'), (None, 'Ativo'),
+        ]):
+            user = User.objects.create_user(username=f'aluno{i}')
+            self.alunos.append(Aluno.objects.create(
+                user=user, RA_aluno=f'RA{i:05d}', turma_atual=turma, status_matricula=status
+            ))
+
+        ModeloCobranca.objects.create(descricao='Mensalidade', valor='300.00', curso=self.curso)
+        # A turma B tem mensalidade própria, que substitui a do curso
+        ModeloCobranca.objects.create(descricao='Mensalidade Turma B', valor='250.00', turma=self.turma_b)
+        ModeloCobranca.objects.create(descricao='Inativo', valor='1.00', curso=self.curso, ativo=False)
+
+    def test_gera_uma_cobranca_por_aluno_ativo(self):
+        with self.assertLogs('apps.payments', level='INFO'):
+            execucao = CobrancaService.gerar_cobrancas('2025-03')
+
+        cobrancas = dict(Pagamento.objects.values_list('aluno__username', 'descricao'))
+        self.assertEqual(cobrancas, {
+            'aluno0': 'Mensalidade 03/2025',
+            'aluno1': 'Mensalidade 03/2025',
+            'aluno2': 'Mensalidade Turma B 03/2025',
+        })
+        self.assertEqual(execucao.cobrancas_criadas, 3)
+        self.assertEqual(execucao.alunos_ativos, 3)
+        self.assertEqual(str(execucao.valor_total), '850.00')
+        self.assertEqual(set(Pagamento.objects.values_list('status', 'periodo')), {('pendente', '2025-03')})
+
+    def test_rodar_de_novo_nao_duplica(self):
+        with self.assertLogs('apps.payments', level='INFO'):
+            CobrancaService.gerar_cobrancas('2025-03')
+            aluno_novo = Aluno.objects.create(
+                user=User.objects.create_user(username='aluno_novo'), RA_aluno='RA99999', turma_atual=self.turma_a
+            )
+            execucao = CobrancaService.gerar_cobrancas('2025-03')
+
+        self.assertEqual(execucao.cobrancas_criadas, 1)
+        self.assertEqual(execucao.cobrancas_existentes, 3)
+        self.assertTrue(Pagamento.objects.filter(aluno=aluno_novo.user, periodo='2025-03').exists())
+        self.assertEqual(Pagamento.objects.count(), 4)
+        self.assertEqual(BillingRun.objects.count(), 2)
+
+    def test_cobranca_gravada_por_geracao_simultanea_nao_conta(self):
+        modelo = ModeloCobranca.objects.get(descricao='Mensalidade')
+        concorrente = []
+
+        def outra_geracao(execute, sql, params, many, context):
+            # Logo antes da inserção em lote, outra geração grava a cobrança do aluno0
+            if sql.startswith('INSERT') and '"payments_pagamento"' in sql and not concorrente:
+                concorrente.append(sql)
+                Pagamento.objects.create(
+                    aluno=self.alunos[0].user, descricao='Mensalidade 03/2025', valor='280.00',
+                    modelo_cobranca=modelo, periodo='2025-03'
+                )
+            return execute(sql, params, many, context)
+
+        with self.assertLogs('apps.payments', level='INFO'), connection.execute_wrapper(outra_geracao):
+            execucao = CobrancaService.gerar_cobrancas('2025-03')
+
+        self.assertEqual(Pagamento.objects.filter(periodo='2025-03').count(), 3)
+        self.assertEqual(execucao.cobrancas_criadas, 2)
+        self.assertEqual(str(execucao.valor_total), '550.00')
+        self.assertEqual(set(execucao.pagamentos.values_list('aluno__username', flat=True)), {'aluno1', 'aluno2'})
+
+    def test_consultas_nao_crescem_com_os_alunos(self):
+        for i in range(30):
+            Aluno.objects.create(
+                user=User.objects.create_user(username=f'extra{i}'), RA_aluno=f'EX{i:05d}', turma_atual=self.turma_a
+            )
+        with self.assertLogs('apps.payments', level='INFO'), self.assertNumQueries(9):
+            CobrancaService.gerar_cobrancas('2025-04')
+
+    def test_periodo_invalido(self):
+        with self.assertRaises(ValueError):
+            CobrancaService.gerar_cobrancas('2025-13')
+
+    def test_comando_e_endpoint(self):
+        saida = StringIO()
+        with self.assertLogs('apps.payments', level='INFO'):
+            call_command('gerar_cobrancas', periodo='2025-05', stdout=saida)
+        self.assertIn('3 cobrança(s) gerada(s) para 2025-05', saida.getvalue())
+
+        user = User.objects.create_user(username='secretaria')
+        Profile.objects.create(user=user, tipo='secretaria')
+        Secretaria.objects.create(user=user)
+        client = Client()
+        client.force_login(user)
+        with self.assertLogs('apps.payments', level='INFO'):
+            resposta = client.post(
+                reverse('gerar_cobrancas'), json.dumps({'periodo': '2025-05'}), content_type='application/json'
+            ).json()
+        self.assertTrue(resposta['success'])
+        self.assertEqual((resposta['criadas'], resposta['existentes']), (0, 3))
+
+        aluno = Client()
+        aluno.force_login(self.alunos[0].user)
+        response = aluno.post(reverse('gerar_cobrancas'), json.dumps({'periodo': '2025-06'}), content_type='application/json')
+        self.assertEqual(response.status_code, 403)
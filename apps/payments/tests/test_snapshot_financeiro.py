@@ -0,0 +1,109 @@
+"""
+Testes do snapshot financeiro diário (FinanceiroSnapshot) e dos relatórios
+da secretaria que leem dele.
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.academico.models import Aluno, Curso, Departamento, Turma
+from apps.payments.models import FinanceiroSnapshot, Pagamento
+from apps.payments.services.financeiro_service import FinanceiroService
+from apps.usuarios.models import Profile
+
+
+class SnapshotFinanceiroTests(TestCase):
+
+    def setUp(self):
+        departamento = Departamento.objects.create(nome_departamento='Tecnologia', cod_departamento='TEC')
+        self.curso = Curso.objects.create(
+            cod_curso='TADS', nome_curso='Análise e Desenvolvimento', carga_horaria_total=1600,
+            modalidade='Presencial', turno='Noturno', tipo='Técnico', cod_departamento=departamento
+        )
+        turma = Turma.objects.create(
+            nome='TADS 2025/1', periodo='Noturno', ano_letivo=2025, data_inicio=date(2025, 2, 1), id_curso=self.curso
+        )
+        self.aluno = User.objects.create_user(username='aluno_turma')
+        Aluno.objects.create(user=self.aluno, RA_aluno='RA00001', turma_atual=turma)
+        self.sem_turma = User.objects.create_user(username='aluno_sem_turma')
+        Pagamento.objects.bulk_create([
+            Pagamento(aluno=self.aluno, descricao='Mensalidade 1', valor='300.00', status='pago'),
+            Pagamento(aluno=self.aluno, descricao='Mensalidade 2', valor='300.00', status='pago'),
+            Pagamento(aluno=self.aluno, descricao='Mensalidade 3', valor='100.00', status='pendente'),
+            Pagamento(aluno=self.sem_turma, descricao='Taxa', valor='50.00', status='pendente'),
+            Pagamento(aluno=self.aluno, descricao='Mensalidade 4', valor='200.00', status='cancelado'),
+        ])
+
+    def test_agrupa_por_curso_e_status(self):
+        self.assertEqual(FinanceiroService.gerar_snapshot(), 4)
+        linhas = {
+            (s.curso_id, s.status): (s.quantidade, s.valor_total)
+            for s in FinanceiroSnapshot.objects.all()
+        }
+        self.assertEqual(linhas, {
+            (self.curso.pk, 'pago'): (2, Decimal('600.00')),
+            (self.curso.pk, 'pendente'): (1, Decimal('100.00')),
+            (self.curso.pk, 'cancelado'): (1, Decimal('200.00')),
+            (None, 'pendente'): (1, Decimal('50.00')),
+        })
+
+    def test_gerar_de_novo_substitui_o_dia(self):
+        FinanceiroService.gerar_snapshot()
+        Pagamento.objects.filter(status='pendente').update(status='pago')
+        FinanceiroService.gerar_snapshot()
+
+        hoje = FinanceiroSnapshot.objects.filter(data=timezone.localdate())
+        self.assertEqual(set(hoje.values_list('status', flat=True)), {'pago', 'cancelado'})
+
+    def test_resumo_le_o_snapshot_mais_recente(self):
+        # Sem snapshot, calcula sobre os pagamentos; a cobrança cancelada não entra
+        resumo = FinanceiroService.resumo()
+        self.assertIsNone(resumo['data'])
+        self.assertEqual(resumo['total'], Decimal('750.00'))
+        self.assertEqual(resumo['pendente'], Decimal('150.00'))
+
+        FinanceiroService.gerar_snapshot()
+        Pagamento.objects.create(aluno=self.aluno, descricao='Depois do snapshot', valor='1000.00', status='pago')
+        resumo = FinanceiroService.resumo()
+        self.assertEqual(resumo['data'], timezone.localdate())
+        self.assertEqual(resumo['total'], Decimal('750.00'))
+        self.assertEqual(resumo['pago'], Decimal('600.00'))
+        self.assertEqual(resumo['pendente'], Decimal('150.00'))
+        self.assertEqual(resumo['taxa_recebimento'], Decimal('80.0'))
+
+    def test_tendencia_em_ordem_de_data(self):
+        hoje = timezone.localdate()
+        FinanceiroService.gerar_snapshot(hoje - timedelta(days=1))
+        Pagamento.objects.filter(status='pendente').update(status='pago')
+        FinanceiroService.gerar_snapshot(hoje)
+        FinanceiroService.gerar_snapshot(hoje - timedelta(days=60))
+
+        serie = FinanceiroService.tendencia(dias=30)
+        self.assertEqual([d['data'] for d in serie], [hoje - timedelta(days=1), hoje])
+        self.assertEqual(serie[0]['inadimplencia'], Decimal('20.0'))
+        self.assertEqual(serie[1]['inadimplencia'], 0)
+        self.assertEqual(FinanceiroService.tendencia(curso=self.curso)[0]['pendente'], Decimal('100.00'))
+
+    def test_comando_e_relatorios(self):
+        saida = StringIO()
+        call_command('gerar_snapshot_financeiro', stdout=saida)
+        self.assertIn('4 linha(s)', saida.getvalue())
+
+        secretaria = User.objects.create_user(username='secretaria')
+        Profile.objects.create(user=secretaria, tipo='secretaria')
+        client = Client()
+        client.force_login(secretaria)
+
+        response = client.get(reverse('preview_relatorio_secretaria'))
+        self.assertContains(response, 'Evolução da Inadimplência')
+        self.assertEqual(response.context['pagamentos_pendente'], Decimal('150.00'))
+
+        response = client.get(reverse('relatorio_secretaria_geral_pdf'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content)[:4], b'%PDF')
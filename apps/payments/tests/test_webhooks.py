@@ -0,0 +1,131 @@
+"""
+Testes da caixa de entrada de webhooks do Stripe (WebhookEvent + worker).
+"""
+import json
+from io import StringIO
+
+import stripe
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.payments.models import Pagamento, WebhookEvent
+from apps.payments.services.webhook_service import WebhookService
+
+SEGREDO = 'whsec_teste_webhooks'
+
+
+@override_settings(STRIPE_WEBHOOK_SECRET=SEGREDO, PAGAMENTOS_WEBHOOK_ASSINCRONO=True)
+class WebhookStripeTests(TestCase):
+    """O webhook só grava o evento; o worker atualiza os pagamentos."""
+
+    def setUp(self):
+        self.aluno = User.objects.create_user(username='aluno_pagante')
+        self.pagamento = Pagamento.objects.create(aluno=self.aluno, descricao='Mensalidade', valor='150.00')
+        self.client = Client()
+
+    def _evento(self, evento_id='evt_1', tipo='checkout.session.completed', pagamento_id=None):
+        return {
+            'id': evento_id,
+            'type': tipo,
+            'data': {'object': {
+                'payment_intent': 'pi_123',
+                'metadata': {'pagamento_id': str(pagamento_id or self.pagamento.id)},
+            }},
+        }
+
+    def _enviar(self, evento, segredo=SEGREDO):
+        corpo = json.dumps(evento)
+        assinatura = stripe.WebhookSignature.generate_signature_header(corpo, segredo)
+        return self.client.post(
+            reverse('stripe_webhook'), corpo, content_type='application/json', HTTP_STRIPE_SIGNATURE=assinatura
+        )
+
+    def test_webhook_grava_evento_sem_processar(self):
+        with self.assertNumQueries(1):
+            response = self._enviar(self._evento())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(WebhookEvent.objects.get().status, 'pendente')
+        self.pagamento.refresh_from_db()
+        self.assertEqual(self.pagamento.status, 'pendente')
+
+    def test_reenvio_do_mesmo_evento_e_descartado(self):
+        self._enviar(self._evento())
+        response = self._enviar(self._evento())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(WebhookEvent.objects.count(), 1)
+
+    def test_assinatura_invalida(self):
+        response = self._enviar(self._evento(), segredo='whsec_outro')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    def test_worker_aplica_eventos(self):
+        outro = Pagamento.objects.create(aluno=self.aluno, descricao='Matrícula', valor='80.00')
+        self._enviar(self._evento('evt_1'))
+        self._enviar(self._evento('evt_2', pagamento_id=outro.id))
+        self._enviar(self._evento('evt_3', tipo='customer.created'))
+        self._enviar(self._evento('evt_4', pagamento_id=999999))
+
+        with self.assertLogs('apps.payments', level='INFO'):
+            call_command('processar_webhooks', lote=2, stdout=StringIO())
+
+        self.pagamento.refresh_from_db()
+        self.assertEqual(self.pagamento.status, 'pago')
+        self.assertEqual(self.pagamento.stripe_payment_intent, 'pi_123')
+        self.assertEqual(Pagamento.objects.get(id=outro.id).status, 'pago')
+        status = dict(WebhookEvent.objects.values_list('stripe_event_id', 'status'))
+        self.assertEqual(status, {
+            'evt_1': 'processado', 'evt_2': 'processado', 'evt_3': 'ignorado', 'evt_4': 'ignorado',
+        })
+        self.assertEqual(set(WebhookEvent.objects.values_list('tentativas', flat=True)), {1})
+
+    def test_evento_com_erro_volta_para_a_fila(self):
+        # Falhas anteriores: uma passageira, uma sem tentativas restantes e uma recente demais
+        antes = timezone.now() - WebhookService.INTERVALO_NOVA_TENTATIVA * 2
+        outro = Pagamento.objects.create(aluno=self.aluno, descricao='Matrícula', valor='80.00')
+        recente = Pagamento.objects.create(aluno=self.aluno, descricao='Material', valor='40.00')
+        for evento_id, pagamento, tentativas, momento in (
+            ('evt_1', self.pagamento, 1, antes),
+            ('evt_2', outro, WebhookService.MAX_TENTATIVAS, antes),
+            ('evt_3', recente, 1, timezone.now()),
+        ):
+            self._enviar(self._evento(evento_id, pagamento_id=pagamento.id))
+            WebhookEvent.objects.filter(stripe_event_id=evento_id).update(
+                status='erro', tentativas=tentativas, erro_mensagem='timeout', processado_em=momento
+            )
+
+        saida = StringIO()
+        with self.assertLogs('apps.payments', level='INFO'):
+            call_command('processar_webhooks', stdout=saida)
+
+        self.assertIn('1 evento(s) travado(s) ou com erro', saida.getvalue())
+        self.pagamento.refresh_from_db()
+        self.assertEqual(self.pagamento.status, 'pago')
+        self.assertEqual(Pagamento.objects.get(id=outro.id).status, 'pendente')
+        status = dict(WebhookEvent.objects.values_list('stripe_event_id', 'status'))
+        self.assertEqual(status, {'evt_1': 'processado', 'evt_2': 'erro', 'evt_3': 'erro'})
+        self.assertEqual(WebhookEvent.objects.get(stripe_event_id='evt_1').tentativas, 2)
+
+    @override_settings(PAGAMENTOS_WEBHOOK_ASSINCRONO=False)
+    def test_sem_fila_processa_na_requisicao(self):
+        with self.assertLogs('apps.payments', level='INFO'):
+            self._enviar(self._evento())
+
+        self.pagamento.refresh_from_db()
+        self.assertEqual(self.pagamento.status, 'pago')
+        self.assertEqual(WebhookEvent.objects.get().status, 'processado')
+
+    def test_benchmark_reenvia_fluxo_e_descarta_dados(self):
+        saida = StringIO()
+        with self.assertLogs('apps.payments', level='INFO'):
+            call_command('benchmark_webhooks', eventos=20, stdout=saida)
+
+        self.assertIn('fila + worker', saida.getvalue())
+        self.assertFalse(WebhookEvent.objects.exists())
+        self.assertEqual(Pagamento.objects.count(), 1)
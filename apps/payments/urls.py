@@ -7,6 +7,9 @@ urlpatterns = [
     
     # Rota para a Secretaria criar a cobrança (Usada no Modal)
     path('criar/', views.criar_pagamento, name='criar_pagamento'),
+
+    # Cobranças do mês para todos os alunos ativos (modelos de cobrança)
+    path('cobrancas/gerar/', views.gerar_cobrancas, name='gerar_cobrancas'),
     
     # Rotas de Retorno do Stripe
     path('sucesso/', views.pagamento_sucesso, name='pagamento_sucesso'),
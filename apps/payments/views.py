@@ -9,7 +9,9 @@ from django.http import HttpResponse, JsonResponse
 from django.conf import settings
 from apps.dashboards.views import issecretaria
 from .models import Pagamento
+from .services.cobranca_service import CobrancaService
 from .services.stripe_service import StripeService
+from .services.webhook_service import WebhookService
 import stripe
 
 @login_required
@@ -21,19 +23,11 @@ def iniciar_pagamento(request, pagamento_id):
     
     # Define o domínio atual (em produção, isso deve ser ajustado)
     domain_url = f"{request.scheme}://{request.get_host()}"
-    
-    session_id, session_url = StripeService.criar_sessao_checkout(
-        pagamento_id=pagamento.id,
-        valor_decimal=pagamento.valor,
-        descricao=pagamento.descricao,
-        email_usuario=request.user.email,
-        domain_url=domain_url
-    )
+
+    # Cliques repetidos reaproveitam a sessão salva no pagamento
+    session_url = StripeService.obter_checkout_url(pagamento, request.user.email, domain_url)
 
     if session_url:
-        # Salva o ID da sessão para referência futura
-        pagamento.stripe_checkout_id = session_id
-        pagamento.save()
         return redirect(session_url)
     else:
         return render(request, 'pagamentos/erro.html', {'message': 'Erro ao conectar com Stripe'})
@@ -49,38 +43,22 @@ def pagamento_cancelado(request):
 @csrf_exempt
 def stripe_webhook(request):
     """
-    Recebe avisos do Stripe quando um pagamento é confirmado.
-    Atualiza o status no banco de dados automaticamente.
+    Recebe avisos do Stripe (ex.: pagamento confirmado).
+    Só verifica a assinatura e grava o evento na caixa de entrada; o status
+    dos pagamentos é atualizado pelo worker (python manage.py processar_webhooks).
     """
-    payload = request.body
-    sig_header = request.META.get('HTTP_STRIPE_SIGNATURE')
-    event = None
-
     try:
-        event = stripe.Webhook.construct_event(
-            payload, sig_header, settings.STRIPE_WEBHOOK_SECRET
-        )
-    except ValueError as e:
+        evento = WebhookService.verificar_evento(request.body, request.META.get('HTTP_STRIPE_SIGNATURE'))
+    except ValueError:
         return HttpResponse(status=400) # Payload inválido
-    except stripe.error.SignatureVerificationError as e:
+    except stripe.error.SignatureVerificationError:
         return HttpResponse(status=400) # Assinatura inválida
 
-    # Verifica se o evento é de sessão completada
-    if event['type'] == 'checkout.session.completed':
-        session = event['data']['object']
-        
-        # Recupera o ID do pagamento que enviamos nos metadados
-        pagamento_id = session.get('metadata', {}).get('pagamento_id')
-        
-        if pagamento_id:
-            try:
-                pagamento = Pagamento.objects.get(id=pagamento_id)
-                pagamento.status = 'pago'
-                pagamento.stripe_payment_intent = session.get('payment_intent')
-                pagamento.save()
-                print(f"Pagamento {pagamento_id} confirmado!")
-            except Pagamento.DoesNotExist:
-                pass
+    WebhookService.registrar_evento(evento)
+    if not settings.PAGAMENTOS_WEBHOOK_ASSINCRONO:
+        # Sem worker, eventos que falharam antes também são retentados aqui
+        WebhookService.liberar_travados()
+        WebhookService.processar_fila()
 
     return HttpResponse(status=200)
 
@@ -123,4 +101,31 @@ def criar_pagamento(request):
     except User.DoesNotExist:
         return JsonResponse({'success': False, 'error': 'Aluno não encontrado.'})
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)})
\ No newline at end of file
+        return JsonResponse({'success': False, 'error': str(e)})
+
+
+@login_required
+@require_POST
+def gerar_cobrancas(request):
+    """
+    Endpoint para a Secretaria gerar as cobranças de uma competência para
+    todos os alunos ativos, a partir dos modelos de cobrança.
+    Recebe JSON: { 'periodo': 'AAAA-MM' }
+    """
+    if not issecretaria(request.user):
+        return JsonResponse({'success': False, 'error': 'Acesso negado.'}, status=403)
+
+    try:
+        periodo = json.loads(request.body).get('periodo')
+        execucao = CobrancaService.gerar_cobrancas(periodo, solicitante=request.user)
+    except (ValueError, AttributeError) as e:
+        return JsonResponse({'success': False, 'error': str(e) or 'Dados inválidos.'})
+
+    return JsonResponse({
+        'success': True,
+        'message': f'{execucao.cobrancas_criadas} cobrança(s) gerada(s) para {periodo}.',
+        'criadas': execucao.cobrancas_criadas,
+        'existentes': execucao.cobrancas_existentes,
+        'sem_modelo': execucao.alunos_sem_modelo,
+        'duracao_ms': execucao.duracao_ms,
+    })
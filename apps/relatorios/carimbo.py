@@ -0,0 +1,146 @@
+"""
+Carimbo do código de validação em PDFs já renderizados.
+
+O corpo de cada documento é renderizado uma única vez, sem código, e
+guardado pelo hash do conteúdo (DocumentoService.armazenar_conteudo). Cada
+DocumentoEmitido recebe uma cópia desse corpo com o seu próprio código,
+acrescentado como atualização incremental do PDF: novos fluxos de conteúdo
+na última página, gravado depois do %%EOF original, sem reprocessar o corpo.
+Os fluxos originais da página ficam entre q/Q, então o carimbo não herda a
+matriz de transformação nem a cor que eles deixaram ativas.
+
+Funciona com os PDFs do ReportLab (tabela xref clássica e objetos em texto);
+qualquer outra estrutura levanta ValueError.
+"""
+import re
+
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+FONTE = 'Helvetica'
+TAMANHO_FONTE = 9
+# Altura da linha do código, dentro da margem inferior de todos os documentos
+ALTURA = 0.3 * inch
+
+REF_RE = rb'%s\s+(\d+)\s+0\s+R'
+
+
+def carimbar(pdf, texto):
+    """Retorna `pdf` (bytes) com `texto` centralizado no rodapé da última página."""
+    inicio_xref = int(re.findall(rb'startxref\s+(\d+)', pdf)[-1])
+    offsets, trailer = _ler_xref(pdf, inicio_xref)
+
+    raiz = _referencia(trailer, b'/Root')
+    catalogo = _objeto(pdf, offsets, raiz)
+    numero_pagina = _ultima_pagina(pdf, offsets, _referencia(catalogo, b'/Pages'))
+    pagina = _objeto(pdf, offsets, numero_pagina)
+
+    nome_fonte = _nome_fonte(pdf, offsets, pagina)
+    x0, _, x1, _ = (float(v) for v in re.search(rb'/MediaBox\s*\[([^\]]*)\]', pagina).group(1).split())
+    x = x0 + ((x1 - x0) - stringWidth(texto, FONTE, TAMANHO_FONTE)) / 2
+    # Q fecha o q posto antes dos fluxos originais; a cor é definida aqui (preto)
+    conteudo = b'Q 0 g BT /%s %d Tf %.2f %.2f Td (%s) Tj ET' % (
+        nome_fonte, TAMANHO_FONTE, x, ALTURA, _literal(texto)
+    )
+
+    # Dois objetos novos: o fluxo com 'q' (antes dos originais) e o do carimbo
+    abre = int(re.search(rb'/Size\s+(\d+)', trailer).group(1))
+    carimbo = abre + 1
+    if re.search(rb'/Contents\s*\[', pagina):
+        pagina = re.sub(
+            rb'/Contents\s*\[([^\]]*)\]', rb'/Contents [ %d 0 R \1 %d 0 R ]' % (abre, carimbo), pagina, count=1
+        )
+    else:
+        pagina = re.sub(
+            REF_RE % rb'/Contents', rb'/Contents [ %d 0 R \1 0 R %d 0 R ]' % (abre, carimbo), pagina, count=1
+        )
+
+    saida = bytearray(pdf if pdf.endswith(b'\n') else pdf + b'\n')
+    offsets_novos = {}
+    for numero, fluxo in ((abre, b'q'), (carimbo, conteudo)):
+        offsets_novos[numero] = len(saida)
+        saida += b'%d 0 obj\n<< /Length %d >>\nstream\n%s\nendstream\nendobj\n' % (numero, len(fluxo) + 1, fluxo)
+    offsets_novos[numero_pagina] = len(saida)
+    saida += b'%d 0 obj\n%s\nendobj\n' % (numero_pagina, pagina)
+
+    offset_xref = len(saida)
+    saida += b'xref\n0 1\n0000000000 65535 f \n'
+    for numero, offset in sorted(offsets_novos.items()):
+        saida += b'%d 1\n%010d 00000 n \n' % (numero, offset)
+
+    extras = b''
+    info = re.search(REF_RE % rb'/Info', trailer)
+    if info:
+        extras += b' /Info %s 0 R' % info.group(1)
+    identificador = re.search(rb'/ID\s*\[[^\]]*\]', trailer)
+    if identificador:
+        extras += b' ' + identificador.group(0)
+    saida += b'trailer\n<< /Size %d /Root %d 0 R%s /Prev %d >>\nstartxref\n%d\n%%%%EOF\n' % (
+        carimbo + 1, raiz, extras, inicio_xref, offset_xref
+    )
+    return bytes(saida)
+
+
+def _ler_xref(pdf, inicio):
+    """
+    Offsets dos objetos e o dicionário do trailer mais recente, seguindo
+    /Prev pelas atualizações incrementais anteriores.
+    """
+    offsets, trailer = {}, None
+    while inicio is not None:
+        if not pdf.startswith(b'xref', inicio):
+            raise ValueError('PDF sem tabela xref clássica')
+        fim = pdf.index(b'trailer', inicio)
+        secao = pdf[fim:pdf.index(b'startxref', fim)]
+        trailer = trailer or secao
+        linhas = pdf[inicio + 4:fim].split()
+        i = 0
+        while i < len(linhas):
+            primeiro, quantidade = int(linhas[i]), int(linhas[i + 1])
+            i += 2
+            for numero in range(primeiro, primeiro + quantidade):
+                offset, _, tipo = linhas[i:i + 3]
+                # Seções mais novas prevalecem sobre as anteriores
+                if tipo == b'n':
+                    offsets.setdefault(numero, int(offset))
+                i += 3
+        anterior = re.search(rb'/Prev\s+(\d+)', secao)
+        inicio = int(anterior.group(1)) if anterior else None
+    return offsets, trailer
+
+
+def _objeto(pdf, offsets, numero):
+    """Conteúdo entre 'N 0 obj' e 'endobj' (apenas dicionários, sem fluxo)."""
+    inicio = offsets[numero]
+    corpo = pdf[pdf.index(b'obj', inicio) + 3:pdf.index(b'endobj', inicio)]
+    return corpo.strip()
+
+
+def _referencia(dicionario, chave):
+    achado = re.search(REF_RE % re.escape(chave), dicionario)
+    if not achado:
+        raise ValueError(f'Referência {chave.decode()} não encontrada')
+    return int(achado.group(1))
+
+
+def _ultima_pagina(pdf, offsets, numero):
+    """Número do objeto da última página, descendo pela árvore de páginas."""
+    no = _objeto(pdf, offsets, numero)
+    if not re.search(rb'/Type\s*/Pages\b', no):
+        return numero
+    filhos = re.findall(rb'(\d+)\s+0\s+R', re.search(rb'/Kids\s*\[([^\]]*)\]', no).group(1))
+    return _ultima_pagina(pdf, offsets, int(filhos[-1]))
+
+
+def _nome_fonte(pdf, offsets, pagina):
+    """Nome do recurso de fonte da página que aponta para a Helvetica."""
+    fontes = _objeto(pdf, offsets, _referencia(pagina, b'/Font'))
+    for nome, numero in re.findall(rb'/(\w+)\s+(\d+)\s+0\s+R', fontes):
+        if re.search(rb'/BaseFont\s*/%s\b(?!-)' % FONTE.encode(), _objeto(pdf, offsets, int(numero))):
+            return nome
+    raise ValueError(f'Fonte {FONTE} não encontrada na página')
+
+
+def _literal(texto):
+    """Texto como string literal do PDF (WinAnsiEncoding, como as fontes do ReportLab)."""
+    return texto.encode('cp1252').replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
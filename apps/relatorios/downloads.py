@@ -0,0 +1,125 @@
+"""
+Entrega dos PDFs emitidos (download_documento).
+
+Um documento concluído nunca muda: o ETag é o próprio UUID do documento,
+então o navegador pode revalidar com If-None-Match e receber 304 sem que o
+arquivo seja lido. Também há suporte a um intervalo de bytes (Range) e, se
+configurado, o envio do arquivo é delegado ao servidor web:
+
+    DOCUMENTOS_DOWNLOAD_OFFLOAD = 'x-sendfile'        # Apache (mod_xsendfile)
+    DOCUMENTOS_DOWNLOAD_OFFLOAD = 'x-accel-redirect'  # Nginx
+    DOCUMENTOS_ACCEL_PREFIX = '/protected-media/'     # location internal do Nginx
+"""
+import re
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date
+
+TAMANHO_BLOCO = 64 * 1024
+CACHE_CONTROL = 'private, max-age=31536000, immutable'
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def servir_documento(request, doc):
+    """Resposta HTTP do PDF do documento, respeitando cabeçalhos condicionais e Range"""
+    etag = f'"{doc.id}"'
+    modificado_em = doc.processado_em or doc.data_emissao
+    ultima_modificacao = int(modificado_em.timestamp()) if modificado_em else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=ultima_modificacao)
+    if response is None:
+        response = _resposta_offload(doc) or _resposta_arquivo(request, doc, etag)
+        response.headers['Content-Disposition'] = content_disposition_header(
+            as_attachment=True, filename=doc.nome_arquivo_original
+        )
+
+    response.headers['ETag'] = etag
+    if ultima_modificacao:
+        response.headers['Last-Modified'] = http_date(ultima_modificacao)
+    response.headers['Cache-Control'] = CACHE_CONTROL
+    return response
+
+
+def _resposta_offload(doc):
+    """Delegação ao servidor web (X-Sendfile / X-Accel-Redirect), se configurada"""
+    modo = getattr(settings, 'DOCUMENTOS_DOWNLOAD_OFFLOAD', '')
+    if modo == 'x-sendfile':
+        response = HttpResponse(content_type='application/pdf')
+        response.headers['X-Sendfile'] = doc.arquivo.path
+        return response
+    if modo == 'x-accel-redirect':
+        response = HttpResponse(content_type='application/pdf')
+        prefixo = getattr(settings, 'DOCUMENTOS_ACCEL_PREFIX', '/protected-media/')
+        response.headers['X-Accel-Redirect'] = prefixo.rstrip('/') + '/' + doc.arquivo.name
+        return response
+    return None
+
+
+def _intervalo(request, etag, tamanho):
+    """
+    Interpreta um único intervalo 'bytes=início-fim'. Retorna (início, fim),
+    None para enviar o arquivo inteiro ou False se o intervalo for inválido.
+    """
+    cabecalho = request.headers.get('Range')
+    if not cabecalho:
+        return None
+    # If-Range com outro ETag: o cliente tem uma versão diferente, envia tudo
+    if_range = request.headers.get('If-Range')
+    if if_range and if_range != etag:
+        return None
+
+    match = RANGE_RE.match(cabecalho.strip())
+    if not match or not any(match.groups()):
+        return None
+
+    inicio, fim = match.groups()
+    if inicio:
+        inicio = int(inicio)
+        fim = min(int(fim), tamanho - 1) if fim else tamanho - 1
+    else:
+        # bytes=-N: os últimos N bytes
+        inicio = max(tamanho - int(fim), 0)
+        fim = tamanho - 1
+
+    if inicio >= tamanho or inicio > fim:
+        return False
+    return inicio, fim
+
+
+def _resposta_arquivo(request, doc, etag):
+    tamanho = doc.arquivo.size
+    intervalo = _intervalo(request, etag, tamanho)
+
+    if intervalo is False:
+        response = HttpResponse(status=416)
+        response.headers['Content-Range'] = f'bytes */{tamanho}'
+        return response
+
+    if intervalo is None:
+        response = FileResponse(doc.arquivo.open('rb'), content_type='application/pdf')
+        response.headers['Accept-Ranges'] = 'bytes'
+        return response
+
+    inicio, fim = intervalo
+    response = StreamingHttpResponse(
+        _ler_intervalo(doc.arquivo.open('rb'), inicio, fim - inicio + 1),
+        status=206,
+        content_type='application/pdf',
+    )
+    response.headers['Content-Range'] = f'bytes {inicio}-{fim}/{tamanho}'
+    response.headers['Content-Length'] = str(fim - inicio + 1)
+    response.headers['Accept-Ranges'] = 'bytes'
+    return response
+
+
+def _ler_intervalo(arquivo, inicio, restante):
+    with arquivo:
+        arquivo.seek(inicio)
+        while restante > 0:
+            bloco = arquivo.read(min(TAMANHO_BLOCO, restante))
+            if not bloco:
+                break
+            restante -= len(bloco)
+            yield bloco
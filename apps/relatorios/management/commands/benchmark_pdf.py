@@ -0,0 +1,81 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Image as RLImage
+
+from apps.relatorios.pdf_service import (
+    GeradorPDFSENAI, _criar_estilos, caminho_logo, logo_flowable, obter_gerador
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede o custo de preparação por documento (estilos e logo) e o tempo '
+        'total de um boletim, recriando tudo a cada PDF (antes) e usando os '
+        'recursos compartilhados do processo (depois). Não acessa o banco.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeticoes',
+            type=int,
+            default=200,
+            help='Documentos medidos por cenário (padrão: 200)'
+        )
+
+    def handle(self, *args, **options):
+        repeticoes = options['repeticoes']
+        dados = {
+            'nome': 'Aluno Benchmark',
+            'ra': 'RA00000',
+            'turma': 'TADS 2025/1 (Análise e Desenvolvimento)',
+            'notas': [(f'Disciplina {i}', 7.5, 90.0, 'Aprovado') for i in range(8)],
+        }
+
+        # Aquece os caches antes de medir o cenário "depois"
+        obter_gerador()
+        logo_flowable(1.2 * inch, 1.2 * inch)
+
+        cenarios = [
+            ('preparação (antes)', self._preparacao_antes),
+            ('preparação (depois)', self._preparacao_depois),
+            ('boletim (antes)', lambda: self._gerador_sem_cache().gerar_boletim(dados, 'BENCH')),
+            ('boletim (depois)', lambda: obter_gerador().gerar_boletim(dados, 'BENCH')),
+        ]
+
+        self.stdout.write(f'{"cenário":<22} | {"mediana (ms)":>12} | {"p95 (ms)":>10}')
+        self.stdout.write('-' * 50)
+        for nome, funcao in cenarios:
+            tempos = []
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                funcao()
+                tempos.append((time.perf_counter() - inicio) * 1000)
+            p95 = statistics.quantiles(tempos, n=20)[-1] if len(tempos) > 1 else tempos[0]
+            self.stdout.write(f'{nome:<22} | {statistics.median(tempos):>12.3f} | {p95:>10.3f}')
+
+        self.stdout.write(self.style.SUCCESS('✓ Benchmark concluído'))
+
+    @staticmethod
+    def _gerador_sem_cache():
+        """Reproduz o construtor anterior: folha de estilos montada a cada documento"""
+        gerador = GeradorPDFSENAI()
+        gerador.styles = _criar_estilos()
+        return gerador
+
+    def _preparacao_antes(self):
+        """Estilos + busca e decodificação do logo, como era feito por documento"""
+        self._gerador_sem_cache()
+        caminho = caminho_logo.__wrapped__()
+        if caminho:
+            logo = RLImage(caminho, width=1.2 * inch, height=1.2 * inch)
+            logo._img = ImageReader(caminho)
+            logo._img.getRGBData()
+
+    @staticmethod
+    def _preparacao_depois():
+        obter_gerador()
+        logo_flowable(1.2 * inch, 1.2 * inch)
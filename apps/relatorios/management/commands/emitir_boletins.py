@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.academico.models import Curso, Turma
+from apps.relatorios.services import DocumentoService
+
+
+class Command(BaseCommand):
+    help = (
+        'Emite o boletim de todos os alunos de uma turma ou de um curso, '
+        'renderizando os PDFs em paralelo.'
+    )
+
+    def add_arguments(self, parser):
+        alvo = parser.add_mutually_exclusive_group(required=True)
+        alvo.add_argument('--turma', type=int, help='ID da turma')
+        alvo.add_argument('--curso', type=int, help='ID do curso')
+        parser.add_argument(
+            '--processos',
+            type=int,
+            default=None,
+            help='Processos de renderização (padrão: número de CPUs; 1 desativa o pool)'
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=100,
+            help='Alunos por lote de consulta ao histórico (padrão: 100)'
+        )
+        parser.add_argument(
+            '--zip',
+            action='store_true',
+            help='Também gera um ZIP com todos os boletins'
+        )
+
+    def handle(self, *args, **options):
+        turma = curso = None
+        try:
+            if options['turma']:
+                turma = Turma.objects.select_related('id_curso').get(pk=options['turma'])
+            else:
+                curso = Curso.objects.get(pk=options['curso'])
+        except (Turma.DoesNotExist, Curso.DoesNotExist):
+            raise CommandError('Turma ou curso não encontrado.')
+
+        resultado = DocumentoService.emitir_boletins_turma(
+            turma=turma,
+            curso=curso,
+            processos=options['processos'],
+            tamanho_lote=options['lote'],
+            gerar_zip=options['zip'],
+        )
+
+        total = len(resultado['documentos'])
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ {total - resultado['erros']} boletim(ns) emitido(s) em {resultado['duracao']:.1f}s "
+            f"({resultado['docs_por_segundo']:.1f} docs/s)"
+        ))
+        if resultado['erros']:
+            self.stdout.write(self.style.WARNING(f"⚠ {resultado['erros']} boletim(ns) com erro"))
+        if resultado['zip']:
+            self.stdout.write(f"ZIP: {resultado['zip']}")
@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.relatorios.services import DocumentoService
+
+
+class Command(BaseCommand):
+    help = (
+        'Gera os PDFs pendentes da fila de documentos (DocumentoEmitido). '
+        'Sem --continuo, processa até esvaziar a fila e termina (uso em cron).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--continuo',
+            action='store_true',
+            help='Continua aguardando novos pedidos após esvaziar a fila'
+        )
+        parser.add_argument(
+            '--intervalo',
+            type=float,
+            default=2.0,
+            help='Segundos entre consultas à fila no modo contínuo (padrão: 2)'
+        )
+        parser.add_argument(
+            '--limite',
+            type=int,
+            default=None,
+            help='Quantidade máxima de documentos por rodada'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                liberados = DocumentoService.liberar_travados()
+                if liberados:
+                    self.stdout.write(self.style.WARNING(f'↺ {liberados} documento(s) travado(s) devolvido(s) à fila'))
+
+                inicio = time.perf_counter()
+                concluidos, erros = DocumentoService.processar_fila(limite=options['limite'])
+                if concluidos or erros:
+                    duracao = time.perf_counter() - inicio
+                    self.stdout.write(self.style.SUCCESS(
+                        f'✓ {concluidos} documento(s) gerado(s), {erros} erro(s) em {duracao:.1f}s'
+                    ))
+
+                if not options['continuo']:
+                    break
+                if not (concluidos or erros):
+                    time.sleep(options['intervalo'])
+        except KeyboardInterrupt:
+            self.stdout.write('Worker interrompido.')
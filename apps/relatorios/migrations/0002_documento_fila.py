@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def marcar_existentes_como_concluidos(apps, schema_editor):
+    # Documentos emitidos antes da fila já têm o PDF gravado
+    DocumentoEmitido = apps.get_model('relatorios', 'DocumentoEmitido')
+    DocumentoEmitido.objects.exclude(arquivo='').update(status='concluido')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academico', '0003_desempenhoaluno'),
+        ('relatorios', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentoemitido',
+            name='erro_mensagem',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='documentoemitido',
+            name='processado_em',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='documentoemitido',
+            name='status',
+            field=models.CharField(choices=[('pendente', 'Pendente'), ('processando', 'Processando'), ('concluido', 'Concluído'), ('erro', 'Erro')], default='pendente', max_length=12),
+        ),
+        migrations.AddField(
+            model_name='documentoemitido',
+            name='tentativas',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='documentoemitido',
+            name='arquivo',
+            field=models.FileField(blank=True, upload_to='documentos/%Y/%m/'),
+        ),
+        migrations.AddIndex(
+            model_name='documentoemitido',
+            index=models.Index(fields=['status', 'data_emissao'], name='documento_fila_idx'),
+        ),
+        migrations.RunPython(marcar_existentes_como_concluidos, migrations.RunPython.noop),
+    ]
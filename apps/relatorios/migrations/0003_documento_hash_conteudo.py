@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('relatorios', '0002_documento_fila'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentoemitido',
+            name='hash_conteudo',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
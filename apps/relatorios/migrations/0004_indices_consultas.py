@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academico', '0005_indices_consultas'),
+        ('relatorios', '0003_documento_hash_conteudo'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='documentoemitido',
+            index=models.Index(fields=['aluno', '-data_emissao'], name='documento_aluno_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documentoemitido',
+            index=models.Index(fields=['-data_emissao'], name='documento_recentes_idx'),
+        ),
+    ]
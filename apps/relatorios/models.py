@@ -3,6 +3,10 @@ from django.conf import settings
 import uuid
 import os
 
+def gerar_codigo_validacao():
+    """Gera um código único simples para validação"""
+    return str(uuid.uuid4().hex)[:12].upper()
+
 class DocumentoEmitido(models.Model):
     TIPO_CHOICES = [
         ('BOLETIM', 'Boletim Escolar'),
@@ -11,6 +15,14 @@ class DocumentoEmitido(models.Model):
         ('CERTIFICADO', 'Certificado de Conclusão'),
     ]
 
+    # Ciclo de vida na fila de geração (ver DocumentoService)
+    STATUS_CHOICES = [
+        ('pendente', 'Pendente'),
+        ('processando', 'Processando'),
+        ('concluido', 'Concluído'),
+        ('erro', 'Erro'),
+    ]
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     aluno = models.ForeignKey(
         'academico.Aluno', 
@@ -25,19 +37,34 @@ class DocumentoEmitido(models.Model):
         help_text="Quem pediu o documento (o próprio aluno ou secretaria)"
     )
     tipo = models.CharField(max_length=20, choices=TIPO_CHOICES)
-    arquivo = models.FileField(upload_to='documentos/%Y/%m/')
+    arquivo = models.FileField(upload_to='documentos/%Y/%m/', blank=True)
     codigo_validacao = models.CharField(max_length=32, unique=True, editable=False)
     data_emissao = models.DateTimeField(auto_now_add=True)
+
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default='pendente')
+    tentativas = models.PositiveSmallIntegerField(default=0)
+    erro_mensagem = models.TextField(blank=True)
+    processado_em = models.DateTimeField(null=True, blank=True)
+    # SHA-256 do conteúdo impresso, sem o código de validação; documentos
+    # idênticos reaproveitam o mesmo corpo renderizado (ver DocumentoService)
+    hash_conteudo = models.CharField(max_length=64, blank=True, db_index=True)
     
     class Meta:
         ordering = ['-data_emissao']
         verbose_name = 'Documento Emitido'
         verbose_name_plural = 'Documentos Emitidos'
+        indexes = [
+            # O worker busca os pendentes mais antigos primeiro
+            models.Index(fields=['status', 'data_emissao'], name='documento_fila_idx'),
+            # Documentos de um aluno, dos mais recentes (relatórios e histórico)
+            models.Index(fields=['aluno', '-data_emissao'], name='documento_aluno_idx'),
+            # Últimos emitidos no dashboard da secretaria e na gestão de documentos
+            models.Index(fields=['-data_emissao'], name='documento_recentes_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.codigo_validacao:
-            # Gera um código único simples para validação
-            self.codigo_validacao = str(uuid.uuid4().hex)[:12].upper()
+            self.codigo_validacao = gerar_codigo_validacao()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -45,4 +72,12 @@ class DocumentoEmitido(models.Model):
     
     @property
     def nome_arquivo_original(self):
-        return os.path.basename(self.arquivo.name)
\ No newline at end of file
+        if self.hash_conteudo:
+            # O arquivo é guardado pelo hash; o nome de download segue o padrão antigo
+            prefixo = {'BOLETIM': 'Boletim', 'DECLARACAO': 'Declaracao'}.get(self.tipo, self.tipo.title())
+            return f"{prefixo}_{self.aluno.RA_aluno}_{self.data_emissao.strftime('%Y%m%d')}.pdf"
+        return os.path.basename(self.arquivo.name)
+
+    @property
+    def disponivel(self):
+        return self.status == 'concluido' and bool(self.arquivo)
@@ -4,8 +4,10 @@ from reportlab.platypus import Image as RLImage
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
 from datetime import datetime
+from functools import lru_cache
 import io
 from decimal import Decimal
 import os
@@ -17,55 +19,193 @@ from django.conf import settings
 from reportlab.graphics.shapes import Drawing
 from reportlab.graphics.barcode.qr import QrCodeWidget
 from reportlab.graphics import renderPM
-from django.db.models import Avg, Sum
+from django.db.models import Avg, Count, Q, Sum
+
+# Versão do layout dos documentos do aluno. Incrementar sempre que o visual
+# de gerar_boletim/gerar_declaracao mudar: a versão entra na impressão
+# digital dos PDFs reaproveitados (DocumentoService.impressao_digital).
+VERSAO_TEMPLATE = 2
+
+# ==========================================
+# Recursos compartilhados (montados uma vez por processo)
+# ==========================================
+
+LOGO_CANDIDATOS = ('logo.png', 'senai-logo.png', 'logo_senai.png')
+
+
+def _criar_estilos():
+    """Folha de estilos base do ReportLab + estilos do SENAI"""
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        name='Titulo',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#c41e3a'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='Subtitulo',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#333333'),
+        spaceAfter=12,
+        fontName='Helvetica-Bold'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='NormalJustificado',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=colors.black,
+        spaceAfter=12,
+        alignment=TA_JUSTIFY,
+        leading=18
+    ))
+
+    styles.add(ParagraphStyle(
+        name='Rodape',
+        fontSize=9,
+        textColor=colors.HexColor('#666666'),
+        alignment=TA_CENTER,
+        spaceAfter=6
+    ))
+    return styles
+
+
+@lru_cache(maxsize=1)
+def estilos_compartilhados():
+    return _criar_estilos()
+
+
+@lru_cache(maxsize=1)
+def caminho_logo():
+    """Primeiro logo encontrado em static/img (ou None)"""
+    for nome in LOGO_CANDIDATOS:
+        caminho = os.path.join(getattr(settings, 'BASE_DIR', ''), 'static', 'img', nome)
+        if os.path.exists(caminho):
+            return caminho
+    return None
+
+
+@lru_cache(maxsize=1)
+def logo_reader():
+    """Logo já decodificado, reaproveitado por todos os PDFs do processo"""
+    caminho = caminho_logo()
+    if not caminho:
+        return None
+    try:
+        reader = ImageReader(caminho)
+        reader.getRGBData()  # força a decodificação agora, não na primeira renderização
+        return reader
+    except Exception:
+        return None
+
+
+def logo_flowable(width, height):
+    """Flowable do logo usando o ImageReader em cache (None se não houver logo)"""
+    reader = logo_reader()
+    if reader is None:
+        return None
+    imagem = RLImage(caminho_logo(), width=width, height=height)
+    # Com lazy=1 o ReportLab só lê o arquivo quando precisa de _img;
+    # entregando o reader pronto, a imagem não é decodificada de novo
+    imagem._img = reader
+    return imagem
+
+
+ESTILO_TABELA_DADOS_BOLETIM = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f5f5f5')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+])
+
+ESTILO_TABELA_NOTAS_BOLETIM = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#c41e3a')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
+ESTILO_TABELA_INFO = TableStyle([
+    ('BACKGROUND', (0,0), (0,-1), colors.HexColor('#f5f5f5')),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+    ('FONTNAME', (0,0), (0,-1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (-1,-1), 10),
+    ('GRID', (0,0), (-1,-1), 0.25, colors.grey)
+])
+
+ESTILO_TABELA_RESUMO = TableStyle([
+    ('BACKGROUND', (0,0), (0,-1), colors.HexColor('#f9f9f9')),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+    ('FONTNAME', (0,0), (0,-1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0,0), (-1,-1), 10),
+    ('GRID', (0,0), (-1,-1), 0.25, colors.grey)
+])
+
+ESTILO_TABELA_HISTORICO = TableStyle([
+    ('GRID', (0,0), (-1,-1), 0.25, colors.grey),
+    ('BACKGROUND',(0,0),(-1,0),colors.HexColor('#c41e3a')),
+    ('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),
+    ('FONTNAME',(0,0),(-1,0),'Helvetica-Bold'),
+    ('FONTSIZE',(0,0),(-1,-1),9),
+])
+
+ESTILO_TABELA_FINANCEIRO = TableStyle([
+    ('GRID',(0,0),(-1,-1),0.25,colors.grey),
+    ('BACKGROUND',(0,0),(0,-1),colors.HexColor('#f9f9f9')),
+    ('FONTNAME',(0,0),(0,-1),'Helvetica-Bold'),
+])
+
+ESTILO_TABELA_LISTA = TableStyle([('GRID',(0,0),(-1,-1),0.25,colors.grey), ('BACKGROUND',(0,0),(-1,0),colors.lightgrey)])
+
+ESTILO_ALINHAR_TOPO = TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP')])
+
 
 class GeradorPDFSENAI:
     """Classe para gerar PDFs profissionais para o SENAI"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._criar_estilos_customizados()
-        
-    def _criar_estilos_customizados(self):
-        self.styles.add(ParagraphStyle(
-            name='Titulo',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#c41e3a'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='Subtitulo',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#333333'),
-            spaceAfter=12,
-            fontName='Helvetica-Bold'
-        ))
+        # Estilos montados uma vez por processo e compartilhados (somente leitura)
+        self.styles = estilos_compartilhados()
         
-        self.styles.add(ParagraphStyle(
-            name='NormalJustificado',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=colors.black,
-            spaceAfter=12,
-            alignment=TA_JUSTIFY,
-            leading=18
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='Rodape',
-            fontSize=9,
-            textColor=colors.HexColor('#666666'),
-            alignment=TA_CENTER,
-            spaceAfter=6
-        ))
-    
+    @staticmethod
+    def dados_boletim(aluno, historicos=None):
+        """
+        Extrai do banco tudo o que o boletim precisa, em tipos simples (picklable).
+        Se `historicos` não for informado, busca os registros do aluno.
+        """
+        if historicos is None:
+            historicos = aluno.historico.select_related('turma_disciplina_professor__disciplina').order_by('pk')
+
+        return {
+            'nome': aluno.user.get_full_name() or aluno.user.username,
+            'ra': aluno.RA_aluno if hasattr(aluno, 'RA_aluno') else 'N/A',
+            'turma': str(aluno.turma_atual) if aluno.turma_atual else 'N/A',
+            'notas': [
+                (
+                    hist.turma_disciplina_professor.disciplina.nome,
+                    hist.media_final,
+                    hist.frequencia_percentual,
+                    hist.status_aprovacao,
+                )
+                for hist in historicos
+            ],
+        }
+
     def gerar_relatorio_aluno(self, aluno, codigo_validacao=None):
         """Gera boletim do aluno"""
+        return self.gerar_boletim(self.dados_boletim(aluno), codigo_validacao=codigo_validacao)
+
+    def gerar_boletim(self, dados, codigo_validacao=None):
+        """Gera o boletim a partir do dicionário de dados_boletim (não acessa o banco)"""
         buffer = io.BytesIO()
         pdf = SimpleDocTemplate(
             buffer,
@@ -82,46 +222,32 @@ class GeradorPDFSENAI:
         
         # Dados do Cabeçalho
         dados_aluno = [
-            ['Nome Completo:', aluno.user.get_full_name() or aluno.user.username],
-            ['RA/Matrícula:', aluno.RA_aluno if hasattr(aluno, 'RA_aluno') else 'N/A'],
-            ['Turma:', str(aluno.turma_atual) if aluno.turma_atual else 'N/A'],
+            ['Nome Completo:', dados['nome']],
+            ['RA/Matrícula:', dados['ra']],
+            ['Turma:', dados['turma']],
             ['Data de Emissão:', datetime.now().strftime('%d/%m/%Y')],
         ]
         
         tabela_aluno = Table(dados_aluno, colWidths=[2.5*inch, 3.5*inch])
-        tabela_aluno.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f5f5f5')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ]))
+        tabela_aluno.setStyle(ESTILO_TABELA_DADOS_BOLETIM)
         
         elementos.append(tabela_aluno)
         elementos.append(Spacer(1, 0.3*inch))
         elementos.append(Paragraph("Desempenho Acadêmico", self.styles['Subtitulo']))
         
         # Tabela de Notas (Simplificada para exemplo)
-        if hasattr(aluno, 'historico') and aluno.historico.exists():
+        if dados['notas']:
             dados_notas = [['Disciplina', 'Média', 'Frequência', 'Situação']]
-            for hist in aluno.historico.all():
+            for disciplina, media, frequencia, situacao in dados['notas']:
                 dados_notas.append([
-                    hist.turma_disciplina_professor.disciplina.nome,
-                    f"{hist.media_final:.1f}" if hist.media_final else "-",
-                    f"{hist.frequencia_percentual:.0f}%" if hist.frequencia_percentual else "-",
-                    hist.status_aprovacao or "Cursando"
+                    disciplina,
+                    f"{media:.1f}" if media else "-",
+                    f"{frequencia:.0f}%" if frequencia else "-",
+                    situacao or "Cursando"
                 ])
             
             tabela_notas = Table(dados_notas, colWidths=[3*inch, 1*inch, 1*inch, 1.5*inch])
-            tabela_notas.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#c41e3a')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ]))
+            tabela_notas.setStyle(ESTILO_TABELA_NOTAS_BOLETIM)
             elementos.append(tabela_notas)
         else:
             elementos.append(Paragraph("Nenhum registro de notas encontrado.", self.styles['NormalJustificado']))
@@ -135,8 +261,22 @@ class GeradorPDFSENAI:
         buffer.seek(0)
         return buffer
 
+    @staticmethod
+    def dados_declaracao(aluno):
+        """Dados impressos na declaração de matrícula, em tipos simples"""
+        return {
+            'nome': aluno.user.get_full_name().upper(),
+            'ra': aluno.RA_aluno,
+            'rg': aluno.RG_aluno or "Não informado",
+            'turma': aluno.turma_atual.nome if aluno.turma_atual else "Não definida",
+        }
+
     def gerar_declaracao_matricula(self, aluno, codigo_validacao=None):
         """Gera declaração formal"""
+        return self.gerar_declaracao(self.dados_declaracao(aluno), codigo_validacao=codigo_validacao)
+
+    def gerar_declaracao(self, dados, codigo_validacao=None):
+        """Gera a declaração a partir do dicionário de dados_declaracao (não acessa o banco)"""
         buffer = io.BytesIO()
         pdf = SimpleDocTemplate(
             buffer,
@@ -153,10 +293,10 @@ class GeradorPDFSENAI:
         elementos.append(Paragraph("DECLARAÇÃO DE MATRÍCULA", self.styles['Titulo']))
         elementos.append(Spacer(1, 0.5*inch))
         
-        nome = aluno.user.get_full_name().upper()
-        ra = aluno.RA_aluno
-        rg = aluno.RG_aluno or "Não informado"
-        turma = aluno.turma_atual.nome if aluno.turma_atual else "Não definida"
+        nome = dados['nome']
+        ra = dados['ra']
+        rg = dados['rg']
+        turma = dados['turma']
         ano = datetime.now().year
         
         texto = f"""
@@ -230,35 +370,15 @@ class GeradorPDFSENAI:
             ['Status Matrícula:', getattr(aluno, 'status_matricula', 'N/A')],
             ['Data de Matrícula:', aluno.data_matricula.strftime('%d/%m/%Y') if getattr(aluno, 'data_matricula', None) else 'N/A']
         ]
-        # Tentar carregar logo do projeto (static/img/logo.png ou static/img/senai-logo.png)
-        logo_candidates = [
-            os.path.join(getattr(settings, 'BASE_DIR', ''), 'static', 'img', 'logo.png'),
-            os.path.join(getattr(settings, 'BASE_DIR', ''), 'static', 'img', 'senai-logo.png'),
-            os.path.join(getattr(settings, 'BASE_DIR', ''), 'static', 'img', 'logo_senai.png'),
-        ]
-        logo_path = None
-        for p in logo_candidates:
-            if p and os.path.exists(p):
-                logo_path = p
-                break
-
         # Construir a tabela do cabeçalho; se houver logo, colocá-la à esquerda
         tabela_info = Table(dados_cab, colWidths=[2.0*inch, 4.0*inch])
-        tabela_info.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (0,-1), colors.HexColor('#f5f5f5')),
-            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-            ('FONTNAME', (0,0), (0,-1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,-1), 10),
-            ('GRID', (0,0), (-1,-1), 0.25, colors.grey)
-        ]))
+        tabela_info.setStyle(ESTILO_TABELA_INFO)
 
-        if logo_path:
-            try:
-                logo_img = RLImage(logo_path, width=1.2*inch, height=1.2*inch)
-            except Exception:
-                logo_img = Paragraph('', self.styles['Normal'])
+        # Logo do projeto (static/img), decodificado uma única vez por processo
+        logo_img = logo_flowable(1.2*inch, 1.2*inch)
+        if logo_img:
             wrapper = Table([[logo_img, tabela_info]], colWidths=[1.4*inch, 4.6*inch])
-            wrapper.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP')]))
+            wrapper.setStyle(ESTILO_ALINHAR_TOPO)
             elementos.append(wrapper)
         else:
             elementos.append(tabela_info)
@@ -276,13 +396,7 @@ class GeradorPDFSENAI:
             ['Total de Faltas:', str(faltas_total)]
         ]
         tabela_resumo = Table(resumo, colWidths=[2.0*inch, 4.0*inch])
-        tabela_resumo.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (0,-1), colors.HexColor('#f9f9f9')),
-            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-            ('FONTNAME', (0,0), (0,-1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,-1), 10),
-            ('GRID', (0,0), (-1,-1), 0.25, colors.grey)
-        ]))
+        tabela_resumo.setStyle(ESTILO_TABELA_RESUMO)
         elementos.append(tabela_resumo)
         elementos.append(Spacer(1, 0.2*inch))
 
@@ -303,13 +417,7 @@ class GeradorPDFSENAI:
                 ])
 
             tabela_h = Table(dados_h, colWidths=[2.2*inch, 1.2*inch, 0.8*inch, 0.9*inch, 1.2*inch, 1.0*inch])
-            tabela_h.setStyle(TableStyle([
-                ('GRID', (0,0), (-1,-1), 0.25, colors.grey),
-                ('BACKGROUND',(0,0),(-1,0),colors.HexColor('#c41e3a')),
-                ('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),
-                ('FONTNAME',(0,0),(-1,0),'Helvetica-Bold'),
-                ('FONTSIZE',(0,0),(-1,-1),9),
-            ]))
+            tabela_h.setStyle(ESTILO_TABELA_HISTORICO)
             elementos.append(tabela_h)
         else:
             elementos.append(Paragraph('Nenhum registro de histórico encontrado.', self.styles['NormalJustificado']))
@@ -332,11 +440,7 @@ class GeradorPDFSENAI:
             ['Número de Lançamentos:', str(pagamentos.count())]
         ]
         tabela_fin = Table(dados_fin, colWidths=[2.0*inch, 4.0*inch])
-        tabela_fin.setStyle(TableStyle([
-            ('GRID',(0,0),(-1,-1),0.25,colors.grey),
-            ('BACKGROUND',(0,0),(0,-1),colors.HexColor('#f9f9f9')),
-            ('FONTNAME',(0,0),(0,-1),'Helvetica-Bold'),
-        ]))
+        tabela_fin.setStyle(ESTILO_TABELA_FINANCEIRO)
         elementos.append(tabela_fin)
 
         elementos.append(Spacer(1, 0.2*inch))
@@ -349,7 +453,7 @@ class GeradorPDFSENAI:
             for d in docs:
                 dados_docs.append([d.get_tipo_display(), d.data_emissao.strftime('%d/%m/%Y'), d.codigo_validacao])
             tabela_docs = Table(dados_docs, colWidths=[2.5*inch, 2.0*inch, 1.5*inch])
-            tabela_docs.setStyle(TableStyle([('GRID',(0,0),(-1,-1),0.25,colors.grey), ('BACKGROUND',(0,0),(-1,0),colors.lightgrey)]))
+            tabela_docs.setStyle(ESTILO_TABELA_LISTA)
             elementos.append(tabela_docs)
         else:
             elementos.append(Paragraph('Nenhum documento emitido para este aluno.', self.styles['NormalJustificado']))
@@ -409,7 +513,7 @@ class GeradorPDFSENAI:
     def gerar_relatorio_coordenacao(self, solicitante_user=None):
         """Gera um relatório de coordenação com KPIs e eficiência por curso."""
         # Importar modelos localmente
-        from apps.academico.models import Aluno, Turma, Professor, Curso, Historico
+        from apps.academico.models import Aluno, Turma, Professor, Curso, Historico, DesempenhoAluno
 
         buffer = io.BytesIO()
         pdf = SimpleDocTemplate(
@@ -453,11 +557,12 @@ class GeradorPDFSENAI:
         elementos.append(Spacer(1, 0.2*inch))
 
         # Análise de risco (média <5 ou frequência <75) considerando alunos ativos
-        historicos_agg = Historico.objects.filter(id_aluno__status_matricula__iexact='Ativo').values('id_aluno').annotate(
-            avg_media=Avg('media_final'), avg_freq=Avg('frequencia_percentual')
+        resumo_risco = DesempenhoAluno.objects.filter(aluno__status_matricula__iexact='Ativo').aggregate(
+            com_historico=Count('pk'),
+            em_risco=Count('pk', filter=Q(media__lt=5) | Q(frequencia__lt=75))
         )
-        alunos_com_historico = historicos_agg.count()
-        alunos_risco = sum(1 for h in historicos_agg if (h.get('avg_media') is not None and h.get('avg_media') < 5) or (h.get('avg_freq') is not None and h.get('avg_freq') < 75))
+        alunos_com_historico = resumo_risco['com_historico']
+        alunos_risco = resumo_risco['em_risco']
 
         elementos.append(Paragraph('Indicadores de Risco', self.styles['Subtitulo']))
         dados_risco = [
@@ -635,7 +740,7 @@ class GeradorPDFSENAI:
     def gerar_relatorio_secretaria(self, secretaria_user):
         """Gera um relatório de gestão da secretaria com KPIs financeiros e acadêmicos."""
         from apps.academico.models import Aluno, Turma, Curso, Historico
-        from apps.payments.models import Pagamento
+        from apps.payments.services.financeiro_service import FinanceiroService
         
         buffer = io.BytesIO()
         pdf = SimpleDocTemplate(
@@ -680,17 +785,19 @@ class GeradorPDFSENAI:
         elementos.append(tabela_kpis)
         elementos.append(Spacer(1, 0.2*inch))
 
-        # KPIs Financeiros
+        # KPIs Financeiros (do snapshot diário, ver gerar_snapshot_financeiro)
         elementos.append(Paragraph('KPIs Financeiros', self.styles['Subtitulo']))
-        pagamentos_total = Pagamento.objects.aggregate(t=Sum('valor'))['t'] or Decimal('0.00')
-        pagamentos_pago = Pagamento.objects.filter(status='pago').aggregate(t=Sum('valor'))['t'] or Decimal('0.00')
-        pagamentos_pendente = pagamentos_total - pagamentos_pago
+        financeiro = FinanceiroService.resumo()
+        if financeiro['data']:
+            elementos.append(Paragraph(
+                f"Posição de {financeiro['data'].strftime('%d/%m/%Y')}", self.styles['NormalJustificado']
+            ))
 
         kpis_fin = [
-            ['Total Faturado:', f"R$ {pagamentos_total:.2f}"],
-            ['Recebido:', f"R$ {pagamentos_pago:.2f}"],
-            ['Pendente:', f"R$ {pagamentos_pendente:.2f}"],
-            ['Taxa Recebimento:', f"{(pagamentos_pago/pagamentos_total*100) if pagamentos_total > 0 else 0:.1f}%"],
+            ['Total Faturado:', f"R$ {financeiro['total']:.2f}"],
+            ['Recebido:', f"R$ {financeiro['pago']:.2f}"],
+            ['Pendente:', f"R$ {financeiro['pendente']:.2f}"],
+            ['Taxa Recebimento:', f"{financeiro['taxa_recebimento']:.1f}%"],
         ]
         tabela_fin = Table(kpis_fin, colWidths=[3*inch, 3*inch])
         tabela_fin.setStyle(TableStyle([
@@ -701,6 +808,27 @@ class GeradorPDFSENAI:
         elementos.append(tabela_fin)
         elementos.append(Spacer(1, 0.2*inch))
 
+        tendencia = FinanceiroService.tendencia()
+        if tendencia:
+            elementos.append(Paragraph('Evolução da Inadimplência (últimos 30 dias)', self.styles['Subtitulo']))
+            dados_tendencia = [['Data', 'Recebido', 'Pendente', 'Inadimplência']]
+            for dia in tendencia:
+                dados_tendencia.append([
+                    dia['data'].strftime('%d/%m/%Y'),
+                    f"R$ {dia['recebido']:.2f}",
+                    f"R$ {dia['pendente']:.2f}",
+                    f"{dia['inadimplencia']:.1f}%",
+                ])
+            tabela_tendencia = Table(dados_tendencia, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
+            tabela_tendencia.setStyle(TableStyle([
+                ('GRID',(0,0),(-1,-1),0.25,colors.grey),
+                ('BACKGROUND',(0,0),(-1,0),colors.HexColor('#f5f5f5')),
+                ('FONTNAME',(0,0),(-1,0),'Helvetica-Bold'),
+                ('FONTSIZE',(0,0),(-1,-1),9),
+            ]))
+            elementos.append(tabela_tendencia)
+            elementos.append(Spacer(1, 0.2*inch))
+
         # Status de Cursos
         elementos.append(Paragraph('Status dos Cursos', self.styles['Subtitulo']))
         cursos = Curso.objects.all()
@@ -735,11 +863,19 @@ class GeradorPDFSENAI:
         buffer.seek(0)
         return buffer
 
+@lru_cache(maxsize=1)
+def obter_gerador():
+    """
+    Gerador único do processo. GeradorPDFSENAI não guarda estado entre
+    renderizações, então a mesma instância atende todas as requisições.
+    """
+    return GeradorPDFSENAI()
+
 def gerar_pdf_relatorio_turma(nome_turma, alunos):
     """Gera lista de chamada para professores"""
     buffer = io.BytesIO()
     pdf = SimpleDocTemplate(buffer, pagesize=A4)
-    styles = getSampleStyleSheet()
+    styles = estilos_compartilhados()
     
     elementos = []
     elementos.append(Paragraph(f"Lista de Chamada - Turma {nome_turma}", styles['Heading1']))
@@ -765,4 +901,21 @@ def gerar_pdf_relatorio_turma(nome_turma, alunos):
     elementos.append(tabela)
     pdf.build(elementos)
     buffer.seek(0)
-    return buffer
\ No newline at end of file
+    return buffer
+
+# ==========================================
+# Renderização em processos separados
+# ==========================================
+
+def preaquecer_recursos():
+    """Monta estilos, logo e gerador (inicializador dos processos do pool)"""
+    obter_gerador()
+    logo_reader()
+
+def renderizar_boletim_processo(dados, codigo_validacao=None):
+    """
+    Ponto de entrada dos processos do pool de emissão em lote.
+    Recebe apenas dados simples, sem acesso ao banco. A emissão em lote
+    renderiza sem código: ele é carimbado em cada documento depois.
+    """
+    return obter_gerador().gerar_boletim(dados, codigo_validacao=codigo_validacao).getvalue()
@@ -1,40 +1,311 @@
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.files import File
 from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils.text import get_valid_filename
 from django.utils.timezone import now
-from .models import DocumentoEmitido
-from .pdf_service import GeradorPDFSENAI
+from apps.academico.models import Aluno, Historico
+from .carimbo import carimbar
+from .models import DocumentoEmitido, gerar_codigo_validacao
+from .pdf_service import (
+    VERSAO_TEMPLATE, GeradorPDFSENAI, obter_gerador, preaquecer_recursos, renderizar_boletim_processo
+)
 
 class DocumentoService:
+    # Tipos que o gerador sabe renderizar
+    TIPOS_SUPORTADOS = ('BOLETIM', 'DECLARACAO')
+
+    # Documentos 'processando' há mais tempo que isso são considerados
+    # abandonados (worker interrompido) e voltam para a fila
+    TEMPO_MAXIMO_PROCESSAMENTO = timedelta(minutes=10)
+
+    # Linha carimbada no rodapé de cada PDF emitido, com o mesmo texto que
+    # gerar_boletim/gerar_declaracao imprimem quando recebem o código
+    TEXTO_VALIDACAO = {
+        'BOLETIM': 'Validação: {codigo}',
+        'DECLARACAO': 'Código de Autenticidade: {codigo}',
+    }
+
     @staticmethod
-    def emitir_novo_documento(aluno, tipo_documento, solicitante):
+    def solicitar_documento(aluno, tipo_documento, solicitante):
         """
-        Gera o PDF, salva no banco e retorna a instância.
+        Registra o pedido e retorna o documento pendente.
+        Com DOCUMENTOS_FILA_ASSINCRONA desativado, o PDF é gerado na hora.
         """
-        # 1. Cria o registro no banco (gera o ID e Código)
+        if tipo_documento not in DocumentoService.TIPOS_SUPORTADOS:
+            raise ValueError("Tipo inválido")
+
         novo_doc = DocumentoEmitido(
             aluno=aluno,
             solicitante=solicitante,
             tipo=tipo_documento
         )
         novo_doc.save()
-        
-        # 2. Gera o PDF com o código de validação
-        gerador = GeradorPDFSENAI()
-        pdf_buffer = None
-        nome_arquivo = ""
-        
-        if tipo_documento == 'BOLETIM':
-            pdf_buffer = gerador.gerar_relatorio_aluno(aluno, codigo_validacao=novo_doc.codigo_validacao)
-            nome_arquivo = f"Boletim_{aluno.RA_aluno}_{now().strftime('%Y%m%d')}.pdf"
-            
-        elif tipo_documento == 'DECLARACAO':
-            pdf_buffer = gerador.gerar_declaracao_matricula(aluno, codigo_validacao=novo_doc.codigo_validacao)
-            nome_arquivo = f"Declaracao_{aluno.RA_aluno}_{now().strftime('%Y%m%d')}.pdf"
-            
-        else:
-            novo_doc.delete()
+
+        if not settings.DOCUMENTOS_FILA_ASSINCRONA:
+            DocumentoService.renderizar_documento(novo_doc)
+        return novo_doc
+
+    @staticmethod
+    def emitir_novo_documento(aluno, tipo_documento, solicitante):
+        """
+        Gera o PDF, salva no banco e retorna a instância (sempre síncrono).
+        """
+        if tipo_documento not in DocumentoService.TIPOS_SUPORTADOS:
             raise ValueError("Tipo inválido")
-            
-        # 3. Salva o arquivo físico
-        novo_doc.arquivo.save(nome_arquivo, ContentFile(pdf_buffer.getvalue()))
-        
-        return novo_doc
\ No newline at end of file
+
+        novo_doc = DocumentoEmitido(
+            aluno=aluno,
+            solicitante=solicitante,
+            tipo=tipo_documento
+        )
+        novo_doc.save()
+
+        DocumentoService.renderizar_documento(novo_doc)
+        if novo_doc.status == 'erro':
+            raise RuntimeError(novo_doc.erro_mensagem)
+        return novo_doc
+
+    @staticmethod
+    def impressao_digital(tipo_documento, dados, historicos=()):
+        """
+        SHA-256 de tudo o que determina o PDF: tipo, versão do layout, data de
+        emissão impressa, dados do aluno e os registros de histórico usados
+        (id + data_lancamento). Não inclui o código de validação, que é
+        carimbado depois em cada documento (gravar_arquivo).
+        """
+        conteudo = {
+            'tipo': tipo_documento,
+            'versao': VERSAO_TEMPLATE,
+            'data': datetime.now().strftime('%Y-%m-%d'),
+            'dados': dados,
+            'historico': [(h.pk, h.data_lancamento.isoformat() if h.data_lancamento else None) for h in historicos],
+        }
+        return hashlib.sha256(json.dumps(conteudo, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def caminho_conteudo(hash_conteudo):
+        """Local do PDF no storage, endereçado pelo hash do conteúdo"""
+        return f"documentos/conteudo/{hash_conteudo}.pdf"
+
+    @staticmethod
+    def armazenar_conteudo(hash_conteudo, renderizar):
+        """
+        Reaproveita o corpo (PDF sem código de validação) já guardado com
+        este hash ou chama `renderizar()` (que retorna os bytes) e o guarda.
+        Retorna o caminho no storage.
+        """
+        caminho = DocumentoService.caminho_conteudo(hash_conteudo)
+        if default_storage.exists(caminho):
+            return caminho
+        return default_storage.save(caminho, ContentFile(renderizar()))
+
+    @staticmethod
+    def gravar_arquivo(documento, renderizar):
+        """
+        Arquivo do documento: o corpo reaproveitado pelo hash (`renderizar()`
+        só roda se ele ainda não existir) com o código de validação do próprio
+        documento carimbado numa cópia só dele. Preenche documento.arquivo,
+        sem salvar o registro.
+        """
+        caminho_corpo = DocumentoService.armazenar_conteudo(documento.hash_conteudo, renderizar)
+        with default_storage.open(caminho_corpo, 'rb') as corpo:
+            texto = DocumentoService.TEXTO_VALIDACAO[documento.tipo].format(codigo=documento.codigo_validacao)
+            pdf = carimbar(corpo.read(), texto)
+        documento.arquivo.save(f"{documento.id}.pdf", ContentFile(pdf), save=False)
+
+    @staticmethod
+    def renderizar_documento(documento):
+        """
+        Gera o PDF de um documento já registrado e grava o arquivo.
+        Se outro documento com o mesmo conteúdo já foi gerado, o corpo é
+        reaproveitado e só o código de validação é carimbado. Falhas ficam
+        registradas no próprio documento (status 'erro').
+        """
+        aluno = documento.aluno
+        documento.tentativas += 1
+        try:
+            gerador = obter_gerador()
+            if documento.tipo == 'BOLETIM':
+                historicos = list(
+                    aluno.historico.select_related('turma_disciplina_professor__disciplina').order_by('pk')
+                )
+                dados = gerador.dados_boletim(aluno, historicos)
+                renderizar = gerador.gerar_boletim
+            elif documento.tipo == 'DECLARACAO':
+                historicos = []
+                dados = gerador.dados_declaracao(aluno)
+                renderizar = gerador.gerar_declaracao
+            else:
+                raise ValueError("Tipo inválido")
+
+            documento.hash_conteudo = DocumentoService.impressao_digital(documento.tipo, dados, historicos)
+            DocumentoService.gravar_arquivo(documento, lambda: renderizar(dados).getvalue())
+            documento.status = 'concluido'
+            documento.erro_mensagem = ''
+        except Exception as e:
+            documento.status = 'erro'
+            documento.erro_mensagem = str(e)
+
+        documento.processado_em = now()
+        documento.save(update_fields=['arquivo', 'hash_conteudo', 'status', 'erro_mensagem', 'tentativas', 'processado_em'])
+        return documento
+
+    @staticmethod
+    def reservar_proximo():
+        """
+        Reserva o pendente mais antigo para este worker.
+        A reserva é um UPDATE condicional: se outro worker pegou o mesmo
+        documento antes, tenta o seguinte.
+        """
+        while True:
+            documento_id = DocumentoEmitido.objects.filter(status='pendente').order_by(
+                'data_emissao'
+            ).values_list('id', flat=True).first()
+            if documento_id is None:
+                return None
+
+            reservado = DocumentoEmitido.objects.filter(id=documento_id, status='pendente').update(
+                status='processando', processado_em=now()
+            )
+            if reservado:
+                return DocumentoEmitido.objects.select_related('aluno__user').get(id=documento_id)
+
+    @staticmethod
+    def liberar_travados():
+        """Devolve para a fila documentos presos em 'processando'. Retorna quantos."""
+        limite = now() - DocumentoService.TEMPO_MAXIMO_PROCESSAMENTO
+        return DocumentoEmitido.objects.filter(status='processando', processado_em__lt=limite).update(
+            status='pendente'
+        )
+
+    @staticmethod
+    def processar_fila(limite=None):
+        """Renderiza pendentes até esvaziar a fila (ou atingir o limite). Retorna (concluidos, erros)."""
+        concluidos = erros = 0
+        while limite is None or concluidos + erros < limite:
+            documento = DocumentoService.reservar_proximo()
+            if documento is None:
+                break
+            DocumentoService.renderizar_documento(documento)
+            if documento.status == 'concluido':
+                concluidos += 1
+            else:
+                erros += 1
+        return concluidos, erros
+
+    @staticmethod
+    def emitir_boletins_turma(turma=None, curso=None, solicitante=None, processos=None,
+                              tamanho_lote=100, gerar_zip=False):
+        """
+        Emite o boletim de todos os alunos de uma turma ou de um curso.
+
+        Os alunos são lidos em lotes: para cada lote, o histórico inteiro vem
+        em uma única consulta e os PDFs são renderizados em paralelo por um
+        pool de processos (que recebe apenas dados simples, sem acesso ao
+        banco). Cada aluno gera o seu DocumentoEmitido; opcionalmente, todos
+        os PDFs são reunidos em um ZIP.
+
+        Retorna um dicionário com os documentos, o caminho do ZIP (ou None),
+        a duração e a vazão em documentos por segundo.
+        """
+        if turma is None and curso is None:
+            raise ValueError("Informe a turma ou o curso")
+
+        alunos = Aluno.objects.select_related('user', 'turma_atual__id_curso').order_by('user__first_name', 'pk')
+        alunos = alunos.filter(turma_atual=turma) if turma is not None else alunos.filter(turma_atual__id_curso=curso)
+        alunos = list(alunos)
+
+        processos = processos or os.cpu_count() or 1
+        inicio = time.perf_counter()
+        documentos, erros = [], 0
+        arquivo_zip = tempfile.TemporaryFile() if gerar_zip else None
+        zip_pdfs = zipfile.ZipFile(arquivo_zip, 'w', zipfile.ZIP_DEFLATED) if gerar_zip else None
+
+        executor = ProcessPoolExecutor(max_workers=processos, initializer=preaquecer_recursos) if processos > 1 and len(alunos) > 1 else None
+        try:
+            for pos in range(0, len(alunos), tamanho_lote):
+                lote = alunos[pos:pos + tamanho_lote]
+
+                # Todo o histórico do lote em uma consulta
+                historicos = defaultdict(list)
+                for hist in Historico.objects.filter(id_aluno__in=[a.pk for a in lote]).select_related(
+                    'turma_disciplina_professor__disciplina'
+                ).order_by('pk'):
+                    historicos[hist.id_aluno_id].append(hist)
+
+                pedidos = DocumentoEmitido.objects.bulk_create([
+                    DocumentoEmitido(
+                        aluno=aluno,
+                        solicitante=solicitante,
+                        tipo='BOLETIM',
+                        status='processando',
+                        codigo_validacao=gerar_codigo_validacao(),
+                        processado_em=now(),
+                    )
+                    for aluno in lote
+                ])
+                dados = [GeradorPDFSENAI.dados_boletim(aluno, historicos[aluno.pk]) for aluno in lote]
+                for aluno, doc, d in zip(lote, pedidos, dados):
+                    doc.hash_conteudo = DocumentoService.impressao_digital('BOLETIM', d, historicos[aluno.pk])
+
+                # Só vão para o pool os boletins cujo conteúdo ainda não está no storage
+                futuros = {}
+                for i, doc in enumerate(pedidos):
+                    if executor and not default_storage.exists(DocumentoService.caminho_conteudo(doc.hash_conteudo)):
+                        futuros[i] = executor.submit(renderizar_boletim_processo, dados[i])
+
+                for i, doc in enumerate(pedidos):
+                    doc.tentativas = 1
+                    doc.processado_em = now()
+                    if i in futuros:
+                        renderizar = futuros[i].result
+                    else:
+                        renderizar = functools.partial(renderizar_boletim_processo, dados[i])
+                    try:
+                        DocumentoService.gravar_arquivo(doc, renderizar)
+                        doc.status = 'concluido'
+                        if zip_pdfs:
+                            with default_storage.open(doc.arquivo.name, 'rb') as pdf:
+                                zip_pdfs.writestr(doc.nome_arquivo_original, pdf.read())
+                    except Exception as e:
+                        doc.status = 'erro'
+                        doc.erro_mensagem = str(e)
+                        erros += 1
+
+                DocumentoEmitido.objects.bulk_update(
+                    pedidos, ['arquivo', 'hash_conteudo', 'status', 'erro_mensagem', 'tentativas', 'processado_em']
+                )
+                documentos.extend(pedidos)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        caminho_zip = None
+        if zip_pdfs:
+            zip_pdfs.close()
+            arquivo_zip.seek(0)
+            alvo = get_valid_filename(turma.nome if turma is not None else curso.cod_curso)
+            nome_zip = f"documentos/lotes/Boletins_{alvo}_{now().strftime('%Y%m%d_%H%M%S')}.zip"
+            caminho_zip = default_storage.save(nome_zip, File(arquivo_zip))
+            arquivo_zip.close()
+
+        duracao = time.perf_counter() - inicio
+        return {
+            'documentos': documentos,
+            'erros': erros,
+            'zip': caminho_zip,
+            'duracao': duracao,
+            'docs_por_segundo': len(documentos) / duracao if duracao > 0 else 0.0,
+        }
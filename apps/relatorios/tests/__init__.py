@@ -0,0 +1,3 @@
+"""
+Package de testes da app relatorios.
+"""
\ No newline at end of file
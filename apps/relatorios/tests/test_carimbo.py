@@ -0,0 +1,85 @@
+"""
+Testes do carimbo do código de validação (apps/relatorios/carimbo.py).
+"""
+import base64
+import io
+import re
+import zlib
+
+from django.test import SimpleTestCase
+from reportlab.pdfgen import canvas
+
+from apps.relatorios.carimbo import ALTURA, _ler_xref, _objeto, _ultima_pagina, carimbar
+
+
+def _pdf_varias_paginas(paginas=3):
+    """PDF cuja última página termina deslocada (translate) e com preenchimento branco."""
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for i in range(1, paginas + 1):
+        pdf.drawString(72, 720, f'Página {i}')
+        if i == paginas:
+            pdf.translate(200, 300)
+            pdf.setFillColorRGB(1, 1, 1)
+            pdf.drawString(0, 0, 'Texto em branco')
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def _estrutura(pdf):
+    """(offsets, número da última página, fluxos de conteúdo da última página)."""
+    offsets, trailer = _ler_xref(pdf, int(re.findall(rb'startxref\s+(\d+)', pdf)[-1]))
+    raiz = int(re.search(rb'/Root\s+(\d+)\s+0\s+R', trailer).group(1))
+    paginas = int(re.search(rb'/Pages\s+(\d+)\s+0\s+R', _objeto(pdf, offsets, raiz)).group(1))
+    ultima = _ultima_pagina(pdf, offsets, paginas)
+    conteudo = re.search(rb'/Contents\s*(\[[^\]]*\]|\d+\s+0\s+R)', _objeto(pdf, offsets, ultima)).group(1)
+    fluxos = []
+    for numero in re.findall(rb'(\d+)\s+0\s+R', conteudo):
+        inicio = offsets[int(numero)]
+        dicionario = pdf[inicio:pdf.index(b'stream', inicio)]
+        fluxo = pdf[pdf.index(b'stream', inicio) + 6:pdf.index(b'endstream', inicio)].strip(b'\r\n')
+        # Os fluxos do ReportLab vêm em /ASCII85Decode + /FlateDecode
+        if b'/ASCII85Decode' in dicionario:
+            fluxo = base64.a85decode(fluxo, adobe=True)
+        if b'/FlateDecode' in dicionario:
+            fluxo = zlib.decompress(fluxo)
+        fluxos.append(fluxo)
+    return offsets, ultima, fluxos
+
+
+class CarimboTests(SimpleTestCase):
+
+    def test_carimbo_isolado_do_estado_grafico_da_pagina(self):
+        original = _pdf_varias_paginas()
+        offsets_antes, ultima, fluxos_antes = _estrutura(original)
+
+        carimbado = carimbar(original, 'Validação: ABC123')
+        offsets, ultima_depois, fluxos = _estrutura(carimbado)
+
+        self.assertTrue(carimbado.startswith(original))
+        self.assertEqual(ultima_depois, ultima)
+        # Só a última página é regravada; as demais continuam onde estavam
+        self.assertEqual(
+            {n: o for n, o in offsets.items() if n in offsets_antes and n != ultima},
+            {n: o for n, o in offsets_antes.items() if n != ultima},
+        )
+        # q antes dos fluxos originais, Q e cor preta no início do carimbo
+        self.assertEqual(fluxos[0], b'q')
+        self.assertEqual(fluxos[1:-1], fluxos_antes)
+        self.assertTrue(fluxos[-1].startswith(b'Q 0 g BT '))
+        self.assertIn(b' %.2f Td (Valida\xe7\xe3o: ABC123) Tj ET' % ALTURA, fluxos[-1])
+
+    def test_carimbar_de_novo(self):
+        carimbado = carimbar(carimbar(_pdf_varias_paginas(), 'Validação: PRIMEIRO'), 'Validação: SEGUNDO')
+        _, _, fluxos = _estrutura(carimbado)
+
+        self.assertEqual(fluxos[0], b'q')
+        self.assertIn(b'SEGUNDO', fluxos[-1])
+        conteudo = b'\n'.join(fluxos)
+        self.assertEqual(len(re.findall(rb'(?<!\S)q(?!\S)', conteudo)), len(re.findall(rb'(?<!\S)Q(?!\S)', conteudo)))
+
+    def test_pdf_de_uma_pagina(self):
+        _, _, fluxos = _estrutura(carimbar(_pdf_varias_paginas(1), 'Validação: XYZ'))
+        self.assertEqual(fluxos[0], b'q')
+        self.assertIn(b'XYZ', fluxos[-1])
@@ -0,0 +1,72 @@
+"""
+Testes do download de documentos: ETag/304, Range e envio pelo servidor web.
+"""
+import shutil
+import tempfile
+
+from django.contrib.auth.models import User
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+
+from apps.academico.models import Aluno
+from apps.relatorios.services import DocumentoService
+from apps.usuarios.models import Profile
+
+MEDIA_TESTE = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_TESTE, DOCUMENTOS_DOWNLOAD_OFFLOAD='')
+class DownloadDocumentoTests(TestCase):
+    """Cabeçalhos de cache e respostas parciais do download_documento."""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_TESTE, ignore_errors=True)
+
+    def setUp(self):
+        user = User.objects.create_user(username='aluno_download', first_name='Ana')
+        Profile.objects.create(user=user, tipo='aluno')
+        aluno = Aluno.objects.create(user=user, RA_aluno='RA00001')
+        self.documento = DocumentoService.emitir_novo_documento(aluno, 'DECLARACAO', user)
+        self.url = reverse('download_documento', args=[self.documento.id])
+        with self.documento.arquivo.open('rb') as arquivo:
+            self.conteudo = arquivo.read()
+        self.client = Client()
+        self.client.force_login(user)
+
+    def test_download_completo(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.conteudo)
+        self.assertEqual(response['ETag'], f'"{self.documento.id}"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('attachment', response['Content-Disposition'])
+
+    def test_if_none_match_retorna_304(self):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=f'"{self.documento.id}"')
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_intervalo_de_bytes(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-99')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), self.conteudo[:100])
+        self.assertEqual(response['Content-Range'], f'bytes 0-99/{len(self.conteudo)}')
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-10')
+        self.assertEqual(b''.join(response.streaming_content), self.conteudo[-10:])
+
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(self.conteudo)}-')
+        self.assertEqual(response.status_code, 416)
+
+    def test_offload_x_accel_redirect(self):
+        with self.settings(DOCUMENTOS_DOWNLOAD_OFFLOAD='x-accel-redirect', DOCUMENTOS_ACCEL_PREFIX='/protegido/'):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protegido/{self.documento.arquivo.name}')
+        self.assertEqual(response.content, b'')
@@ -0,0 +1,89 @@
+"""
+Testes da emissão de boletins em lote (DocumentoService.emitir_boletins_turma).
+"""
+import shutil
+import tempfile
+import zipfile
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+
+from apps.academico.models import (
+    Aluno, Curso, Departamento, Disciplina, Historico, Professor, Turma, TurmaDisciplinaProfessor
+)
+from apps.relatorios.models import DocumentoEmitido
+from apps.relatorios.services import DocumentoService
+
+MEDIA_TESTE = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_TESTE)
+class EmissaoBoletinsTurmaTests(TestCase):
+    """Um boletim por aluno da turma, com ZIP opcional."""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_TESTE, ignore_errors=True)
+
+    def setUp(self):
+        departamento = Departamento.objects.create(nome_departamento='Tecnologia', cod_departamento='TEC')
+        self.curso = Curso.objects.create(
+            cod_curso='TADS', nome_curso='Análise e Desenvolvimento', carga_horaria_total=1600,
+            modalidade='Presencial', turno='Noturno', tipo='Técnico', cod_departamento=departamento
+        )
+        self.turma = Turma.objects.create(
+            nome='TADS 2025/1', periodo='Noturno', ano_letivo=2025,
+            data_inicio=date(2025, 2, 1), id_curso=self.curso
+        )
+        alocacao = TurmaDisciplinaProfessor.objects.create(
+            turma=self.turma,
+            disciplina=Disciplina.objects.create(cod_disciplina='DISC001', nome='Lógica', carga_horaria=60),
+            professor=Professor.objects.create(user=User.objects.create_user(username='prof_lote'))
+        )
+        for i in range(3):
+            aluno = Aluno.objects.create(
+                user=User.objects.create_user(username=f'aluno_lote_{i}', first_name=f'Aluno {i}'),
+                RA_aluno=f'RA{i:05d}', turma_atual=self.turma
+            )
+            Historico.objects.create(
+                id_aluno=aluno, turma_disciplina_professor=alocacao,
+                media_final=7.5, frequencia_percentual=90.0, periodo_realizacao='2025.1'
+            )
+
+    def test_um_documento_por_aluno_com_zip(self):
+        resultado = DocumentoService.emitir_boletins_turma(turma=self.turma, processos=1, tamanho_lote=2, gerar_zip=True)
+
+        self.assertEqual(len(resultado['documentos']), 3)
+        self.assertEqual(resultado['erros'], 0)
+        self.assertEqual(DocumentoEmitido.objects.filter(tipo='BOLETIM', status='concluido').count(), 3)
+        self.assertEqual(len({d.codigo_validacao for d in resultado['documentos']}), 3)
+
+        with default_storage.open(resultado['zip']) as arquivo, zipfile.ZipFile(arquivo) as zip_pdfs:
+            self.assertEqual(sorted(zip_pdfs.namelist()), [f'Boletim_RA{i:05d}_{date.today():%Y%m%d}.pdf' for i in range(3)])
+
+    def test_pool_de_processos(self):
+        resultado = DocumentoService.emitir_boletins_turma(curso=self.curso, processos=2)
+
+        self.assertEqual(resultado['erros'], 0)
+        for documento in resultado['documentos']:
+            with documento.arquivo.open('rb') as pdf:
+                self.assertEqual(pdf.read(4), b'%PDF')
+        self.assertGreater(resultado['docs_por_segundo'], 0)
+
+    def test_historico_alterado_gera_novo_pdf(self):
+        """Somente o aluno com histórico alterado tem o boletim renderizado de novo."""
+        primeira = DocumentoService.emitir_boletins_turma(turma=self.turma, processos=1)
+
+        historico = Historico.objects.order_by('pk').first()
+        historico.media_final = 9.0
+        historico.save()
+        segunda = DocumentoService.emitir_boletins_turma(turma=self.turma, processos=1)
+
+        hashes = {d.aluno_id: d.hash_conteudo for d in primeira['documentos']}
+        alterados = [d.aluno_id for d in segunda['documentos'] if d.hash_conteudo != hashes[d.aluno_id]]
+        self.assertEqual(alterados, [historico.id_aluno_id])
+        _, corpos = default_storage.listdir('documentos/conteudo')
+        self.assertEqual(len(corpos), 4)
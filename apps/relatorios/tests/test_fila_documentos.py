@@ -0,0 +1,110 @@
+"""
+Testes da fila de geração de documentos (DocumentoService + worker).
+"""
+import shutil
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+
+from apps.academico.models import Aluno
+from apps.relatorios.models import DocumentoEmitido
+from apps.usuarios.models import Profile
+
+MEDIA_TESTE = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_TESTE, DOCUMENTOS_FILA_ASSINCRONA=True)
+class FilaDocumentosTests(TestCase):
+    """O pedido retorna na hora e o worker gera o PDF depois."""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_TESTE, ignore_errors=True)
+
+    def setUp(self):
+        user = User.objects.create_user(username='aluno_doc', password='senha123', first_name='Ana')
+        Profile.objects.create(user=user, tipo='aluno')
+        self.aluno = Aluno.objects.create(user=user, RA_aluno='RA00001')
+        self.client = Client()
+        self.client.force_login(user)
+
+    def test_pedido_fica_pendente(self):
+        response = self.client.get(reverse('emitir_declaracao_meu'))
+
+        documento = DocumentoEmitido.objects.get(aluno=self.aluno)
+        self.assertEqual(documento.status, 'pendente')
+        self.assertRedirects(response, reverse('status_documento', args=[documento.id]))
+
+        status = self.client.get(reverse('status_documento_json', args=[documento.id])).json()
+        self.assertEqual(status['status'], 'pendente')
+        self.assertIsNone(status['download_url'])
+
+        response = self.client.get(reverse('download_documento', args=[documento.id]))
+        self.assertRedirects(response, reverse('status_documento', args=[documento.id]))
+
+    def test_worker_gera_pdf(self):
+        self.client.get(reverse('emitir_declaracao_meu'))
+        documento = DocumentoEmitido.objects.get(aluno=self.aluno)
+
+        call_command('processar_fila_documentos', stdout=StringIO())
+
+        documento.refresh_from_db()
+        self.assertEqual(documento.status, 'concluido')
+        self.assertEqual(documento.tentativas, 1)
+        status = self.client.get(reverse('status_documento_json', args=[documento.id])).json()
+        self.assertEqual(status['download_url'], reverse('download_documento', args=[documento.id]))
+
+        response = self.client.get(status['download_url'])
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(b''.join(response.streaming_content).startswith(b'%PDF'))
+
+    def test_modo_sincrono(self):
+        with self.settings(DOCUMENTOS_FILA_ASSINCRONA=False):
+            response = self.client.get(reverse('emitir_declaracao_meu'))
+
+        documento = DocumentoEmitido.objects.get(aluno=self.aluno)
+        self.assertEqual(documento.status, 'concluido')
+        self.assertRedirects(response, reverse('download_documento', args=[documento.id]), fetch_redirect_response=False)
+
+    def _corpos(self):
+        """Corpos renderizados guardados pelo hash do conteúdo."""
+        if not default_storage.exists('documentos/conteudo'):
+            return 0
+        return len(default_storage.listdir('documentos/conteudo')[1])
+
+    def _pdf(self, documento):
+        response = self.client.get(reverse('download_documento', args=[documento.id]))
+        return b''.join(response.streaming_content)
+
+    def test_conteudo_igual_reaproveita_pdf(self):
+        """Emitir de novo sem mudanças reaproveita o corpo; cada PDF traz o próprio código."""
+        antes = self._corpos()
+        with self.settings(DOCUMENTOS_FILA_ASSINCRONA=False):
+            self.client.get(reverse('emitir_declaracao_meu'))
+            self.client.get(reverse('emitir_declaracao_meu'))
+            primeiro, segundo = DocumentoEmitido.objects.order_by('data_emissao')
+
+            self.assertEqual(primeiro.hash_conteudo, segundo.hash_conteudo)
+            self.assertNotEqual(primeiro.codigo_validacao, segundo.codigo_validacao)
+            self.assertEqual(segundo.nome_arquivo_original, primeiro.nome_arquivo_original)
+            self.assertEqual(self._corpos(), antes + 1)
+
+            for documento, outro in ((primeiro, segundo), (segundo, primeiro)):
+                pdf = self._pdf(documento)
+                self.assertTrue(pdf.startswith(b'%PDF'))
+                self.assertIn(f'Código de Autenticidade: {documento.codigo_validacao}'.encode('cp1252'), pdf)
+                self.assertNotIn(outro.codigo_validacao.encode(), pdf)
+
+            self.aluno.RG_aluno = '12.345.678-9'
+            self.aluno.save()
+            self.client.get(reverse('emitir_declaracao_meu'))
+            terceiro = DocumentoEmitido.objects.order_by('data_emissao').last()
+
+            self.assertNotEqual(terceiro.hash_conteudo, primeiro.hash_conteudo)
+            self.assertEqual(self._corpos(), antes + 2)
@@ -7,6 +7,8 @@ urlpatterns = [
     path('emitir/boletim/<int:aluno_id>/', views.emitir_boletim, name='emitir_boletim_aluno'),
     path('emitir/declaracao/<int:aluno_id>/', views.emitir_declaracao_matricula, name='emitir_declaracao_aluno'),
     path('download/<uuid:documento_id>/', views.download_documento, name='download_documento'),
+    path('documento/<uuid:documento_id>/status/', views.status_documento, name='status_documento'),
+    path('documento/<uuid:documento_id>/status.json', views.status_documento_json, name='status_documento_json'),
     path('turma/<int:turma_id>/pdf/', views.baixar_relatorio_turma, name='baixar_relatorio_turma'),
     path('coordenacao/geral/<int:user_id>/', views.relatorio_coordenacao_pdf, name='relatorio_coordenacao_pdf'),
     path('aluno/geral/<int:aluno_id>/', views.relatorio_aluno_geral_pdf, name='relatorio_aluno_geral_pdf'),
@@ -1,15 +1,18 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.http import FileResponse, Http404, HttpResponse
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.urls import reverse
 from apps.academico.models import Aluno, Turma
-from apps.dashboards.views import issecretaria
+from apps.usuarios.papeis import papeis_request
+from apps.payments.services.financeiro_service import FinanceiroService
 from .models import DocumentoEmitido
 from .services import DocumentoService
-from .pdf_service import gerar_pdf_relatorio_turma
+from .downloads import servir_documento
+from .pdf_service import gerar_pdf_relatorio_turma, obter_gerador
 from datetime import datetime
 from decimal import Decimal
-from django.db.models import Avg, Sum
+from django.db.models import Avg, Count, Q, Sum
 
 # ==========================================
 # Emissão de Documentos (Gera e Salva)
@@ -22,10 +25,10 @@ def emitir_boletim(request, aluno_id=None):
     if not aluno: return redirect('home')
 
     try:
-        documento = DocumentoService.emitir_novo_documento(
+        documento = DocumentoService.solicitar_documento(
             aluno=aluno, tipo_documento='BOLETIM', solicitante=request.user
         )
-        return redirect('download_documento', documento_id=documento.id)
+        return _redirecionar_documento(documento)
     except Exception as e:
         messages.error(request, f"Erro: {str(e)}")
         return redirect('home')
@@ -37,18 +40,24 @@ def emitir_declaracao_matricula(request, aluno_id=None):
     if not aluno: return redirect('home')
 
     try:
-        documento = DocumentoService.emitir_novo_documento(
+        documento = DocumentoService.solicitar_documento(
             aluno=aluno, tipo_documento='DECLARACAO', solicitante=request.user
         )
-        return redirect('download_documento', documento_id=documento.id)
+        return _redirecionar_documento(documento)
     except Exception as e:
         messages.error(request, f"Erro: {str(e)}")
         return redirect('home')
 
+def _redirecionar_documento(documento):
+    """Vai direto para o download se o PDF já estiver pronto; senão, para a página de status"""
+    if documento.disponivel:
+        return redirect('download_documento', documento_id=documento.id)
+    return redirect('status_documento', documento_id=documento.id)
+
 def _get_aluno_or_403(request, aluno_id):
     """Helper para verificar permissão e retornar o aluno correto"""
     if aluno_id:
-        if not (issecretaria(request.user) or request.user.profile.tipo == 'coordenacao'):
+        if papeis_request(request).isdisjoint({'secretaria', 'coordenacao'}):
             messages.error(request, "Sem permissão.")
             return None
         return get_object_or_404(Aluno, pk=aluno_id)
@@ -62,18 +71,47 @@ def _get_aluno_or_403(request, aluno_id):
 # Download de Documentos (Arquivo Salvo)
 # ==========================================
 
-@login_required
-def download_documento(request, documento_id):
-    """Baixa um documento já gerado anteriormente"""
-    doc = get_object_or_404(DocumentoEmitido, id=documento_id)
-    
+def _get_documento_or_404(request, documento_id):
+    """Retorna o documento se o usuário for o dono ou da secretaria/coordenação"""
+    doc = get_object_or_404(DocumentoEmitido.objects.select_related('aluno'), id=documento_id)
+
     is_dono = (hasattr(request.user, 'aluno') and doc.aluno == request.user.aluno)
-    is_staff = (issecretaria(request.user) or request.user.profile.tipo == 'coordenacao')
-    
+    is_staff = not papeis_request(request).isdisjoint({'secretaria', 'coordenacao'})
+
     if not (is_dono or is_staff):
         raise Http404("Acesso negado.")
+    return doc
+
+@login_required
+def download_documento(request, documento_id):
+    """Baixa um documento já gerado anteriormente"""
+    doc = _get_documento_or_404(request, documento_id)
+
+    if not doc.disponivel:
+        return redirect('status_documento', documento_id=doc.id)
         
-    return FileResponse(doc.arquivo.open(), as_attachment=True, filename=doc.nome_arquivo_original)
+    return servir_documento(request, doc)
+
+@login_required
+def status_documento(request, documento_id):
+    """Página de espera enquanto o PDF é gerado pela fila"""
+    doc = _get_documento_or_404(request, documento_id)
+
+    if doc.disponivel:
+        return redirect('download_documento', documento_id=doc.id)
+    return render(request, 'relatorios/status_documento.html', {'documento': doc})
+
+@login_required
+def status_documento_json(request, documento_id):
+    """Status do documento para a página de espera consultar periodicamente"""
+    doc = _get_documento_or_404(request, documento_id)
+
+    return JsonResponse({
+        'status': doc.status,
+        'status_display': doc.get_status_display(),
+        'erro': doc.erro_mensagem,
+        'download_url': reverse('download_documento', args=[doc.id]) if doc.disponivel else None,
+    })
 
 # ==========================================
 # Relatórios Dinâmicos (Gera na hora)
@@ -82,7 +120,7 @@ def download_documento(request, documento_id):
 @login_required
 def baixar_relatorio_turma(request, turma_id):
     """Gera lista de alunos da turma"""
-    if not request.user.profile.tipo in ['professor', 'coordenacao', 'secretaria']:
+    if papeis_request(request).isdisjoint({'professor', 'coordenacao', 'secretaria'}):
         messages.error(request, "Sem permissão.")
         return redirect('home')
 
@@ -98,9 +136,7 @@ def baixar_relatorio_turma(request, turma_id):
 def relatorio_coordenacao_pdf(request, user_id):
     """Gera relatório geral da coordenação (Correção de Erro de Rota)"""
     # Usar o gerador centralizado para relatório de coordenação
-    from .pdf_service import GeradorPDFSENAI
-
-    gerador = GeradorPDFSENAI()
+    gerador = obter_gerador()
     pdf_buffer = gerador.gerar_relatorio_coordenacao(solicitante_user=request.user)
     filename = "Relatorio_Geral_Coordenacao.pdf"
     return FileResponse(pdf_buffer, as_attachment=True, filename=filename)
@@ -113,9 +149,7 @@ def relatorio_aluno_geral_pdf(request, aluno_id=None):
     if not aluno:
         return redirect('home')
 
-    from .pdf_service import GeradorPDFSENAI
-
-    gerador = GeradorPDFSENAI()
+    gerador = obter_gerador()
     pdf_buffer = gerador.gerar_relatorio_geral_aluno(aluno)
     filename = f"Relatorio_Geral_Aluno_{getattr(aluno, 'RA_aluno', aluno.user.id)}.pdf"
     return FileResponse(pdf_buffer, as_attachment=True, filename=filename)
@@ -123,9 +157,7 @@ def relatorio_aluno_geral_pdf(request, aluno_id=None):
 @login_required
 def relatorio_professor_geral_pdf(request):
     """Gera relatório geral do professor."""
-    from .pdf_service import GeradorPDFSENAI
-
-    gerador = GeradorPDFSENAI()
+    gerador = obter_gerador()
     pdf_buffer = gerador.gerar_relatorio_professor(request.user)
     filename = "Relatorio_Atividades_Docente.pdf"
     return FileResponse(pdf_buffer, as_attachment=True, filename=filename)
@@ -133,9 +165,7 @@ def relatorio_professor_geral_pdf(request):
 @login_required
 def relatorio_secretaria_geral_pdf(request):
     """Gera relatório geral da secretaria."""
-    from .pdf_service import GeradorPDFSENAI
-
-    gerador = GeradorPDFSENAI()
+    gerador = obter_gerador()
     pdf_buffer = gerador.gerar_relatorio_secretaria(request.user)
     filename = "Relatorio_Secretaria.pdf"
     return FileResponse(pdf_buffer, as_attachment=True, filename=filename)
@@ -184,18 +214,19 @@ def preview_relatorio_aluno(request, aluno_id=None):
 @login_required
 def preview_relatorio_coordenacao(request, user_id):
     """Prévia do relatório de coordenação em HTML."""
-    from apps.academico.models import Aluno, Turma, Professor, Curso, Historico
+    from apps.academico.models import Aluno, Turma, Professor, Curso, Historico, DesempenhoAluno
     
     total_alunos = Aluno.objects.count()
     total_alunos_ativos = Aluno.objects.filter(status_matricula__iexact='Ativo').count()
     total_turmas = Turma.objects.count()
     total_professores = Professor.objects.count()
     
-    historicos_agg = Historico.objects.filter(id_aluno__status_matricula__iexact='Ativo').values('id_aluno').annotate(
-        avg_media=Avg('media_final'), avg_freq=Avg('frequencia_percentual')
+    resumo_risco = DesempenhoAluno.objects.filter(aluno__status_matricula__iexact='Ativo').aggregate(
+        com_historico=Count('pk'),
+        em_risco=Count('pk', filter=Q(media__lt=5) | Q(frequencia__lt=75))
     )
-    alunos_com_historico = historicos_agg.count()
-    alunos_risco = sum(1 for h in historicos_agg if (h.get('avg_media') is not None and h.get('avg_media') < 5) or (h.get('avg_freq') is not None and h.get('avg_freq') < 75))
+    alunos_com_historico = resumo_risco['com_historico']
+    alunos_risco = resumo_risco['em_risco']
     
     cursos = Curso.objects.all()
     cursos_data = []
@@ -269,7 +300,6 @@ def preview_relatorio_professor(request):
 def preview_relatorio_secretaria(request):
     """Prévia do relatório da secretaria em HTML."""
     from apps.academico.models import Aluno, Turma, Curso, Historico
-    from apps.payments.models import Pagamento
     
     total_alunos = Aluno.objects.count()
     total_ativos = Aluno.objects.filter(status_matricula__iexact='Ativo').count()
@@ -277,10 +307,8 @@ def preview_relatorio_secretaria(request):
     total_turmas = Turma.objects.count()
     total_cursos = Curso.objects.count()
     
-    pagamentos_total = Pagamento.objects.aggregate(t=Sum('valor'))['t'] or Decimal('0.00')
-    pagamentos_pago = Pagamento.objects.filter(status='pago').aggregate(t=Sum('valor'))['t'] or Decimal('0.00')
-    pagamentos_pendente = pagamentos_total - pagamentos_pago
-    taxa_receb = (pagamentos_pago/pagamentos_total*100) if pagamentos_total > 0 else 0
+    # Totais e evolução vêm dos snapshots diários (gerar_snapshot_financeiro)
+    financeiro = FinanceiroService.resumo()
     
     cursos_data = []
     for c in Curso.objects.all():
@@ -299,10 +327,12 @@ def preview_relatorio_secretaria(request):
         'total_inativos': total_inativos,
         'total_turmas': total_turmas,
         'total_cursos': total_cursos,
-        'pagamentos_total': pagamentos_total,
-        'pagamentos_pago': pagamentos_pago,
-        'pagamentos_pendente': pagamentos_pendente,
-        'taxa_recebimento': taxa_receb,
+        'pagamentos_total': financeiro['total'],
+        'pagamentos_pago': financeiro['pago'],
+        'pagamentos_pendente': financeiro['pendente'],
+        'taxa_recebimento': financeiro['taxa_recebimento'],
+        'financeiro_data': financeiro['data'],
+        'tendencia': FinanceiroService.tendencia(),
         'cursos': cursos_data,
     }
     return render(request, 'relatorios/preview_secretaria.html', context)
\ No newline at end of file
@@ -0,0 +1,136 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils import timezone
+
+from apps.usuarios.middleware import LimitUserSessionsMiddleware, MAX_SESSOES_POR_USUARIO
+from apps.usuarios.models import UserSession
+
+
+class _Rollback(Exception):
+    """Usada para desfazer os dados sintéticos ao final do benchmark."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede a latência do LimitUserSessionsMiddleware com diferentes volumes de '
+        'sessões ativas. Os dados sintéticos são criados dentro de uma transação '
+        'e descartados ao final.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tamanhos',
+            type=int,
+            nargs='+',
+            default=[100, 1000, 10000, 50000],
+            help='Quantidades de sessões ativas a medir (padrão: 100 1000 10000 50000)'
+        )
+        parser.add_argument(
+            '--repeticoes',
+            type=int,
+            default=200,
+            help='Requisições medidas por tamanho (padrão: 200)'
+        )
+        parser.add_argument(
+            '--comparar-legado',
+            action='store_true',
+            help='Também mede a varredura completa de django_session usada antes do índice'
+        )
+
+    def handle(self, *args, **options):
+        tamanhos = sorted(options['tamanhos'])
+        self.repeticoes = options['repeticoes']
+        self.comparar_legado = options['comparar_legado']
+        self.factory = RequestFactory()
+        self.middleware = LimitUserSessionsMiddleware(lambda request: HttpResponse())
+
+        self.stdout.write(f'{"sessões":>10} | {"mediana (ms)":>12} | {"p95 (ms)":>10} | {"legado (ms)":>11}')
+        self.stdout.write('-' * 54)
+
+        try:
+            with transaction.atomic():
+                criadas = 0
+                for tamanho in tamanhos:
+                    self._criar_sessoes(criadas, tamanho - criadas)
+                    criadas = tamanho
+                    self._medir(tamanho)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+        self.stdout.write(self.style.SUCCESS('✓ Benchmark concluído (dados sintéticos descartados)'))
+
+    def _criar_sessoes(self, inicio, quantidade):
+        if quantidade <= 0:
+            return
+        expira = timezone.now() + timedelta(days=1)
+        store = SessionStore()
+
+        # Cada usuário sintético fica exatamente no limite de sessões
+        num_usuarios = -(-quantidade // MAX_SESSOES_POR_USUARIO)
+        usuarios = User.objects.bulk_create([
+            User(username=f'bench_sessao_{inicio + i:07d}', password='!')
+            for i in range(num_usuarios)
+        ])
+
+        sessoes, indice = [], []
+        for i in range(quantidade):
+            user = usuarios[i // MAX_SESSOES_POR_USUARIO]
+            key = f'bench{inicio + i:035d}'
+            sessoes.append(Session(
+                session_key=key,
+                session_data=store.encode({'_auth_user_id': str(user.pk)}),
+                expire_date=expira
+            ))
+            indice.append(UserSession(user=user, session_key=key))
+        Session.objects.bulk_create(sessoes, batch_size=2000)
+        UserSession.objects.bulk_create(indice, batch_size=2000)
+
+        self.alvo_user = usuarios[0]
+        self.alvo_session_key = sessoes[0].session_key
+
+    def _montar_request(self):
+        request = self.factory.get('/')
+        request.user = self.alvo_user
+        request.session = SessionStore(session_key=self.alvo_session_key)
+        return request
+
+    def _medir(self, tamanho):
+        tempos = []
+        for _ in range(self.repeticoes):
+            request = self._montar_request()
+            inicio = time.perf_counter()
+            self.middleware(request)
+            tempos.append((time.perf_counter() - inicio) * 1000)
+
+        mediana = statistics.median(tempos)
+        p95 = statistics.quantiles(tempos, n=20)[-1] if len(tempos) > 1 else tempos[0]
+
+        legado = '-'
+        if self.comparar_legado:
+            tempos_legado = []
+            for _ in range(3):
+                inicio = time.perf_counter()
+                self._varredura_legada(self._montar_request())
+                tempos_legado.append((time.perf_counter() - inicio) * 1000)
+            legado = f'{statistics.median(tempos_legado):.2f}'
+
+        self.stdout.write(f'{tamanho:>10} | {mediana:>12.3f} | {p95:>10.3f} | {legado:>11}')
+
+    def _varredura_legada(self, request):
+        """Reproduz a varredura de django_session feita antes do índice por usuário."""
+        user_session_keys = []
+        for session in Session.objects.filter(expire_date__gte=timezone.now()):
+            data = session.get_decoded()
+            if data.get('_auth_user_id') == str(request.user.id):
+                user_session_keys.append(session.session_key)
+        return user_session_keys
@@ -1,34 +1,72 @@
+from datetime import timedelta
+
 from django.contrib.sessions.models import Session
-from django.contrib.auth import logout
 from django.utils import timezone
 
+from .models import UserSession
+from .papeis import papeis_usuario
+
+# Limite de sessões simultâneas por usuário
+MAX_SESSOES_POR_USUARIO = 3
+
+# Evita um UPDATE por requisição: last_seen só é gravado após esse intervalo
+INTERVALO_ATUALIZACAO_SESSAO = timedelta(minutes=5)
+
 
 class LimitUserSessionsMiddleware:
     """Middleware para limitar sessões por usuário"""
-    
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
         if request.user.is_authenticated:
-            # Limitar a 3 sessões ativas por usuário
-            current_session_key = request.session.session_key
-            
-            # Buscar todas as sessões do usuário
-            user_sessions = Session.objects.filter(
-                expire_date__gte=timezone.now()
-            )
-            
-            user_session_keys = []
-            for session in user_sessions:
-                data = session.get_decoded()
-                if data.get('_auth_user_id') == str(request.user.id):
-                    user_session_keys.append(session.session_key)
-            
-            # Se tiver mais de 3 sessões, deletar as mais antigas
-            if len(user_session_keys) > 3:
-                sessions_to_delete = user_session_keys[:-3]
-                Session.objects.filter(session_key__in=sessions_to_delete).delete()
-        
+            self._aplicar_limite(request)
+
         response = self.get_response(request)
         return response
+
+    def _aplicar_limite(self, request):
+        current_session_key = request.session.session_key
+        if not current_session_key:
+            return
+
+        agora = timezone.now()
+
+        # Consulta indexada (user, -created): só as sessões deste usuário
+        user_sessions = list(
+            UserSession.objects.filter(user_id=request.user.id)
+            .order_by('-created', '-id')
+            .values_list('session_key', 'last_seen')
+        )
+        last_seen = dict(user_sessions)
+
+        if current_session_key not in last_seen:
+            # Sessões abertas antes do índice existir (ou sem sinal de login)
+            UserSession.objects.get_or_create(
+                session_key=current_session_key,
+                defaults={'user': request.user}
+            )
+            user_sessions.insert(0, (current_session_key, agora))
+        elif agora - last_seen[current_session_key] > INTERVALO_ATUALIZACAO_SESSAO:
+            UserSession.objects.filter(session_key=current_session_key).update(last_seen=agora)
+
+        # Se tiver mais de 3 sessões, deletar as mais antigas
+        if len(user_sessions) > MAX_SESSOES_POR_USUARIO:
+            sessions_to_delete = [key for key, _ in user_sessions[MAX_SESSOES_POR_USUARIO:]]
+            Session.objects.filter(session_key__in=sessions_to_delete).delete()
+            UserSession.objects.filter(session_key__in=sessions_to_delete).delete()
+
+
+class PapeisUsuarioMiddleware:
+    """
+    Resolve uma vez por requisição os papéis do usuário (apps/usuarios/papeis.py)
+    e os expõe em request.roles, para decorators e views.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.roles = papeis_usuario(request.user)
+        return self.get_response(request)
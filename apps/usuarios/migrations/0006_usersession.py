@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('usuarios', '0005_alter_pendingregistration_aprovado_por_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSession',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('session_key', models.CharField(max_length=40, unique=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('last_seen', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sessoes_ativas', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Sessão de Usuário',
+                'verbose_name_plural': 'Sessões de Usuários',
+                'db_table': 'usuarios_user_session',
+                'indexes': [models.Index(fields=['user', '-created'], name='usuarios_sessao_user_idx')],
+            },
+        ),
+    ]
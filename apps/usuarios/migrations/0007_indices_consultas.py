@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('usuarios', '0006_usersession'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pendingregistration',
+            index=models.Index(fields=['status', 'data_solicitacao'], name='usuarios_pendreg_status_idx'),
+        ),
+    ]
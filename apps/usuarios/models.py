@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.db.models.signals import post_save
+from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.dispatch import receiver
 from django.db import transaction
 
@@ -110,6 +111,10 @@ class PendingRegistration(models.Model):
         verbose_name_plural = 'Registros Pendentes'
         ordering = ['-data_solicitacao']
         db_table = 'usuarios_pending_registration'
+        indexes = [
+            # Fila de aprovação da coordenação: pendentes, dos mais antigos
+            models.Index(fields=['status', 'data_solicitacao'], name='usuarios_pendreg_status_idx'),
+        ]
 
     def __str__(self):
         return f'{self.primeiro_nome} {self.sobrenome}'
@@ -180,4 +185,48 @@ def save_user_profile(sender, instance, **kwargs):
     try:
         instance.profile.save()
     except Profile.DoesNotExist:
-        pass
\ No newline at end of file
+        pass
+
+
+class UserSession(models.Model):
+    """
+    Índice de sessões ativas por usuário.
+
+    Mantido pelos sinais de login/logout para que o limite de sessões
+    simultâneas seja verificado com uma consulta indexada, em vez de
+    decodificar todas as linhas de django_session a cada requisição.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='sessoes_ativas')
+    session_key = models.CharField(max_length=40, unique=True)
+    created = models.DateTimeField(auto_now_add=True)
+    last_seen = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Sessão de Usuário'
+        verbose_name_plural = 'Sessões de Usuários'
+        db_table = 'usuarios_user_session'
+        indexes = [
+            models.Index(fields=['user', '-created'], name='usuarios_sessao_user_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.user.username} - {self.session_key[:8]}...'
+
+
+@receiver(user_logged_in)
+def registrar_sessao_usuario(sender, request, user, **kwargs):
+    session = getattr(request, 'session', None)
+    if session is None or not session.session_key:
+        return
+    UserSession.objects.update_or_create(
+        session_key=session.session_key,
+        defaults={'user': user}
+    )
+
+
+@receiver(user_logged_out)
+def remover_sessao_usuario(sender, request, user, **kwargs):
+    session = getattr(request, 'session', None)
+    if session is None or not session.session_key:
+        return
+    UserSession.objects.filter(session_key=session.session_key).delete()
@@ -0,0 +1,74 @@
+"""
+Papéis (perfis de acesso) de cada usuário: 'aluno', 'professor',
+'secretaria' e 'coordenacao'.
+
+O papel vem apenas do Profile (tipo), como nas verificações antigas de
+`user.profile.tipo`: um cadastro acadêmico (Aluno, Professor, Secretaria,
+Coordenacao) sem o tipo correspondente no perfil não concede acesso. O
+resultado fica no cache por PAPEIS_CACHE_TTL segundos e é invalidado pelo
+sinal abaixo quando o perfil muda. O PapeisUsuarioMiddleware
+expõe o conjunto em `request.roles`; dentro da mesma requisição ele também
+fica memorizado no próprio objeto do usuário.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.cache import chave_cache
+
+from .models import Profile
+
+NAMESPACE_PAPEIS = 'usuarios:papeis'
+PAPEIS = ('aluno', 'professor', 'secretaria', 'coordenacao')
+
+_ATRIBUTO_MEMO = '_papeis_cache'
+
+
+def _chave(user):
+    # date_joined distingue usuários que reaproveitem o mesmo id (ex.: banco recriado)
+    return chave_cache(NAMESPACE_PAPEIS, user.pk, int(user.date_joined.timestamp() * 1_000_000))
+
+
+def calcular_papeis(user_id):
+    """Consulta o banco e retorna o frozenset de papéis do usuário."""
+    tipo = Profile.objects.filter(user_id=user_id).values_list('tipo', flat=True).first()
+    return frozenset([tipo]) if tipo in PAPEIS else frozenset()
+
+
+def papeis_usuario(user):
+    """Papéis do usuário (frozenset vazio para anônimos)."""
+    if not user.is_authenticated:
+        return frozenset()
+
+    papeis = getattr(user, _ATRIBUTO_MEMO, None)
+    if papeis is None:
+        chave = _chave(user)
+        papeis = cache.get(chave)
+        if papeis is None:
+            papeis = calcular_papeis(user.pk)
+            cache.set(chave, papeis, settings.PAPEIS_CACHE_TTL)
+        setattr(user, _ATRIBUTO_MEMO, papeis)
+    return papeis
+
+
+def papeis_request(request):
+    """`request.roles` (definido pelo middleware) ou, sem ele, os papéis do usuário."""
+    papeis = getattr(request, 'roles', None)
+    return papeis if papeis is not None else papeis_usuario(request.user)
+
+
+def invalidar_papeis(user):
+    cache.delete(_chave(user))
+    if hasattr(user, _ATRIBUTO_MEMO):
+        delattr(user, _ATRIBUTO_MEMO)
+
+
+# === Invalidação (sinal registrado em UsuariosConfig.ready) ===
+
+@receiver([post_save, post_delete], sender=Profile)
+def invalidar_papeis_usuario(sender, instance, **kwargs):
+    user = instance.user
+    # Após o commit, para que nenhuma requisição concorrente guarde os papéis antigos
+    transaction.on_commit(lambda: invalidar_papeis(user))
@@ -0,0 +1,75 @@
+"""
+Testes da resolução de papéis (apps/usuarios/papeis.py) e do
+PapeisUsuarioMiddleware.
+"""
+from django.contrib.auth.models import AnonymousUser, User
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.academico.models import Secretaria
+from apps.usuarios.models import Profile
+from apps.usuarios.papeis import calcular_papeis, papeis_usuario
+
+
+class PapeisUsuarioTests(TestCase):
+    """Papéis em cache, memorizados por requisição e invalidados por sinais."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='coord_papeis', password='senha123')
+        self.profile = Profile.objects.create(user=self.user, tipo='coordenacao')
+
+    def _recarregar(self):
+        return User.objects.get(pk=self.user.pk)
+
+    def test_papel_vem_do_perfil(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(calcular_papeis(self.user.pk), {'coordenacao'})
+        self.assertEqual(calcular_papeis(User.objects.create_user(username='sem_perfil').pk), frozenset())
+        self.assertEqual(papeis_usuario(AnonymousUser()), frozenset())
+
+    def test_cadastro_academico_nao_concede_papel(self):
+        # Perfil e cadastro acadêmico divergem: vale o tipo do perfil
+        Secretaria.objects.create(user=self.user)
+        self.assertEqual(calcular_papeis(self.user.pk), {'coordenacao'})
+
+        client = Client()
+        client.force_login(self.user)
+        response = client.get(reverse('secretaria_dashboard'))
+        self.assertRedirects(response, reverse('home'), fetch_redirect_response=False)
+
+    def test_cache_e_memo_por_requisicao(self):
+        user = self._recarregar()
+        with self.assertNumQueries(1):
+            papeis_usuario(user)
+
+        user = self._recarregar()
+        with self.assertNumQueries(0):
+            self.assertEqual(papeis_usuario(user), {'coordenacao'})
+            self.assertEqual(papeis_usuario(user), {'coordenacao'})
+
+    def test_salvar_perfil_invalida(self):
+        papeis_usuario(self._recarregar())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.tipo = 'secretaria'
+            self.profile.save()
+
+        self.assertEqual(papeis_usuario(self._recarregar()), {'secretaria'})
+
+    def test_middleware_e_rolerequired(self):
+        client = Client()
+        client.force_login(self.user)
+        client.get(reverse('coordenacao_gestao'))
+
+        # Com os papéis em cache, nem o decorator nem o menu lateral consultam o perfil
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(reverse('coordenacao_gestao'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([q for q in ctx.captured_queries if 'usuarios_profile' in q['sql']])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.tipo = 'aluno'
+            self.profile.save()
+        self.assertRedirects(client.get(reverse('coordenacao_gestao')), reverse('home'), fetch_redirect_response=False)
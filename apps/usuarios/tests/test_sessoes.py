@@ -0,0 +1,59 @@
+"""
+Testes do índice de sessões por usuário (UserSession) e do limite
+de sessões simultâneas aplicado pelo LimitUserSessionsMiddleware.
+"""
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+
+from apps.usuarios.middleware import MAX_SESSOES_POR_USUARIO
+from apps.usuarios.models import UserSession
+
+
+class UserSessionTests(TestCase):
+    """Testes do registro de sessões e do limite por usuário."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='aluno_sessao', password='senha123')
+
+    def _login(self):
+        client = Client()
+        client.login(username='aluno_sessao', password='senha123')
+        return client
+
+    def test_login_registra_sessao(self):
+        """O sinal de login cria a entrada no índice."""
+        client = self._login()
+        self.assertTrue(
+            UserSession.objects.filter(user=self.user, session_key=client.session.session_key).exists()
+        )
+
+    def test_logout_remove_sessao(self):
+        """O logout remove a entrada do índice."""
+        client = self._login()
+        client.post(reverse('logout'))
+        self.assertFalse(UserSession.objects.filter(user=self.user).exists())
+
+    def test_limite_de_sessoes(self):
+        """Ao ultrapassar o limite, as sessões mais antigas são encerradas."""
+        clients = [self._login() for _ in range(MAX_SESSOES_POR_USUARIO + 1)]
+        mais_antiga = clients[0].session.session_key
+
+        clients[-1].get(reverse('home'))
+
+        chaves = set(UserSession.objects.filter(user=self.user).values_list('session_key', flat=True))
+        self.assertEqual(len(chaves), MAX_SESSOES_POR_USUARIO)
+        self.assertNotIn(mais_antiga, chaves)
+        self.assertFalse(Session.objects.filter(session_key=mais_antiga).exists())
+
+    def test_sessao_sem_registro_e_indexada(self):
+        """Sessões criadas antes do índice são registradas na próxima requisição."""
+        client = self._login()
+        UserSession.objects.all().delete()
+
+        client.get(reverse('home'))
+
+        self.assertTrue(
+            UserSession.objects.filter(user=self.user, session_key=client.session.session_key).exists()
+        )
@@ -3,6 +3,7 @@ Django settings for school_manager project.
 """
 
 import os
+import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -70,6 +71,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.usuarios.middleware.PapeisUsuarioMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'apps.usuarios.middleware.LimitUserSessionsMiddleware',
@@ -175,11 +177,90 @@ MESSAGE_STORAGE = 'django.contrib.messages.storage.session.SessionStorage'
 # Cache
 # ==============================
 
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+# Cache compartilhado entre os workers (gunicorn/uwsgi): Redis quando
+# REDIS_URL estiver definida; senão, cache em arquivos no disco local.
+REDIS_URL = os.getenv('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'senai',
+        }
     }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_DIR', os.path.join(tempfile.gettempdir(), 'senai_cache')),
+            'KEY_PREFIX': 'senai',
+        }
+    }
+
+# Os testes usam um cache em memória próprio (ver apps/core/testing.py)
+TEST_RUNNER = 'apps.core.testing.TestRunner'
+
+# Tempo (segundos) que as estatísticas da landing page ficam em cache
+ESTATISTICAS_CACHE_TTL = int(os.getenv('ESTATISTICAS_CACHE_TTL', '300'))
+
+# Tempo (segundos) que os papéis de cada usuário ficam em cache
+# (invalidados ao salvar o Profile ou os cadastros acadêmicos)
+PAPEIS_CACHE_TTL = int(os.getenv('PAPEIS_CACHE_TTL', '3600'))
+
+# ==============================
+# Documentos (PDF)
+# ==============================
+
+# Com a fila ativa, os PDFs são gerados pelo worker
+# (python manage.py processar_fila_documentos) e não durante a requisição
+DOCUMENTOS_FILA_ASSINCRONA = os.getenv('DOCUMENTOS_FILA_ASSINCRONA', 'True') == 'True'
+
+# Envio dos PDFs pelo servidor web em vez do Django:
+# '' (desativado), 'x-sendfile' (Apache) ou 'x-accel-redirect' (Nginx)
+DOCUMENTOS_DOWNLOAD_OFFLOAD = os.getenv('DOCUMENTOS_DOWNLOAD_OFFLOAD', '')
+# Location 'internal' do Nginx que aponta para MEDIA_ROOT (modo x-accel-redirect)
+DOCUMENTOS_ACCEL_PREFIX = os.getenv('DOCUMENTOS_ACCEL_PREFIX', '/protected-media/')
+
+# ==============================
+# Pagamentos (Stripe)
+# ==============================
+
+# Backend que cria as sessões de checkout: a API do Stripe ou, sem rede,
+# 'apps.payments.services.stripe_fake.FakeStripeBackend'
+STRIPE_BACKEND = os.getenv('STRIPE_BACKEND', 'apps.payments.services.stripe_service.StripeAPIBackend')
+# Endereço alternativo da API (ex.: stripe-mock em http://localhost:12111)
+STRIPE_API_BASE = os.getenv('STRIPE_API_BASE', '')
+# Timeouts (segundos) de conexão e de leitura, novas tentativas em falhas de rede
+# e conexões mantidas abertas com o Stripe
+STRIPE_TIMEOUT_CONEXAO = float(os.getenv('STRIPE_TIMEOUT_CONEXAO', '3'))
+STRIPE_TIMEOUT_LEITURA = float(os.getenv('STRIPE_TIMEOUT_LEITURA', '15'))
+STRIPE_MAX_TENTATIVAS = int(os.getenv('STRIPE_MAX_TENTATIVAS', '2'))
+STRIPE_POOL_CONEXOES = int(os.getenv('STRIPE_POOL_CONEXOES', '10'))
+# Latência simulada (ms) pelo backend falso
+STRIPE_FAKE_LATENCIA_MS = float(os.getenv('STRIPE_FAKE_LATENCIA_MS', '0'))
+
+# Com a fila ativa, os webhooks do Stripe só são gravados na requisição e o
+# worker (python manage.py processar_webhooks) atualiza os pagamentos
+PAGAMENTOS_WEBHOOK_ASSINCRONO = os.getenv('PAGAMENTOS_WEBHOOK_ASSINCRONO', 'True') == 'True'
+
+# ==============================
+# Logs
+# ==============================
+
+# Mensagens dos apps do projeto (logging.getLogger(__name__)) vão para o console
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simples': {'format': '{asctime} {levelname} {name}: {message}', 'style': '{'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'simples'},
+    },
+    'loggers': {
+        'apps': {'handlers': ['console'], 'level': os.getenv('LOG_LEVEL', 'INFO')},
+    },
 }
 
 # ==============================
@@ -2,10 +2,7 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // --- RECUPERAÇÃO DE DADOS ---
     const schoolData = window.SCHOOL_DATA || {};
-    let mockAlunos = schoolData.alunos || [];
-    let mockTurmas = schoolData.turmas || [];
-    let mockProfessores = schoolData.professores || [];
-    let mockDisciplinas = schoolData.disciplinas || [];
+    const urls = schoolData.urls || {};
     let cursosList = schoolData.cursos || [];
     
     const csrfInput = document.querySelector('[name=csrfmiddlewaretoken]');
@@ -43,13 +40,72 @@ document.addEventListener('DOMContentLoaded', function() {
         } catch (error) { console.error(error); alert('Erro ao tentar excluir.'); }
     }
 
+    // ================= LISTAGENS PAGINADAS =================
+    // Cada aba busca a primeira página quando é aberta; "Carregar mais" segue
+    // o cursor da API e a busca refaz a listagem no servidor (?q=).
+
+    function criarListagem(url, sufixo, render) {
+        const listagem = { itens: [], proximo: null, carregada: false };
+        const btnMais = document.getElementById('btnMais' + sufixo);
+        const busca = document.getElementById('busca' + sufixo);
+
+        async function buscarPagina(pagina) {
+            try {
+                const response = await fetch(pagina);
+                if (!response.ok) throw new Error(response.status);
+                const data = await response.json();
+                listagem.itens.push(...data.results);
+                listagem.proximo = data.next;
+                btnMais.classList.toggle('d-none', !data.next);
+                render(listagem.itens);
+            } catch (error) { console.error(error); alert('Erro ao carregar a listagem.'); }
+        }
+
+        listagem.carregar = function () {
+            listagem.itens = [];
+            listagem.carregada = true;
+            const params = new URLSearchParams();
+            if (busca && busca.value.trim()) params.set('q', busca.value.trim());
+            return buscarPagina(`${url}?${params}`);
+        };
+        listagem.garantir = function () {
+            if (!listagem.carregada) listagem.carregar();
+        };
+
+        btnMais.addEventListener('click', () => { if (listagem.proximo) buscarPagina(listagem.proximo); });
+        if (busca) {
+            let timer = null;
+            busca.addEventListener('input', () => {
+                clearTimeout(timer);
+                timer = setTimeout(listagem.carregar, 300);
+            });
+        }
+        return listagem;
+    }
+
+    // Todas as turmas (para o select do modal de alunos), buscadas uma vez
+    let todasTurmas = null;
+    async function carregarTodasTurmas() {
+        if (todasTurmas) return todasTurmas;
+        const turmas = [];
+        let pagina = `${urls.turmas}?limite=500`;
+        while (pagina) {
+            const response = await fetch(pagina);
+            const data = await response.json();
+            turmas.push(...data.results);
+            pagina = data.next;
+        }
+        todasTurmas = turmas;
+        return turmas;
+    }
+
     // ================= 1. ALUNOS =================
     const modalAluno = new bootstrap.Modal(document.getElementById('modalAluno'));
     let alunoId = null;
 
-    function renderAlunos() {
+    function renderAlunos(alunos) {
         const tbody = document.getElementById('alunosTableBody');
-        tbody.innerHTML = mockAlunos.map(a => `
+        tbody.innerHTML = alunos.map(a => `
             <tr>
                 <td>${a.nome}</td>
                 <td><span class="badge bg-light text-dark border">${a.matricula}</span></td>
@@ -66,18 +122,21 @@ document.addEventListener('DOMContentLoaded', function() {
         document.querySelectorAll('.btn-del-aluno').forEach(b => b.addEventListener('click', () => genericDelete(`/dashboards/api/gestao/aluno/delete/${b.dataset.id}/`)));
     }
 
-    function openAlunoModal(id = null) {
+    const listaAlunos = criarListagem(urls.alunos, 'Alunos', renderAlunos);
+
+    async function openAlunoModal(id = null) {
         alunoId = id;
         document.getElementById('formAluno').reset();
         document.getElementById('modalAlunoTitle').textContent = id ? 'Editar Aluno' : 'Novo Aluno';
         
         // Popula Select Turmas
         const sel = document.getElementById('inputAlunoTurma');
+        const turmas = await carregarTodasTurmas();
         sel.innerHTML = '<option value="">Selecione...</option>' + 
-            mockTurmas.map(t => `<option value="${t.id}">${t.codigo}</option>`).join('');
+            turmas.map(t => `<option value="${t.id}">${t.codigo}</option>`).join('');
 
         if (id) {
-            const a = mockAlunos.find(x => x.id == id);
+            const a = listaAlunos.itens.find(x => x.id == id);
             document.getElementById('inputAlunoNome').value = a.nome;
             document.getElementById('inputAlunoEmail').value = a.email;
             document.getElementById('inputAlunoMatricula').value = a.matricula;
@@ -103,13 +162,13 @@ document.addEventListener('DOMContentLoaded', function() {
     const modalTurma = new bootstrap.Modal(document.getElementById('modalTurma'));
     let turmaId = null;
 
-    function renderTurmas() {
+    function renderTurmas(turmas) {
         const container = document.getElementById('turmasContainer');
-        if (mockTurmas.length === 0) {
+        if (turmas.length === 0) {
             container.innerHTML = '<div class="text-muted p-3">Nenhuma turma.</div>';
             return;
         }
-        container.innerHTML = mockTurmas.map(t => `
+        container.innerHTML = turmas.map(t => `
             <div class="col-lg-6">
                 <div class="card shadow-sm border-0 h-100 p-3">
                     <div class="d-flex justify-content-between mb-2">
@@ -129,6 +188,8 @@ document.addEventListener('DOMContentLoaded', function() {
         document.querySelectorAll('.btn-del-turma').forEach(b => b.addEventListener('click', () => genericDelete(`/dashboards/api/gestao/turma/delete/${b.dataset.id}/`)));
     }
 
+    const listaTurmas = criarListagem(urls.turmas, 'Turmas', renderTurmas);
+
     function openTurmaModal(id = null) {
         turmaId = id;
         document.getElementById('formTurma').reset();
@@ -139,7 +200,7 @@ document.addEventListener('DOMContentLoaded', function() {
             cursosList.map(c => `<option value="${c.id}">${c.nome_curso}</option>`).join('');
 
         if(id) {
-            const t = mockTurmas.find(x => x.id == id);
+            const t = listaTurmas.itens.find(x => x.id == id);
             document.getElementById('inputTurmaCodigo').value = t.codigo;
             sel.value = t.curso_id;
             document.getElementById('inputTurmaInicio').value = t.data_inicio;
@@ -165,8 +226,8 @@ document.addEventListener('DOMContentLoaded', function() {
     const modalProfessor = new bootstrap.Modal(document.getElementById('modalProfessor'));
     let profId = null;
 
-    function renderProfessores() {
-        document.getElementById('professoresTableBody').innerHTML = mockProfessores.map(p => `
+    function renderProfessores(professores) {
+        document.getElementById('professoresTableBody').innerHTML = professores.map(p => `
             <tr>
                 <td>${p.nome}</td>
                 <td>${p.email}</td>
@@ -182,12 +243,14 @@ document.addEventListener('DOMContentLoaded', function() {
         document.querySelectorAll('.btn-del-prof').forEach(b => b.addEventListener('click', () => genericDelete(`/dashboards/api/gestao/professor/delete/${b.dataset.id}/`)));
     }
 
+    const listaProfessores = criarListagem(urls.professores, 'Professores', renderProfessores);
+
     function openProfModal(id = null) {
         profId = id;
         document.getElementById('formProfessor').reset();
         document.getElementById('modalProfessorTitle').textContent = id ? 'Editar Professor' : 'Novo Professor';
         if(id) {
-            const p = mockProfessores.find(x => x.id == id);
+            const p = listaProfessores.itens.find(x => x.id == id);
             document.getElementById('inputProfNome').value = p.nome;
             document.getElementById('inputProfEmail').value = p.email;
             document.getElementById('inputProfRegistro').value = p.registro;
@@ -209,8 +272,8 @@ document.addEventListener('DOMContentLoaded', function() {
     const modalDisciplina = new bootstrap.Modal(document.getElementById('modalDisciplina'));
     let discId = null;
 
-    function renderDisciplinas() {
-        document.getElementById('disciplinasTableBody').innerHTML = mockDisciplinas.map(d => `
+    function renderDisciplinas(disciplinas) {
+        document.getElementById('disciplinasTableBody').innerHTML = disciplinas.map(d => `
             <tr>
                 <td>${d.codigo}</td>
                 <td>${d.nome}</td>
@@ -225,12 +288,14 @@ document.addEventListener('DOMContentLoaded', function() {
         document.querySelectorAll('.btn-del-disc').forEach(b => b.addEventListener('click', () => genericDelete(`/dashboards/api/gestao/disciplina/delete/${b.dataset.id}/`)));
     }
 
+    const listaDisciplinas = criarListagem(urls.disciplinas, 'Disciplinas', renderDisciplinas);
+
     function openDiscModal(id = null) {
         discId = id;
         document.getElementById('formDisciplina').reset();
         document.getElementById('modalDisciplinaTitle').textContent = id ? 'Editar Disciplina' : 'Nova Disciplina';
         if(id) {
-            const d = mockDisciplinas.find(x => x.id == id);
+            const d = listaDisciplinas.itens.find(x => x.id == id);
             document.getElementById('inputDiscCodigo').value = d.codigo;
             document.getElementById('inputDiscNome').value = d.nome;
             document.getElementById('inputDiscCH').value = d.carga_horaria;
@@ -248,9 +313,18 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     });
 
-    // Inicialização
-    renderAlunos();
-    renderTurmas();
-    renderProfessores();
-    renderDisciplinas();
+    // Inicialização: a aba ativa carrega agora, as demais quando forem abertas
+    const listagensPorAba = {
+        '#v-pills-alunos': listaAlunos,
+        '#v-pills-turmas': listaTurmas,
+        '#v-pills-professores': listaProfessores,
+        '#v-pills-disciplinas': listaDisciplinas
+    };
+    document.querySelectorAll('#v-pills-tab [data-bs-toggle="pill"]').forEach(aba => {
+        aba.addEventListener('shown.bs.tab', () => {
+            const listagem = listagensPorAba[aba.dataset.bsTarget];
+            if (listagem) listagem.garantir();
+        });
+    });
+    listaAlunos.garantir();
 });
\ No newline at end of file
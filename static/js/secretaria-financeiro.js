@@ -0,0 +1,176 @@
+// Arquivo: static/js/secretaria-financeiro.js
+// Controle financeiro: lançamentos paginados sob demanda e autocompletar de alunos
+document.addEventListener('DOMContentLoaded', function () {
+
+    // Seguro também dentro de atributos entre aspas (innerHTML não escapa aspas)
+    function escapar(texto) {
+        const div = document.createElement('div');
+        div.textContent = texto == null ? '' : String(texto);
+        return div.innerHTML.replace(/"/g, '&quot;').replace(/'/g, '&#39;');
+    }
+
+    const BADGES = {
+        pago: '<span class="badge bg-success-subtle text-success rounded-pill px-3">Pago</span>',
+        pendente: '<span class="badge bg-warning-subtle text-warning rounded-pill px-3">Pendente</span>',
+        cancelado: '<span class="badge bg-secondary-subtle text-secondary rounded-pill px-3">Cancelado</span>',
+    };
+
+    // ================= LANÇAMENTOS =================
+    // A primeira página é buscada ao abrir a tela; "Carregar mais" segue o
+    // cursor da API e os filtros refazem a listagem no servidor.
+
+    const tabela = document.getElementById('tableFinanceiro');
+    const tbody = document.getElementById('pagamentosTableBody');
+    const btnMais = document.getElementById('btnMaisPagamentos');
+    const busca = document.getElementById('buscaPagamentos');
+    const filtroStatus = document.getElementById('filtroStatus');
+    const filtroPeriodo = document.getElementById('filtroPeriodo');
+    let itens = [];
+    let proximo = null;
+    let listagem = 0;
+
+    function linha(p) {
+        const acoes = p.status === 'pendente' ? `
+            <li>
+                <a class="dropdown-item" href="/pagamentos/iniciar/${p.id}/">
+                    <i class="fas fa-credit-card me-2 text-primary"></i> Gerar Link Pagamento
+                </a>
+            </li>` : '';
+        return `
+            <tr>
+                <td class="ps-4 fw-bold text-dark">
+                    ${escapar(p.aluno)}
+                    <br>
+                    <span class="small text-muted fw-normal">${escapar(p.descricao)}</span>
+                </td>
+                <td>${escapar(p.curso)}</td>
+                <td>${escapar(p.data)}</td>
+                <td class="fw-bold text-dark">R$ ${Number(p.valor).toFixed(2)}</td>
+                <td>${BADGES[p.status] || `<span class="badge bg-danger-subtle text-danger rounded-pill px-3">${escapar(p.status)}</span>`}</td>
+                <td class="text-end pe-4">
+                    <div class="dropdown">
+                        <button class="btn btn-sm btn-light text-secondary" data-bs-toggle="dropdown">
+                            <i class="fas fa-ellipsis-v"></i>
+                        </button>
+                        <ul class="dropdown-menu dropdown-menu-end border-0 shadow">
+                            ${acoes}
+                            <li><a class="dropdown-item" href="#"><i class="fas fa-eye me-2"></i> Detalhes</a></li>
+                        </ul>
+                    </div>
+                </td>
+            </tr>`;
+    }
+
+    function renderizar() {
+        if (!itens.length) {
+            tbody.innerHTML = `
+                <tr>
+                    <td colspan="6" class="text-center py-5 text-muted">
+                        <i class="fas fa-receipt fa-2x mb-3 text-secondary opacity-50"></i>
+                        <p>Nenhum pagamento encontrado.</p>
+                    </td>
+                </tr>`;
+            return;
+        }
+        tbody.innerHTML = itens.map(linha).join('');
+    }
+
+    async function buscarPagina(pagina) {
+        const atual = listagem;
+        btnMais.disabled = true;
+        try {
+            const response = await fetch(pagina);
+            if (!response.ok) throw new Error(response.status);
+            const data = await response.json();
+            // Descarta páginas de uma listagem já refeita com outros filtros
+            if (atual !== listagem) return;
+            itens.push(...data.results);
+            proximo = data.next;
+            btnMais.classList.toggle('d-none', !data.next);
+            renderizar();
+        } catch (error) {
+            if (atual !== listagem) return;
+            console.error(error); alert('Erro ao carregar os lançamentos.');
+        } finally {
+            if (atual === listagem) btnMais.disabled = false;
+        }
+    }
+
+    function carregar() {
+        listagem++;
+        itens = [];
+        proximo = null;
+        const params = new URLSearchParams();
+        if (busca.value.trim()) params.set('q', busca.value.trim());
+        if (filtroStatus.value) params.set('status', filtroStatus.value);
+        if (filtroPeriodo.value) params.set('periodo', filtroPeriodo.value);
+        return buscarPagina(`${tabela.dataset.url}?${params}`);
+    }
+
+    btnMais.addEventListener('click', () => {
+        // Um clique por página: ignora cliques enquanto a página anterior carrega
+        if (proximo && !btnMais.disabled) buscarPagina(proximo);
+    });
+    let timerBusca = null;
+    busca.addEventListener('input', () => {
+        clearTimeout(timerBusca);
+        timerBusca = setTimeout(carregar, 300);
+    });
+    filtroStatus.addEventListener('change', carregar);
+    filtroPeriodo.addEventListener('change', carregar);
+    carregar();
+
+    // ================= AUTOCOMPLETAR DE ALUNOS =================
+    // Sugestões do índice de busca de alunos enquanto se digita; o id do
+    // aluno escolhido vai para o campo oculto enviado ao criar o lançamento.
+
+    const buscaAluno = document.getElementById('buscaAluno');
+    const alunoEscolhido = document.getElementById('selectAluno');
+    const sugestoes = document.getElementById('sugestoesAluno');
+    let timerAluno = null;
+    let consulta = 0;
+
+    function fecharSugestoes() {
+        sugestoes.classList.add('d-none');
+        sugestoes.innerHTML = '';
+    }
+
+    async function sugerir(q) {
+        const atual = ++consulta;
+        try {
+            const response = await fetch(`${buscaAluno.dataset.url}?${new URLSearchParams({ q, limite: 8 })}`);
+            const data = await response.json();
+            // Descarta respostas de buscas já superadas pela digitação
+            if (atual !== consulta) return;
+            if (!data.results.length) {
+                sugestoes.innerHTML = '<div class="list-group-item small text-muted">Nenhum aluno encontrado.</div>';
+            } else {
+                sugestoes.innerHTML = data.results.map(a => `
+                    <button type="button" class="list-group-item list-group-item-action small" data-id="${a.id}" data-nome="${escapar(a.nome)} (${escapar(a.matricula)})">
+                        <strong>${escapar(a.nome)}</strong> <span class="text-muted">${escapar(a.matricula)}</span>
+                    </button>`).join('');
+            }
+            sugestoes.classList.remove('d-none');
+        } catch (error) { console.error(error); }
+    }
+
+    buscaAluno.addEventListener('input', () => {
+        alunoEscolhido.value = '';
+        clearTimeout(timerAluno);
+        const q = buscaAluno.value.trim();
+        if (q.length < 2) { fecharSugestoes(); return; }
+        timerAluno = setTimeout(() => sugerir(q), 250);
+    });
+
+    sugestoes.addEventListener('click', (e) => {
+        const item = e.target.closest('[data-id]');
+        if (!item) return;
+        alunoEscolhido.value = item.dataset.id;
+        buscaAluno.value = item.dataset.nome;
+        fecharSugestoes();
+    });
+
+    document.addEventListener('click', (e) => {
+        if (!sugestoes.contains(e.target) && e.target !== buscaAluno) fecharSugestoes();
+    });
+});
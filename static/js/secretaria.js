@@ -212,21 +212,19 @@ document.addEventListener('DOMContentLoaded', function () {
         if (elAtivos) elAtivos.innerText = ativos;
     }
 
-    // Filtro simples cliente
+    // Filtro: refaz a listagem no servidor (a tabela só tem as páginas já carregadas)
     const btnFiltrar = document.getElementById('btnFiltrar');
     if (btnFiltrar) {
         btnFiltrar.addEventListener('click', () => {
-            const nome = document.getElementById('f_nome').value.toLowerCase();
-            const matricula = document.getElementById('f_matricula').value.toLowerCase();
-            const turma = document.getElementById('f_turma').value.toLowerCase();
-            const status = document.getElementById('f_status').value.toLowerCase();
-            document.querySelectorAll('#tableAlunos tbody tr').forEach(tr => {
-                const matchesNome = !nome || (tr.dataset.nome && tr.dataset.nome.toLowerCase().includes(nome));
-                const matchesMat = !matricula || (tr.dataset.matricula && tr.dataset.matricula.toLowerCase().includes(matricula));
-                const matchesTurma = !turma || (tr.dataset.turma && tr.dataset.turma.toLowerCase().includes(turma));
-                const matchesStatus = !status || (tr.dataset.status && tr.dataset.status.toLowerCase() === status);
-                tr.style.display = (matchesNome && matchesMat && matchesTurma && matchesStatus) ? '' : 'none';
-            });
+            const params = new URLSearchParams();
+            const busca = [document.getElementById('f_nome').value, document.getElementById('f_matricula').value]
+                .map(v => v.trim()).filter(Boolean).join(' ');
+            const turma = document.getElementById('f_turma').value.trim();
+            const status = document.getElementById('f_status').value;
+            if (busca) params.set('q', busca);
+            if (/^\d+$/.test(turma)) params.set('turma', turma);
+            if (status) params.set('status', status);
+            carregarAlunos(params);
         });
     }
 
@@ -247,41 +245,78 @@ document.addEventListener('DOMContentLoaded', function () {
     const btnEmitir = document.getElementById('btnEmitirDoc');
     if (btnEmitir) btnEmitir.addEventListener('click', () => alert('Emitir novo documento (simulado).'));
 
-    // Carregar lista inicial de alunos via API e inicializa totais
-    (async function loadAlunos() {
+    // Lista de alunos via API, uma página por vez: "Carregar mais" segue o
+    // cursor da API em vez de baixar todos os alunos ao abrir a tela
+    const tbodyAlunos = document.querySelector('#tableAlunos tbody');
+    let btnMaisAlunos = document.getElementById('btnMaisAlunos');
+    let proximaPaginaAlunos = null;
+    let listagemAlunos = 0;
+
+    if (tbodyAlunos && !btnMaisAlunos) {
+        btnMaisAlunos = document.createElement('button');
+        btnMaisAlunos.id = 'btnMaisAlunos';
+        btnMaisAlunos.className = 'btn btn-sm btn-outline-secondary d-none mt-2';
+        btnMaisAlunos.textContent = 'Carregar mais';
+        document.getElementById('tableAlunos').after(btnMaisAlunos);
+    }
+
+    function linhaAluno(a) {
+        const tr = document.createElement('tr');
+        tr.setAttribute('data-id', a.id);
+        tr.setAttribute('data-nome', a.nome || '');
+        tr.setAttribute('data-matricula', a.matricula || '');
+        tr.setAttribute('data-turma', a.curso || '');
+        tr.setAttribute('data-status', a.status || '');
+        const badgeClass = a.status === 'ativa' ? '<span class="badge bg-success">Ativa</span>' : (a.status === 'pendente' ? '<span class="badge bg-warning text-dark">Pendente</span>' : '<span class="badge bg-secondary">'+(a.status||'')+'</span>');
+        tr.innerHTML = `
+            <td>${a.nome}</td>
+            <td>${a.matricula}</td>
+            <td>${a.curso}</td>
+            <td>${badgeClass}</td>
+            <td>—</td>
+            <td class="text-end">
+                <button class="btn btn-sm btn-primary btn-editar me-1">Editar</button>
+                <button class="btn btn-sm btn-outline-primary btn-detalhe me-1">Detalhar</button>
+                <button class="btn btn-sm btn-danger btn-excluir">Excluir</button>
+            </td>
+        `;
+        return tr;
+    }
+
+    async function carregarPaginaAlunos(url, limpar) {
+        if (limpar) listagemAlunos++;
+        const atual = listagemAlunos;
+        btnMaisAlunos.disabled = true;
         try {
-            const res = await fetch('/academico/api/alunos/');
+            const res = await fetch(url);
+            // Descarta páginas de uma listagem já refeita pelo filtro
+            if (atual !== listagemAlunos) return;
             if (!res.ok) return updateTotals();
             const data = await res.json();
-            const tbody = document.querySelector('#tableAlunos tbody');
-            if (!tbody) return;
-            // Limpar linhas de exemplo (preservar se desejar)
-            tbody.innerHTML = '';
-            data.results.forEach(a => {
-                const tr = document.createElement('tr');
-                tr.setAttribute('data-nome', a.nome || '');
-                tr.setAttribute('data-matricula', a.matricula || '');
-                tr.setAttribute('data-turma', a.curso || '');
-                tr.setAttribute('data-status', a.status || '');
-                const badgeClass = a.status === 'ativa' ? '<span class="badge bg-success">Ativa</span>' : (a.status === 'pendente' ? '<span class="badge bg-warning text-dark">Pendente</span>' : '<span class="badge bg-secondary">'+(a.status||'')+'</span>');
-                tr.innerHTML = `
-                    <td>${a.nome}</td>
-                    <td>${a.matricula}</td>
-                    <td>${a.curso}</td>
-                    <td>${badgeClass}</td>
-                    <td>—</td>
-                    <td class="text-end">
-                        <button class="btn btn-sm btn-primary btn-editar me-1">Editar</button>
-                        <button class="btn btn-sm btn-outline-primary btn-detalhe me-1">Detalhar</button>
-                        <button class="btn btn-sm btn-danger btn-excluir">Excluir</button>
-                    </td>
-                `;
-                tbody.appendChild(tr);
-            });
+            if (atual !== listagemAlunos) return;
+            if (limpar) tbodyAlunos.innerHTML = '';
+            data.results.forEach(a => tbodyAlunos.appendChild(linhaAluno(a)));
+            proximaPaginaAlunos = data.next;
+            btnMaisAlunos.classList.toggle('d-none', !data.next);
             updateTotals();
         } catch (err) {
             console.warn('Não foi possível carregar alunos via API', err);
             updateTotals();
+        } finally {
+            if (atual === listagemAlunos) btnMaisAlunos.disabled = false;
         }
-    })();
+    }
+
+    function carregarAlunos(params = new URLSearchParams()) {
+        if (!tbodyAlunos) return;
+        params.set('limite', 50);
+        carregarPaginaAlunos(`/academico/api/alunos/?${params}`, true);
+    }
+
+    if (tbodyAlunos) {
+        btnMaisAlunos.addEventListener('click', () => {
+            if (proximaPaginaAlunos && !btnMaisAlunos.disabled) carregarPaginaAlunos(proximaPaginaAlunos, false);
+        });
+        carregarAlunos();
+    }
 });
\ No newline at end of file